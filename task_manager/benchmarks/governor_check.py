@@ -0,0 +1,92 @@
+# benchmarks/governor_check.py
+#
+# Проверка регулятора собственной нагрузки с настройками по умолчанию:
+# при обычной нагрузке (реальные процессы системы, источник psutil,
+# бюджет DEFAULT_CPU_BUDGET_PERCENT) ступень ограничения должна оставаться
+# нулевой. Основной поток тем временем занят имитацией отрисовки GUI -
+# её время регулятор учитывать не должен. Запуск из каталога task_manager:
+#
+#     python -m benchmarks.governor_check --seconds 20
+#
+# Ненулевая ступень хотя бы в одном снимке - код выхода 1.
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from typing import List
+
+from controllers.overhead_governor import DEFAULT_CPU_BUDGET_PERCENT
+from controllers.process_controller import ProcessController
+from controllers.snapshot_collector import SnapshotCollector
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Период имитации отрисовки, с
+RENDER_PERIOD = 0.1
+
+
+def collect(collector: SnapshotCollector, seconds: float, samples: List, done: threading.Event):
+    """Сбор по расписанию, как в фоновом потоке GUI; собирает замеры нагрузки из снимков"""
+    deadline = time.monotonic() + seconds
+    try:
+        while time.monotonic() < deadline:
+            snapshot = collector.collect_due()
+            if snapshot is not None:
+                samples.append(snapshot.overhead)
+            time.sleep(collector.scheduler.time_until_next())
+    finally:
+        done.set()
+
+
+def simulate_rendering(load_percent: float, stop: threading.Event):
+    """Занимает текущий поток на load_percent процентов ядра"""
+    busy = RENDER_PERIOD * load_percent / 100
+    while not stop.is_set():
+        started = time.thread_time()
+        while time.thread_time() - started < busy:
+            pass
+        stop.wait(RENDER_PERIOD - busy)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Ступень регулятора нагрузки при настройках по умолчанию")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Длительность сбора, с")
+    parser.add_argument("--process-source", default="psutil", help="Источник процессов")
+    parser.add_argument("--gui-load", type=float, default=30.0,
+                        help="Имитируемая загрузка потока GUI, %% одного ядра")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    logger.logger.setLevel(logging.INFO)
+
+    collector = SnapshotCollector(process_controller=ProcessController(args.process_source))
+    samples = []
+    done = threading.Event()
+    worker = threading.Thread(target=collect, args=(collector, args.seconds, samples, done), name="CollectorThread")
+    worker.start()
+    # Основной поток играет роль потока GUI
+    simulate_rendering(args.gui_load, done)
+    worker.join()
+
+    if not samples:
+        print("ПРОВАЛ: сборщик не выдал ни одного снимка")
+        return 1
+    process_cpu = sum(sample.cpu_percent for sample in samples) / len(samples)
+    collector_cpu = sum(sample.collector_cpu_percent for sample in samples) / len(samples)
+    max_level = max(sample.level for sample in samples)
+    print(f"Снимков: {len(samples)}, процессов: {len(collector.process_controller.get_processes())}")
+    print(f"ЦП приложения {process_cpu:.2f}%, потока сборщика {collector_cpu:.2f}% "
+          f"(бюджет {DEFAULT_CPU_BUDGET_PERCENT:.1f}%), наибольшая ступень {max_level}")
+    if max_level:
+        print(f"ПРОВАЛ: регулятор поднял ступень до {max_level} при нагрузке по умолчанию")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
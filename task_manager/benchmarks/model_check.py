@@ -0,0 +1,320 @@
+# benchmarks/model_check.py
+#
+# Проверка моделей процессов под QAbstractItemModelTester: дерево процессов
+# (ProcessTreeModel) и таблица с прокси (ProcessTableModel,
+# ProcessSortFilterProxyModel). Запуск из каталога task_manager:
+#
+#     QT_QPA_PLATFORM=offscreen python -m benchmarks.model_check --ticks 50 --seed 1
+#
+# Сначала прогоняются заданные сценарии (переиспользование PID, перенос
+# сирот, циклы ppid), затем случайная смена процессов синтетического
+# источника, поверх которой часть процессов получает случайного родителя
+# или новое create_time. После каждого такта, кроме проверок тестера,
+# сверяются структура модели со снимком, суммы поддеревьев и порядок
+# сортировки. Отдельно проверяется поиск, заданный до первого снимка.
+# Любое нарушение - код выхода 1.
+#
+# Тестер обходит всю модель на каждом сигнале структуры, поэтому процессов
+# немного: важны не размеры, а число переносов, замен PID и циклов за такт.
+
+import argparse
+import logging
+import sys
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+from PyQt5.QtCore import Qt, qInstallMessageHandler
+from PyQt5.QtTest import QAbstractItemModelTester
+from PyQt5.QtWidgets import QApplication
+
+from controllers.process_controller import ProcessController
+from controllers.process_sources import SyntheticProcessSource
+from models.process_model import (ProcessTableModel, ProcessSortFilterProxyModel, COL_CPU, COL_PID,
+                                  SORT_ROLE, CREATE_TIME_ROLE)
+from models.process_records import ProcessRecords
+from models.process_tree_model import ProcessTreeModel, TREE_COL_TREE_CPU, TREE_SORT_ATTRS
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Допустимая погрешность сумм поддеревьев (порядок сложения float разный)
+TOTAL_TOLERANCE = 1e-6
+# Запрос поиска и часть имени, по которой считается ожидаемое число строк
+SEARCH_QUERY, SEARCH_NAME = 'name:python', 'python'
+
+
+class _Static(NamedTuple):
+    """Неизменные атрибуты процесса для заданных сценариев"""
+    name: str
+    user: str = 'user'
+    is_gui: bool = False
+
+
+def make_records(processes: Sequence[tuple]) -> ProcessRecords:
+    """Снимок из кортежей (pid, create_time, ppid) или (pid, create_time, ppid, cpu)"""
+    return ProcessRecords(
+        pids=[p[0] for p in processes],
+        create_times=[p[1] for p in processes],
+        statuses=['sleeping'] * len(processes),
+        cpu=[p[3] if len(p) > 3 else 1.0 for p in processes],
+        memory=[0.5] * len(processes),
+        ppids=[p[2] for p in processes],
+        static=[_Static(f"proc-{p[0]}-{p[1]:g}") for p in processes],
+    )
+
+
+# Заданные сценарии: последовательности снимков
+SCENARIOS = {
+    # PID 10 занимает новый процесс, потомки с ppid 10 переходят к новому узлу
+    'pid_reuse': [
+        [(10, 1.0, 1), (11, 1.0, 10), (12, 1.0, 10), (13, 1.0, 11)],
+        [(10, 2.0, 1), (11, 1.0, 10), (12, 1.0, 10), (13, 1.0, 11)],
+        [(10, 3.0, 1), (11, 1.0, 10), (12, 1.0, 1), (13, 1.0, 11)],
+    ],
+    # Сироты уходят в корень, узел переносится к родителю, созданному позже него
+    'reparent': [
+        [(10, 1.0, 1), (11, 1.0, 10), (12, 1.0, 11), (20, 1.0, 1)],
+        [(11, 1.0, 10), (12, 1.0, 11), (20, 1.0, 1)],
+        [(11, 1.0, 30), (12, 1.0, 20), (20, 1.0, 1), (30, 2.0, 20)],
+        [(11, 1.0, 12), (12, 1.0, 30), (20, 1.0, 30), (30, 2.0, 1)],
+    ],
+    # Циклы ppid среди новых и среди существующих процессов
+    'cycles': [
+        [(20, 1.0, 21), (21, 1.0, 20), (22, 1.0, 22)],
+        [(20, 1.0, 21), (21, 1.0, 20), (22, 1.0, 22), (30, 1.0, 1), (31, 1.0, 30)],
+        [(20, 1.0, 1), (21, 1.0, 20), (22, 1.0, 21), (30, 1.0, 31), (31, 1.0, 30)],
+        [(20, 1.0, 22), (21, 1.0, 20), (22, 1.0, 21), (30, 1.0, 1), (31, 1.0, 30)],
+    ],
+}
+
+
+class MessageCollector:
+    """Собирает сообщения QAbstractItemModelTester в режиме Warning"""
+
+    def __init__(self):
+        self.failures: List[str] = []
+
+    def __call__(self, mode, context, message):
+        if context.category == 'qt.modeltest' or message.startswith('FAIL'):
+            self.failures.append(message)
+
+
+def check_tree(model: ProcessTreeModel, records: ProcessRecords) -> List[str]:
+    """Сверяет дерево со снимком: состав, родители, отсутствие циклов, суммы, сортировка"""
+    errors = []
+    expected = dict(zip(zip(records.pids, records.create_times), records.ppids))
+    alive = set(records.pids)
+    parent_of = dict(zip(records.pids, records.ppids))
+    root = model._root
+
+    seen = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for row, child in enumerate(node.children):
+            if child.parent is not node or child.row != row:
+                errors.append(f"PID {child.pid}: неверные parent/row ({child.row} вместо {row})")
+            if child.pid in seen:
+                errors.append(f"PID {child.pid}: узел встречается в дереве дважды")
+            seen[child.pid] = child
+            stack.append(child)
+    if len(seen) != len(model._nodes) or any(model._nodes.get(pid) is not node for pid, node in seen.items()):
+        errors.append("индекс pid -> узел не совпадает с деревом")
+
+    actual = {(node.pid, node.create_time) for node in seen.values()}
+    if actual != set(expected):
+        errors.append(f"состав дерева: лишние {sorted(actual - set(expected))[:5]}, "
+                      f"недостающие {sorted(set(expected) - actual)[:5]}")
+
+    for node in seen.values():
+        ppid = parent_of.get(node.pid)
+        if ppid is None:
+            continue
+        if node.parent is not root:
+            if node.parent.pid != ppid:
+                errors.append(f"PID {node.pid}: родитель {node.parent.pid}, в снимке {ppid}")
+        elif ppid in alive and ppid != node.pid and not _on_cycle(node.pid, parent_of):
+            errors.append(f"PID {node.pid}: в корне, хотя родитель {ppid} жив и цикла нет")
+
+        depth, ancestor = 0, node.parent
+        while ancestor is not root and ancestor is not None and depth <= len(seen):
+            ancestor, depth = ancestor.parent, depth + 1
+        if ancestor is not root:
+            errors.append(f"PID {node.pid}: цепочка родителей не доходит до корня")
+
+        children_cpu = sum(child.total_cpu for child in node.children)
+        children_memory = sum(child.total_memory for child in node.children)
+        if (abs(node.total_cpu - node.cpu - children_cpu) > TOTAL_TOLERANCE
+                or abs(node.total_memory - node.memory - children_memory) > TOTAL_TOLERANCE):
+            errors.append(f"PID {node.pid}: суммы поддерева не совпадают с потомками")
+
+    if model._sort_column >= 0:
+        attr = TREE_SORT_ATTRS[model._sort_column]
+        descending = model._sort_order == Qt.DescendingOrder
+        for parent in [root] + list(seen.values()):
+            keys = [getattr(child, attr) for child in parent.children]
+            if keys != sorted(keys, reverse=descending):
+                errors.append(f"потомки PID {parent.pid} не отсортированы по {attr}")
+    return errors
+
+
+def _on_cycle(pid: int, parent_of) -> bool:
+    """Приводит ли цепочка ppid от процесса обратно к нему самому"""
+    visited = set()
+    current = parent_of.get(pid)
+    while current is not None and current not in visited:
+        if current == pid:
+            return True
+        visited.add(current)
+        current = parent_of.get(current)
+    return False
+
+
+def check_table(model: ProcessTableModel, proxy: ProcessSortFilterProxyModel,
+                records: ProcessRecords) -> List[str]:
+    """Сверяет таблицу со снимком: состав по (pid, create_time), индекс строк и порядок сортировки"""
+    errors = []
+    rows = [(model.index(row, COL_PID).data(SORT_ROLE), model.index(row, COL_PID).data(CREATE_TIME_ROLE))
+            for row in range(model.rowCount())]
+    if set(rows) != set(zip(records.pids, records.create_times)) or len(rows) != len(records):
+        errors.append("состав таблицы не совпадает со снимком")
+    if any(model._row_by_pid.get(pid) != row for row, (pid, _) in enumerate(rows)):
+        errors.append("индекс pid -> строка не совпадает с таблицей")
+    if model.sort_column >= 0:
+        keys = [proxy.index(row, model.sort_column).data(SORT_ROLE) for row in range(proxy.rowCount())]
+        if keys != sorted(keys, reverse=model.sort_order == Qt.DescendingOrder):
+            errors.append("строки прокси не отсортированы")
+    return errors
+
+
+def perturb(records: ProcessRecords, rng: np.random.Generator, share: float) -> ProcessRecords:
+    """
+    Доля share процессов получает случайного живого родителя (в том числе
+    образуя циклы), столько же - новое create_time (переиспользование PID)
+    """
+    count = len(records)
+    ppids = list(records.ppids)
+    create_times = list(records.create_times)
+    changes = max(1, int(count * share))
+    for i, parent in zip(rng.integers(count, size=changes), rng.integers(count, size=changes)):
+        ppids[i] = records.pids[parent]
+    for i in rng.integers(count, size=changes):
+        create_times[i] += 1000.0
+    return ProcessRecords(records.pids, create_times, records.statuses, records.cpu,
+                          records.memory, ppids, records.static)
+
+
+class ModelCheck:
+    """Дерево и таблица под тестером, применение снимков и сбор нарушений"""
+
+    def __init__(self, collector: MessageCollector):
+        self.collector = collector
+        self.tree = ProcessTreeModel()
+        self.tree.sort(TREE_COL_TREE_CPU, Qt.DescendingOrder)
+        self.table = ProcessTableModel()
+        self.proxy = ProcessSortFilterProxyModel()
+        self.proxy.setSourceModel(self.table)
+        self.proxy.sort(COL_CPU, Qt.DescendingOrder)
+        mode = QAbstractItemModelTester.FailureReportingMode.Warning
+        self._testers = [QAbstractItemModelTester(model, mode) for model in (self.tree, self.table, self.proxy)]
+
+    def apply(self, label: str, records: ProcessRecords) -> List[str]:
+        self.tree.update_data(records)
+        with self.proxy.update_transaction():
+            self.table.update_data(records)
+        errors = [f"тестер: {message}" for message in self.collector.failures]
+        self.collector.failures.clear()
+        errors += [f"дерево: {error}" for error in check_tree(self.tree, records)]
+        errors += [f"таблица: {error}" for error in check_table(self.table, self.proxy, records)]
+        return [f"{label}: {error}" for error in errors]
+
+
+def run_scenarios(collector: MessageCollector) -> List[str]:
+    errors = []
+    for name, snapshots in SCENARIOS.items():
+        check = ModelCheck(collector)
+        for tick, processes in enumerate(snapshots):
+            errors += check.apply(f"{name}[{tick}]", make_records(processes))
+    return errors
+
+
+def run_churn(collector: MessageCollector, ticks: int, processes: int, churn: float,
+              perturb_share: float, seed: int) -> List[str]:
+    rate = processes * churn
+    controller = ProcessController(SyntheticProcessSource(processes, spawn_rate=rate, exit_rate=rate, seed=seed))
+    rng = np.random.default_rng(seed)
+    check = ModelCheck(collector)
+    errors = []
+    for tick in range(ticks):
+        records = controller.get_processes()
+        if perturb_share > 0 and tick % 2:
+            records = perturb(records, rng, perturb_share)
+        errors += check.apply(f"такт {tick}", records)
+    return errors
+
+
+def run_search_check(collector: MessageCollector, processes: int, seed: int) -> List[str]:
+    """
+    Запрос, заданный до того, как у прокси появился снимок для поиска: и в
+    пустой таблице, и поверх уже показанных строк. После следующего такта
+    прокси должен показывать только совпадения.
+    """
+    controller = ProcessController(SyntheticProcessSource(processes, seed=seed))
+    errors = []
+    for rows_shown in (False, True):
+        check = ModelCheck(collector)
+        records = controller.get_processes()
+        if rows_shown:
+            with check.proxy.update_transaction():
+                check.table.update_data(records)
+        check.proxy.set_search_query(SEARCH_QUERY)
+        # Представление запрашивает строки сразу после смены запроса
+        check.proxy.rowCount()
+        for tick in range(2):
+            check.proxy.update_search(records)
+            label = f"поиск до снимка ({'строки показаны' if rows_shown else 'пустая таблица'}), такт {tick}"
+            errors += check.apply(label, records)
+            expected = sum(SEARCH_NAME in static.name.lower() for static in records.static)
+            if check.proxy.rowCount() != expected:
+                errors.append(f"{label}: прокси показывает {check.proxy.rowCount()} строк, совпадений {expected}")
+            records = controller.get_processes()
+    return errors
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Проверка моделей процессов под QAbstractItemModelTester")
+    parser.add_argument("--ticks", type=int, default=50, help="Тактов случайной смены процессов")
+    parser.add_argument("--processes", type=int, default=60, help="Число синтетических процессов")
+    parser.add_argument("--churn", type=float, default=0.05, help="Доля процессов, сменяющихся за такт")
+    parser.add_argument("--perturb", type=float, default=0.05,
+                        help="Доля процессов со случайным родителем и новым create_time (каждый второй такт)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-errors", type=int, default=20, help="Сколько нарушений выводить")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    logger.logger.setLevel(logging.INFO)
+    collector = MessageCollector()
+    qInstallMessageHandler(collector)
+
+    errors = run_scenarios(collector)
+    print(f"Сценарии ({', '.join(SCENARIOS)}): {'нарушений нет' if not errors else f'нарушений: {len(errors)}'}")
+    churn_errors = run_churn(collector, args.ticks, args.processes, args.churn, args.perturb, args.seed)
+    print(f"Случайная смена ({args.ticks} тактов, {args.processes} процессов): "
+          f"{'нарушений нет' if not churn_errors else f'нарушений: {len(churn_errors)}'}")
+    errors += churn_errors
+    search_errors = run_search_check(collector, args.processes, args.seed)
+    print(f"Поиск до первого снимка: {'нарушений нет' if not search_errors else f'нарушений: {len(search_errors)}'}")
+    errors += search_errors
+
+    qInstallMessageHandler(None)
+    for error in errors[:args.max_errors]:
+        print(f"ПРОВАЛ: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+# benchmarks/run_benchmarks.py
+#
+# Замеры горячих путей сбора и обновления моделей на синтетических данных.
+# Запуск из каталога task_manager:
+#
+#     QT_QPA_PLATFORM=offscreen python -m benchmarks.run_benchmarks
+#     QT_QPA_PLATFORM=offscreen python -m benchmarks.run_benchmarks --save-baseline
+#
+# Результаты сравниваются с сохранённым базовым JSON; замер, медиана которого
+# выросла больше порога, считается регрессией (код выхода 1).
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from controllers.process_controller import ProcessController
+from controllers.process_sources import SyntheticProcessSource
+from models.metric_history import MetricHistory
+from models.process_model import ProcessTableModel, ProcessSortFilterProxyModel, COL_CPU
+from models.process_search import ProcessSearchIndex
+from models.process_tree_model import ProcessTreeModel, TREE_COL_TREE_CPU
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+DEFAULT_CORES = (8, 64, 256)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Допустимый рост медианы относительно базовой и порог шума в миллисекундах
+DEFAULT_THRESHOLD = 0.25
+NOISE_FLOOR_MS = 0.5
+
+
+def measure(func: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict[str, float]:
+    """
+    Выполняет func repeat раз (setup перед каждым запуском не замеряется).
+    Ещё один запуск под tracemalloc даёт пик выделенной за вызов памяти.
+    """
+    durations = []
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+        started = time.perf_counter()
+        func(*args)
+        durations.append((time.perf_counter() - started) * 1000)
+
+    args = setup() if setup is not None else ()
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'median_ms': statistics.median(durations), 'min_ms': min(durations), 'peak_kb': peak / 1024}
+
+
+def synthetic_controller(count: int) -> ProcessController:
+    # Смена 1% процессов за такт, фиксированный seed для воспроизводимости
+    churn = count * 0.005
+    return ProcessController(SyntheticProcessSource(count, spawn_rate=churn, exit_rate=churn, seed=0))
+
+
+def bench_get_processes(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessController.get_processes: разбор и классификация сканирования"""
+    controller = synthetic_controller(count)
+    return measure(controller.get_processes, repeat)
+
+
+def bench_update_data(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessTableModel.update_data: установившийся такт со сменой 1% процессов"""
+    controller = synthetic_controller(count)
+    model = ProcessTableModel()
+    model.update_data(controller.get_processes())
+    return measure(model.update_data, repeat, setup=lambda: (controller.get_processes(),))
+
+
+def bench_tree_update(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessTreeModel.update_data с сортировкой по ЦП поддеревьев: такт со сменой 1% процессов"""
+    controller = synthetic_controller(count)
+    model = ProcessTreeModel()
+    model.sort(TREE_COL_TREE_CPU, Qt.DescendingOrder)
+    model.update_data(controller.get_processes())
+    return measure(model.update_data, repeat, setup=lambda: (controller.get_processes(),))
+
+
+def bench_proxy_sort(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessSortFilterProxyModel.sort по столбцу ЦП (argsort в исходной модели)"""
+    controller = synthetic_controller(count)
+    model = ProcessTableModel()
+    model.update_data(controller.get_processes())
+    proxy = ProcessSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    orders = [Qt.AscendingOrder, Qt.DescendingOrder]
+
+    def sort_once(order):
+        proxy.sort(COL_CPU, order)
+
+    # Чередуем порядок, чтобы каждый запуск действительно переставлял строки
+    return measure(sort_once, repeat, setup=lambda: (orders.reverse() or orders[0],))
+
+
+# Запросы поиска: подстрока, короткая подстрока, префикс слова и условия по полям
+SEARCH_QUERIES = ('chrome', 'py', 'syst*', 'user:root cmd:--type', 'name:bash user:ro')
+
+
+def bench_search_index_update(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessSearchIndex.update: такт со сменой 1% процессов"""
+    controller = synthetic_controller(count)
+    index = ProcessSearchIndex()
+    index.update(controller.get_processes())
+    return measure(index.update, repeat, setup=lambda: (controller.get_processes(),))
+
+
+def bench_search_query(count: int, repeat: int) -> Dict[str, float]:
+    """ProcessSearchIndex.search: один запрос из SEARCH_QUERIES по построенному индексу"""
+    controller = synthetic_controller(count)
+    index = ProcessSearchIndex()
+    index.update(controller.get_processes())
+    queries = list(SEARCH_QUERIES)
+
+    def next_query():
+        queries.append(queries.pop(0))
+        return (queries[0],)
+
+    return measure(index.search, repeat, setup=next_query)
+
+
+class _Hardware:
+    """Минимальная инвентаризация для вкладки производительности с заданным числом ядер"""
+
+    def __init__(self, cores: int):
+        self.cpu = {'name': 'Synthetic CPU', 'base_speed': 0.0,
+                    'cores': cores, 'logical': cores, 'sockets': 1}
+
+
+def filled_history(cores: int, seconds: int) -> MetricHistory:
+    history = MetricHistory()
+    now = time.monotonic()
+    for i in range(seconds):
+        phase = i % 60
+        values = {f'cpu_core_{core}': (core * 7 + phase) % 100 for core in range(cores)}
+        values.update(memory=50.0 + phase / 10, disk_read=phase, disk_write=60 - phase,
+                      net_sent=phase / 20, net_received=phase / 10)
+        history.record(values, now - seconds + i)
+    return history
+
+
+def bench_update_chart_series(cores: int, repeat: int) -> Dict[str, float]:
+    """update_chart_series для всех серий вкладки за 15 минут истории (с LTTB)"""
+    from views.performance_tab import PerformanceTab, HISTORY_VIEWS
+
+    history = filled_history(cores, MetricHistory.RAW_CAPACITY)
+    tab = PerformanceTab(_Hardware(cores), history)
+    tab.history_view = HISTORY_VIEWS[1]
+    result = measure(tab.update_charts, repeat)
+    tab.deleteLater()
+    return result
+
+
+def run_all(sizes, cores, repeat) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for count in sizes:
+        results[f'get_processes[n={count}]'] = bench_get_processes(count, repeat)
+        results[f'update_data[n={count}]'] = bench_update_data(count, repeat)
+        results[f'proxy_sort[n={count}]'] = bench_proxy_sort(count, repeat)
+        results[f'tree_update[n={count}]'] = bench_tree_update(count, repeat)
+        results[f'search_index_update[n={count}]'] = bench_search_index_update(count, repeat)
+        results[f'search_query[n={count}]'] = bench_search_query(count, repeat)
+    for core_count in cores:
+        results[f'update_chart_series[cores={core_count}]'] = bench_update_chart_series(core_count, repeat)
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Возвращает описания регрессий относительно базовых результатов"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        current, previous = result['median_ms'], base['median_ms']
+        if current > previous * (1 + threshold) and current - previous > NOISE_FLOOR_MS:
+            regressions.append(f"{name}: {previous:.2f} -> {current:.2f} мс "
+                               f"(+{(current / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Замеры горячих путей диспетчера задач")
+    parser.add_argument("--sizes", type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Число синтетических процессов")
+    parser.add_argument("--cores", type=int, nargs='+', default=DEFAULT_CORES,
+                        help="Число ядер для графиков")
+    parser.add_argument("--repeat", type=int, default=7, help="Повторов каждого замера")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Файл базовых результатов")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Сохранить результаты как новые базовые")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Допустимый относительный рост медианы")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results = run_all(args.sizes, args.cores, args.repeat)
+    for name, result in results.items():
+        print(f"{name:40s} median {result['median_ms']:9.2f} мс   min {result['min_ms']:9.2f} мс   "
+              f"peak {result['peak_kb']:9.0f} KB")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                         'repeat': args.repeat},
+                'results': results,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"Базовые результаты сохранены в {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Базовые результаты не найдены, сравнение пропущено (см. --save-baseline)")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"РЕГРЕССИЯ {line}")
+    if not regressions:
+        print("Регрессий нет.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
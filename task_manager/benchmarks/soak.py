@@ -0,0 +1,182 @@
+# benchmarks/soak.py
+#
+# Длительный прогон полного конвейера (сбор -> модель и прокси -> вкладка
+# производительности) на синтетических процессах с высокой сменой.
+# Запуск из каталога task_manager:
+#
+#     QT_QPA_PLATFORM=offscreen python -m benchmarks.soak --ticks 5000
+#
+# Память контролируется двумя способами: tracemalloc (объекты Python и NumPy)
+# и RSS процесса (в том числе память Qt). После прогрева по замерам строится
+# линейный тренд; прогон проваливается (код выхода 1), если удерживаемая
+# память или выделения за такт растут быстрее заданных порогов.
+
+import argparse
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+from typing import List
+
+import numpy as np
+import psutil
+from PyQt5.QtCore import QCoreApplication, QEvent, Qt
+from PyQt5.QtWidgets import QApplication
+
+from controllers.process_controller import ProcessController
+from controllers.process_sources import SyntheticProcessSource
+from controllers.snapshot_collector import SnapshotCollector
+from models.hardware_inventory import HardwareInventory
+from models.process_model import ProcessTableModel, ProcessSortFilterProxyModel, COL_CPU
+from models.system_monitor import SystemMonitor
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+def slope(values) -> float:
+    """Наклон линейного тренда на один отсчёт"""
+    if len(values) < 2:
+        return 0.0
+    return float(np.polyfit(np.arange(len(values)), values, 1)[0])
+
+
+class SoakRun:
+    """Конвейер одного прогона и замеры памяти по тактам"""
+
+    def __init__(self, processes: int, churn: float, seed: int):
+        from views.performance_tab import PerformanceTab
+
+        rate = processes * churn
+        source = SyntheticProcessSource(processes, spawn_rate=rate, exit_rate=rate,
+                                        unique_names=True, seed=seed)
+        self.system_monitor = SystemMonitor()
+        self.collector = SnapshotCollector(self.system_monitor, ProcessController(source))
+        self.model = ProcessTableModel()
+        self.proxy = ProcessSortFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.proxy.sort(COL_CPU, Qt.DescendingOrder)
+        self.performance_tab = PerformanceTab(HardwareInventory(), self.system_monitor.history)
+
+        self.process = psutil.Process()
+        # Удерживаемая память (tracemalloc), RSS и пик выделений за такт.
+        # Массивы выделяются заранее, чтобы сами замеры не выглядели как рост памяти
+        self.traced = self.rss = self.tick_peaks = None
+        self.samples = 0
+
+    def tick(self):
+        snapshot = self.collector.collect()
+        with self.proxy.update_transaction():
+            self.model.update_data(snapshot.processes)
+        self.performance_tab.update_snapshot(snapshot)
+        # Отложенные удаления Qt обрабатываются так же, как в цикле событий
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        QCoreApplication.processEvents()
+
+    def sample(self):
+        gc.collect()
+        self.traced[self.samples] = tracemalloc.get_traced_memory()[0]
+        self.rss[self.samples] = self.process.memory_info().rss
+        self.samples += 1
+
+    def run(self, ticks: int, warmup: int, sample_every: int) -> tracemalloc.Snapshot:
+        """Выполняет прогон; возвращает снимок tracemalloc после прогрева"""
+        measured = max(0, ticks - warmup)
+        self.tick_peaks = np.zeros(measured)
+        self.traced = np.zeros(measured // sample_every + 2)
+        self.rss = np.zeros_like(self.traced)
+
+        baseline = None
+        started = time.monotonic()
+        for i in range(ticks):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            self.tick()
+            _, peak = tracemalloc.get_traced_memory()
+
+            if i < warmup:
+                continue
+            if baseline is None:
+                baseline = tracemalloc.take_snapshot()
+            self.tick_peaks[i - warmup] = peak - before
+            if (i - warmup) % sample_every == 0:
+                self.sample()
+                logger.info(f"Такт {i}/{ticks}: строк {self.model.rowCount()}, "
+                            f"tracemalloc {self.traced[self.samples - 1] / 1024 ** 2:.1f} MB, "
+                            f"RSS {self.rss[self.samples - 1] / 1024 ** 2:.1f} MB, "
+                            f"{(time.monotonic() - started) / (i + 1) * 1000:.0f} мс/такт")
+        self.sample()
+        self.traced = self.traced[:self.samples]
+        self.rss = self.rss[:self.samples]
+        return baseline
+
+
+def evaluate(run: SoakRun, args) -> List[str]:
+    """Проверяет тренды памяти; возвращает описания нарушений"""
+    failures = []
+    per_tick = 1.0 / args.sample_every
+
+    retained = slope(run.traced) * per_tick
+    rss = slope(run.rss) * per_tick
+    print(f"Рост удерживаемой памяти (tracemalloc): {retained:.1f} байт/такт")
+    print(f"Рост RSS: {rss:.1f} байт/такт")
+    if retained > args.max_retained_growth:
+        failures.append(f"удерживаемая память растёт на {retained:.1f} байт/такт "
+                        f"(порог {args.max_retained_growth})")
+    if rss > args.max_rss_growth:
+        failures.append(f"RSS растёт на {rss:.1f} байт/такт (порог {args.max_rss_growth})")
+
+    # Выделения за такт: начало и конец прогона после прогрева
+    quarter = max(1, len(run.tick_peaks) // 4)
+    early = float(np.median(run.tick_peaks[:quarter]))
+    late = float(np.median(run.tick_peaks[-quarter:]))
+    print(f"Выделения за такт: {early / 1024:.1f} KB в начале, {late / 1024:.1f} KB в конце")
+    if early > 0 and late > early * (1 + args.max_alloc_growth):
+        failures.append(f"выделения за такт выросли с {early / 1024:.1f} до {late / 1024:.1f} KB")
+    return failures
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Длительный прогон с контролем утечек памяти")
+    parser.add_argument("--ticks", type=int, default=2000, help="Число тактов")
+    parser.add_argument("--warmup", type=int, default=200,
+                        help="Тактов прогрева (заполнение истории и кэшей) до начала замеров")
+    parser.add_argument("--sample-every", type=int, default=50, help="Период замеров памяти, тактов")
+    parser.add_argument("--processes", type=int, default=500, help="Число синтетических процессов")
+    parser.add_argument("--churn", type=float, default=0.05, help="Доля процессов, сменяющихся за такт")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-retained-growth", type=float, default=256.0,
+                        help="Допустимый рост удерживаемой памяти, байт/такт")
+    parser.add_argument("--max-rss-growth", type=float, default=4096.0,
+                        help="Допустимый рост RSS, байт/такт")
+    parser.add_argument("--max-alloc-growth", type=float, default=0.5,
+                        help="Допустимый относительный рост выделений за такт")
+    parser.add_argument("--top", type=int, default=10, help="Строк в отчёте о местах роста памяти")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    # Сообщения о каждом новом процессе при высокой смене только засоряют вывод
+    logger.logger.setLevel(logging.INFO)
+
+    tracemalloc.start()
+    run = SoakRun(args.processes, args.churn, args.seed)
+    baseline = run.run(args.ticks, args.warmup, args.sample_every)
+    failures = evaluate(run, args)
+
+    if failures:
+        print("Места наибольшего роста памяти после прогрева:")
+        for stat in tracemalloc.take_snapshot().compare_to(baseline, 'lineno')[:args.top]:
+            print(f"  {stat}")
+        for failure in failures:
+            print(f"ПРОВАЛ: {failure}")
+        return 1
+    print("Рост памяти в пределах порогов.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# collector_worker.py
+
+from PyQt5.QtCore import QObject, QThread, QTimer, QMetaObject, Qt, pyqtSignal, pyqtSlot
+
+from controllers.snapshot_collector import SnapshotCollector
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Во сколько раз реже собирается список процессов в режиме энергосбережения
+LOW_POWER_PROCESS_SLOWDOWN = 5
+# Минимальная пауза между пробуждениями сборщика, мс
+MIN_WAKEUP_MS = 10
+
+
+class CollectorWorker(QObject):
+    """
+    Фоновый сборщик данных. Живёт в отдельном QThread и публикует
+    неизменяемые снимки через сигнал snapshot_ready. Момент следующего
+    пробуждения определяет планировщик сборщиков (SamplingScheduler).
+
+    Сигнал пересекает границу потоков, поэтому доставляется в UI
+    через очередь событий (queued connection).
+    """
+    snapshot_ready = pyqtSignal(object)
+
+    def __init__(self, collector: SnapshotCollector):
+        super().__init__()
+        logger.info("Инициализация CollectorWorker.")
+        self.collector = collector
+        self._timer = None
+        self._stopped = False
+        logger.info("CollectorWorker инициализирован.")
+
+    @pyqtSlot()
+    def start(self):
+        """Запускает таймер сбора. Вызывается уже в рабочем потоке."""
+        logger.info("CollectorWorker запущен в фоновом потоке.")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.collect_once)
+        # Первый снимок публикуем сразу, не дожидаясь интервала
+        self.collect_once()
+
+    @pyqtSlot()
+    def stop(self):
+        """Останавливает таймер сбора"""
+        self._stopped = True
+        if self._timer is not None:
+            self._timer.stop()
+        logger.info("CollectorWorker остановлен.")
+
+    @pyqtSlot(bool)
+    def set_low_power(self, enabled: bool):
+        """В режиме энергосбережения список процессов собирается реже"""
+        self.collector.scheduler.set_slowdown('processes', LOW_POWER_PROCESS_SLOWDOWN if enabled else 1,
+                                              reason='low_power')
+        logger.info(f"Режим энергосбережения сборщика: {'включён' if enabled else 'выключен'}.")
+
+    @pyqtSlot()
+    def collect_once(self):
+        """Выполняет назначенные замеры, публикует снимок и планирует следующее пробуждение"""
+        try:
+            snapshot = self.collector.collect_due()
+        except Exception as e:
+            logger.error(f"Ошибка в фоновом сборщике: {e}")
+            snapshot = None
+        if snapshot is not None:
+            self.snapshot_ready.emit(snapshot)
+        if self._timer is not None and not self._stopped:
+            delay = self.collector.scheduler.time_until_next()
+            self._timer.start(max(MIN_WAKEUP_MS, int(delay * 1000)))
+
+
+def start_collector_thread(worker: CollectorWorker) -> QThread:
+    """Переносит сборщик в отдельный поток и запускает его"""
+    thread = QThread()
+    thread.setObjectName("CollectorThread")
+    worker.moveToThread(thread)
+    thread.started.connect(worker.start)
+    thread.start()
+    return thread
+
+
+def stop_collector_thread(worker: CollectorWorker, thread: QThread, timeout_ms: int = 5000):
+    """Останавливает сборщик в его потоке и дожидается завершения потока"""
+    if thread.isRunning():
+        QMetaObject.invokeMethod(worker, "stop", Qt.BlockingQueuedConnection)
+        thread.quit()
+        if not thread.wait(timeout_ms):
+            logger.warning("Поток сборщика не завершился за отведённое время.")
@@ -0,0 +1,120 @@
+# overhead_governor.py
+
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+import psutil
+
+from controllers.process_sources import DETAIL_FULL, DETAIL_BASIC
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Бюджет потока сборщика по умолчанию, % одного ядра. Сканирование psutil
+# стоит около 0.15 мс на процесс, и несколько сотен процессов раз в
+# секунду укладываются в бюджет без ограничений
+DEFAULT_CPU_BUDGET_PERCENT = 5.0
+
+
+class OverheadSample(NamedTuple):
+    """Собственная нагрузка приложения за последний замер"""
+    cpu_percent: float  # Процент одного ядра (все потоки приложения)
+    collector_cpu_percent: float  # Процент одного ядра потоком сборщика (по нему идёт регулирование)
+    rss_mb: float
+    level: int          # Текущая ступень ограничения (0 - без ограничений)
+
+
+class OverheadGovernor:
+    """
+    Регулятор собственной нагрузки диспетчера задач.
+
+    Каждый замер учитывает процессорное время и RSS самого приложения.
+    С бюджетом сравнивается время потока, в котором вызывается update()
+    (поток сборщика): отрисовку GUI регулятор не ускорит, а её учёт
+    поднимал бы ступень сразу после запуска. Если средняя загрузка
+    потока за последние замеры превышает бюджет, регулятор
+    поднимает ступень ограничения: сначала реже собирается список процессов,
+    на последней ступени дополнительно снижается детализация сканирования.
+    Когда нагрузка опускается ниже половины бюджета, ступень понижается.
+    """
+
+    # Ступень -> (замедление сбора списка процессов, уровень детализации)
+    LEVELS = (
+        (1, DETAIL_FULL),
+        (2, DETAIL_FULL),
+        (4, DETAIL_FULL),
+        (8, DETAIL_FULL),
+        (8, DETAIL_BASIC),
+    )
+    # Число замеров для усреднения и минимальная пауза между сменами ступени
+    WINDOW = 5
+
+    def __init__(self, scheduler, process_controller, cpu_budget_percent: float = DEFAULT_CPU_BUDGET_PERCENT,
+                 rss_budget_mb: float = None):
+        logger.info("Инициализация OverheadGovernor.")
+        self.scheduler = scheduler
+        self.process_controller = process_controller
+        self.cpu_budget_percent = cpu_budget_percent
+        self.rss_budget_mb = rss_budget_mb
+        self.level = 0
+        self.last_sample = OverheadSample(0.0, 0.0, 0.0, 0)
+
+        self._process = psutil.Process()
+        self._last_cpu_time = self._cpu_time()
+        self._last_time = time.monotonic()
+        # Время потока сборщика: отсчёт начинается с первого update() в этом потоке
+        self._thread_id = None
+        self._last_thread_time = 0.0
+        self._cpu_samples = deque(maxlen=self.WINDOW)
+        self._samples_since_change = 0
+        logger.info(f"OverheadGovernor инициализирован: бюджет ЦП {cpu_budget_percent:.1f}% ядра.")
+
+    def _cpu_time(self) -> float:
+        times = self._process.cpu_times()
+        return times.user + times.system
+
+    def update(self) -> OverheadSample:
+        """Замеряет собственную нагрузку и при необходимости меняет ступень ограничения"""
+        now = time.monotonic()
+        cpu_time = self._cpu_time()
+        elapsed = now - self._last_time
+        cpu_percent = (cpu_time - self._last_cpu_time) / elapsed * 100 if elapsed > 0 else 0.0
+        self._last_cpu_time, self._last_time = cpu_time, now
+        rss_mb = self._process.memory_info().rss / (1024 ** 2)
+
+        thread_time = time.thread_time()
+        collector_percent = 0.0
+        if self._thread_id == threading.get_ident():
+            collector_percent = (thread_time - self._last_thread_time) / elapsed * 100 if elapsed > 0 else 0.0
+            self._cpu_samples.append(collector_percent)
+            self._samples_since_change += 1
+            self._regulate(rss_mb)
+        else:
+            # Первый замер в этом потоке: время потока ещё не с чем сравнить
+            self._thread_id = threading.get_ident()
+        self._last_thread_time = thread_time
+
+        self.last_sample = OverheadSample(cpu_percent, collector_percent, rss_mb, self.level)
+        return self.last_sample
+
+    def _regulate(self, rss_mb: float):
+        if self._samples_since_change < self.WINDOW:
+            return
+        average = sum(self._cpu_samples) / len(self._cpu_samples)
+        over_rss = self.rss_budget_mb is not None and rss_mb > self.rss_budget_mb
+
+        if (average > self.cpu_budget_percent or over_rss) and self.level < len(self.LEVELS) - 1:
+            self._set_level(self.level + 1, average, rss_mb)
+        elif average < self.cpu_budget_percent / 2 and not over_rss and self.level > 0:
+            self._set_level(self.level - 1, average, rss_mb)
+
+    def _set_level(self, level: int, average: float, rss_mb: float):
+        self.level = level
+        self._samples_since_change = 0
+        slowdown, detail = self.LEVELS[level]
+        self.scheduler.set_slowdown('processes', slowdown, reason='overhead')
+        self.process_controller.detail_level = detail
+        logger.info(f"Собственная нагрузка {average:.2f}% ядра, RSS {rss_mb:.0f} MB: ступень ограничения {level} "
+                    f"(список процессов реже в {slowdown} раз, детализация '{detail}').")
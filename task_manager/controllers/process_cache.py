@@ -0,0 +1,73 @@
+# process_cache.py
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# Ключ процесса: PID может быть переиспользован, пара (pid, create_time) - нет
+ProcessKey = Tuple[int, float]
+
+
+class StaticProcessInfo(NamedTuple):
+    """Атрибуты, не меняющиеся за время жизни процесса"""
+    name: str
+    user: str
+    exe: str
+    cmdline: Tuple[str, ...]
+    ppid: int               # Родитель на момент появления процесса
+    is_current_user: bool
+    is_gui: bool
+
+
+class ProcessAttributeCache:
+    """
+    Кэш неизменных атрибутов процессов по ключу (pid, create_time).
+
+    Между begin_scan() и end_scan() источник видит записи прошлого
+    сканирования (оператор in), а контроллер отмечает встреченные процессы.
+    После сканирования остаются только встреченные записи: завершившиеся
+    процессы и процессы с переиспользованным PID (другой create_time)
+    вытесняются автоматически.
+    """
+
+    def __init__(self):
+        self._entries: Dict[ProcessKey, StaticProcessInfo] = {}
+        self._seen: Dict[ProcessKey, StaticProcessInfo] = {}
+        # Те же записи по одному PID, для обхода цепочки родителей
+        self._by_pid: Dict[int, StaticProcessInfo] = {}
+        self._seen_by_pid: Dict[int, StaticProcessInfo] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: ProcessKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin_scan(self):
+        self._seen = {}
+        self._seen_by_pid = {}
+        self.hits = self.misses = 0
+
+    def get(self, key: ProcessKey) -> Optional[StaticProcessInfo]:
+        """Возвращает атрибуты известного процесса и отмечает его как встреченный"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._seen[key] = entry
+            self._seen_by_pid[key[0]] = entry
+            self.hits += 1
+        return entry
+
+    def add(self, key: ProcessKey, entry: StaticProcessInfo):
+        """Запоминает атрибуты нового процесса (доступны со следующего сканирования)"""
+        self._seen[key] = entry
+        self._seen_by_pid[key[0]] = entry
+        self.misses += 1
+
+    def get_by_pid(self, pid: int) -> Optional[StaticProcessInfo]:
+        """Атрибуты живого процесса по PID: из текущего сканирования или, если он ещё не встречен, из прошлого"""
+        entry = self._seen_by_pid.get(pid)
+        return entry if entry is not None else self._by_pid.get(pid)
+
+    def end_scan(self):
+        self._entries, self._by_pid = self._seen, self._seen_by_pid
+        self._seen, self._seen_by_pid = {}, {}
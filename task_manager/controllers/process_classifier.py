@@ -0,0 +1,76 @@
+# process_classifier.py
+
+import re
+from typing import Callable, Dict, Optional
+
+# Резервное правило по имени процесса - одно скомпилированное выражение:
+# оболочки и терминальные мультиплексоры сравниваются с именем целиком
+# (а не по подстроке "sh"), системные службы и компоненты сессии - по префиксу
+FALLBACK_PATTERN = re.compile(
+    r'^(?:-?(?:ba|z|da|fi|k|c|tc)?sh|ssh(?:d|-agent)?|tmux(?:: \w+)?|screen)$'
+    r'|^(?:systemd|dbus|pulse|pipewire|wireplumber|gvfs|networkmanager|nm-|gdm|xdg-|ibus|at-spi'
+    r'|gnome-(?:keyring|session|settings)|gsd-|evolution-|polkit|upowerd|udisksd)',
+    re.IGNORECASE)
+
+# Сколько предков просматривать, если собственных признаков недостаточно
+MAX_PARENT_DEPTH = 8
+
+
+class ProcessClassifier:
+    """
+    Разделяет процессы на GUI-приложения и фоновые.
+
+    Решение принимается один раз за время жизни процесса (результат хранится
+    в кэше неизменных атрибутов) по признакам, в порядке убывания надёжности:
+
+    1. Процессы других пользователей - фоновые.
+    2. Потоки ядра (без exe и cmdline) - фоновые.
+    3. Оболочки и системные службы по FALLBACK_PATTERN - фоновые.
+    4. Процесс с управляющим терминалом (tty) - консольный, фоновый.
+    5. DISPLAY/WAYLAND_DISPLAY в окружении: есть - GUI, нет - фоновый.
+    6. Окружение недоступно: решение ближайшего известного предка
+       по цепочке родителей; если предков нет - GUI.
+    """
+
+    def __init__(self, current_user: str):
+        self.current_user = current_user
+        # Причина -> число решений, для диагностики классификации
+        self.decisions: Dict[str, int] = {}
+
+    def classify(self, static: Dict, lookup: Callable[[int], Optional[object]]) -> bool:
+        """
+        Args:
+            static: Неизменные атрибуты нового процесса от источника
+                ('name', 'user', 'ppid', 'terminal', 'display')
+            lookup: pid -> StaticProcessInfo уже известного процесса или None
+
+        Returns:
+            bool: True если это GUI-процесс
+        """
+        is_gui, reason = self._decide(static, lookup)
+        self.decisions[reason] = self.decisions.get(reason, 0) + 1
+        return is_gui
+
+    def _decide(self, static: Dict, lookup):
+        if static.get('user') != self.current_user:
+            return False, 'user'
+        if not static.get('exe') and not static.get('cmdline'):
+            return False, 'kernel'
+        if FALLBACK_PATTERN.match(static.get('name') or ''):
+            return False, 'name'
+        if static.get('terminal'):
+            return False, 'terminal'
+        display = static.get('display')
+        if display is not None:
+            return display, 'display'
+
+        # Окружение не прочитано: наследуем решение предка
+        ppid = static.get('ppid')
+        for _ in range(MAX_PARENT_DEPTH):
+            parent = lookup(ppid) if ppid else None
+            if parent is None:
+                break
+            if parent.is_current_user:
+                return parent.is_gui, 'parent'
+            ppid = parent.ppid
+        return True, 'default'
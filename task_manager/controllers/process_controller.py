@@ -1,40 +1,98 @@
+import os
 import psutil
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Iterable, NamedTuple, Optional
 import sys
+import time
 
+from controllers.process_cache import ProcessAttributeCache, StaticProcessInfo
+from controllers.process_classifier import ProcessClassifier
+from controllers.process_sources import create_process_source, ProcessSource, DETAIL_FULL
+from models.process_records import ProcessRecords
 
-class ProcessController:
-    @staticmethod
-    def get_processes() -> Tuple[List[Dict], List[Dict]]:
-        """
-        Получает список всех процессов и разделяет их на GUI и фоновые
 
-        Returns:
-            Tuple[List[Dict], List[Dict]]: (gui_processes, background_processes)
-        """
-        gui_processes = []
-        background_processes = []
-        current_user = ProcessController._get_current_user()
+# Исходы массового завершения процессов
+STOP_TERMINATED = 'terminated'      # Завершился после SIGTERM
+STOP_KILLED = 'killed'              # Завершился после SIGKILL
+STOP_GONE = 'gone'                  # Уже не существовал
+STOP_DENIED = 'denied'              # Нет прав на отправку сигнала
+STOP_SURVIVED = 'survived'          # Жив и после SIGKILL
+STOP_ERROR = 'error'
 
-        for proc in psutil.process_iter(['pid', 'name', 'status', 'cpu_percent', 'memory_percent', 'username']):
-            try:
-                if not ProcessController._is_process_accessible(proc):
-                    continue
+# Сколько ждать завершения после SIGTERM и после SIGKILL, с
+TERMINATE_TIMEOUT = 3.0
+KILL_TIMEOUT = 2.0
+# Период проверки завершения процессов, с
+STOP_POLL_INTERVAL = 0.1
+# Допустимое расхождение create_time (источники считают его по тикам /proc), с
+CREATE_TIME_TOLERANCE = 0.05
 
-                proc_info = ProcessController._create_process_info(proc, current_user)
+# Пояснение к STOP_GONE, если PID выбранного процесса перешёл к новому процессу
+PID_REUSED_MESSAGE = "PID занят другим процессом"
 
-                if ProcessController._is_gui_process(proc, proc_info, current_user):
-                    gui_processes.append(proc_info)
-                else:
-                    background_processes.append(proc_info)
+# Процесс, выбранный в интерфейсе: PID и время создания (None - без проверки)
+ProcessTarget = Tuple[int, Optional[float]]
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-            except Exception as e:
-                print(f"Unexpected error processing PID {proc.pid if hasattr(proc, 'pid') else 'unknown'}: {e}",
-                      file=sys.stderr)
 
-        return gui_processes, background_processes
+class StopOutcome(NamedTuple):
+    """Результат завершения одного процесса"""
+    pid: int
+    name: str
+    result: str
+    message: str = ''
+
+
+class ProcessController:
+    def __init__(self, source='psutil'):
+        # Имя источника из PROCESS_SOURCES или готовый экземпляр ProcessSource
+        self.source = source if isinstance(source, ProcessSource) else create_process_source(source)
+        # Длительность последнего сканирования, для сравнения источников
+        self.last_scan_duration = 0.0
+        # Уровень детализации; снижается регулятором собственной нагрузки
+        self.detail_level = DETAIL_FULL
+        # Текущий пользователь не меняется за время работы приложения
+        self.current_user = ProcessController._get_current_user()
+        # Неизменные атрибуты и классификация процессов по (pid, create_time)
+        self.static_cache = ProcessAttributeCache()
+        # GUI/фоновый решается один раз за время жизни процесса
+        self.classifier = ProcessClassifier(self.current_user)
+
+    def get_processes(self) -> ProcessRecords:
+        """
+        Получает список всех процессов в виде столбцов ProcessRecords.
+        Источник каждый такт отдаёт только изменяемые поля, неизменные
+        (и классификация GUI/фоновый) берутся из кэша и читаются заново
+        лишь для новых процессов.
+
+        Returns:
+            ProcessRecords: Снимок процессов за сканирование
+        """
+        pids, create_times, statuses, cpu, memory, ppids, statics = [], [], [], [], [], [], []
+        cache = self.static_cache
+        started = time.perf_counter()
+
+        cache.begin_scan()
+        for pid, create_time, status, cpu_value, memory_value, ppid, static_fields in \
+                self.source.iter_processes(self.detail_level, cache):
+            key = (pid, create_time)
+            static = cache.get(key)
+            if static is None:
+                try:
+                    static = self._create_static_info(static_fields)
+                except Exception as e:
+                    print(f"Unexpected error processing PID {pid}: {e}", file=sys.stderr)
+                    continue
+                cache.add(key, static)
+            pids.append(pid)
+            create_times.append(create_time)
+            statuses.append(status)
+            cpu.append(cpu_value)
+            memory.append(memory_value)
+            ppids.append(ppid)
+            statics.append(static)
+        cache.end_scan()
+
+        self.last_scan_duration = time.perf_counter() - started
+        return ProcessRecords(pids, create_times, statuses, cpu, memory, ppids, statics)
 
     @staticmethod
     def _get_current_user() -> str:
@@ -44,123 +102,153 @@ class ProcessController:
         except Exception:
             return ""
 
-    @staticmethod
-    def _is_process_accessible(proc) -> bool:
-        """Проверяет, доступен ли процесс для обработки"""
-        try:
-            return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
-        except Exception:
-            return False
-
-    @staticmethod
-    def _create_process_info(proc, current_user: str) -> Dict:
-        """Создает словарь с информацией о процессе"""
-        try:
-            info = proc.info
-            return {
-                'pid': info.get('pid', 0),
-                'name': info.get('name', 'unknown'),
-                'status': info.get('status', 'unknown'),
-                'cpu': info.get('cpu_percent', 0),
-                'memory': info.get('memory_percent', 0),
-                'user': info.get('username', 'unknown'),
-                'is_current_user': info.get('username') == current_user
-            }
-        except Exception:
-            return {
-                'pid': 0,
-                'name': 'unknown',
-                'status': 'unknown',
-                'cpu': 0,
-                'memory': 0,
-                'user': 'unknown',
-                'is_current_user': False
-            }
-
-    @staticmethod
-    def _is_gui_process(proc, proc_info: Dict, current_user: str) -> bool:
-        """
-        Определяет, является ли процесс GUI-приложением
-
-        Args:
-            proc: Объект процесса psutil
-            proc_info: Словарь с информацией о процессе
-            current_user: Имя текущего пользователя
-
-        Returns:
-            bool: True если это GUI-процесс
-        """
-        if not proc_info['is_current_user']:
-            return False
-
-        name = proc_info['name'].lower()
-        system_keywords = [
-            'systemd', 'dbus', 'pulse', 'gvfs', 'network',
-            'gnome-', 'gdm', 'pipewire', 'xdg', 'ibus'
-        ]
-
-        # Исключаем системные процессы
-        if any(kw in name for kw in system_keywords):
-            return False
-
-        # Исключаем процессы без интерфейса
-        cli_processes = ['bash', 'sh', 'zsh', 'ssh', 'tmux', 'screen']
-        if any(cli in name for cli in cli_processes):
-            return False
-
-        return True
+    def _create_static_info(self, info: Dict) -> StaticProcessInfo:
+        """Собирает неизменные атрибуты нового процесса и классифицирует его"""
+        user = info.get('user') or 'unknown'
+        return StaticProcessInfo(
+            name=info.get('name') or 'unknown',
+            user=user,
+            exe=info.get('exe') or '',
+            cmdline=tuple(info.get('cmdline') or ()),
+            ppid=info.get('ppid') or 0,
+            is_current_user=user == self.current_user,
+            is_gui=self.classifier.classify(info, self.static_cache.get_by_pid),
+        )
 
     @staticmethod
-    def terminate_process(pid: int) -> Tuple[bool, str]:
+    def terminate_process(pid: int, create_time: Optional[float] = None) -> Tuple[bool, str]:
+        """Отправляет процессу SIGTERM без ожидания и эскалации"""
         try:
-
-
-            proc = psutil.Process(pid)
+            proc = ProcessController.open_process(pid, create_time)
             proc.terminate()
             return True, f"Процесс {pid} ({proc.name()}) отправлен на завершение"
         except Exception as e:
             return False, str(e)
 
     @staticmethod
-    def kill_process(pid: int) -> Tuple[bool, str]:
-
+    def kill_process(pid: int, create_time: Optional[float] = None) -> Tuple[bool, str]:
+        """Отправляет процессу SIGKILL"""
         try:
-            proc = psutil.Process(pid)
+            proc = ProcessController.open_process(pid, create_time)
             proc.kill()
             return True, f"Процесс {pid} ({proc.name()}) принудительно завершен"
         except Exception as e:
             return False, str(e)
 
     @staticmethod
-    def get_process_details(pid: int) -> Dict:
+    def open_process(pid: int, create_time: Optional[float] = None) -> psutil.Process:
         """
-        Получает детальную информацию о процессе
+        Открывает процесс и проверяет, что это тот же процесс, что выбран в интерфейсе:
+        если PID успел перейти к новому процессу, сигнал ушёл бы постороннему
+
+        Raises:
+            psutil.NoSuchProcess: Процесса нет или PID занят другим процессом
+        """
+        proc = psutil.Process(pid)
+        if create_time is not None and abs(proc.create_time() - create_time) > CREATE_TIME_TOLERANCE:
+            raise psutil.NoSuchProcess(pid, msg=PID_REUSED_MESSAGE)
+        return proc
+
+    @staticmethod
+    def collect_processes(targets: Iterable[ProcessTarget],
+                          include_children: bool = False) -> Tuple[List[psutil.Process], List[StopOutcome]]:
+        """
+        Открывает процессы по (pid, create_time), при необходимости вместе со всеми потомками.
+
+        Returns:
+            (процессы, исходы для PID, которые открыть не удалось)
+        """
+        own_pid = os.getpid()
+        processes: Dict[int, psutil.Process] = {}
+        outcomes = []
+        for pid, create_time in targets:
+            try:
+                proc = ProcessController.open_process(pid, create_time)
+                tree = [proc] + (proc.children(recursive=True) if include_children else [])
+            except psutil.NoSuchProcess as e:
+                outcomes.append(StopOutcome(pid, '', STOP_GONE, e.msg if e.msg == PID_REUSED_MESSAGE else ''))
+                continue
+            except Exception as e:
+                outcomes.append(StopOutcome(pid, '', STOP_ERROR, str(e)))
+                continue
+            for member in tree:
+                # Сам диспетчер задач в дерево не попадает
+                if member.pid != own_pid:
+                    processes.setdefault(member.pid, member)
+        return list(processes.values()), outcomes
+
+    @staticmethod
+    def stop_processes(targets: Iterable[ProcessTarget], include_children: bool = False, force: bool = False,
+                       terminate_timeout: float = TERMINATE_TIMEOUT,
+                       kill_timeout: float = KILL_TIMEOUT) -> List[StopOutcome]:
+        """
+        Массовое завершение процессов с эскалацией.
+
+        Сигнал сначала отправляется всем процессам сразу, затем ожидание
+        идёт одним psutil.wait_procs на всех. Пережившим SIGTERM отправляется
+        SIGKILL. Вызов блокирующий (до terminate_timeout + kill_timeout),
+        из интерфейса выполняется в фоновом потоке.
 
         Args:
-            pid: ID процесса
+            targets: Пары (pid, create_time); процессы, чей PID уже занят другим, пропускаются
+            include_children: Завершать также всех потомков
+            force: Сразу SIGKILL, без SIGTERM
 
         Returns:
-            Dict: Информация о процессе или сообщение об ошибке
+            List[StopOutcome]: Исход по каждому PID
         """
-        try:
-            proc = psutil.Process(pid)
-            with proc.oneshot():
-                return {
-                    'pid': pid,
-                    'name': proc.name(),
-                    'status': proc.status(),
-                    'cpu_percent': proc.cpu_percent(),
-                    'memory_percent': proc.memory_percent(),
-                    'username': proc.username(),
-                    'exe': proc.exe(),
-                    'cmdline': ' '.join(proc.cmdline()),
-                    'create_time': proc.create_time(),
-                    'threads': proc.num_threads(),
-                    'connections': len(proc.connections()),
-                    'open_files': len(proc.open_files()),
-                    'memory_info': proc.memory_info()._asdict()
-                }
-        except psutil.NoSuchProcess:
-            return {'error': f'Process {pid} not found'}
-        except Exception as e:
-            return {'error': f'Error getting process info: {str(e)}'}
\ No newline at end of file
+        processes, outcomes = ProcessController.collect_processes(targets, include_children)
+        names = {}
+        for proc in processes:
+            try:
+                names[proc.pid] = proc.name()
+            except psutil.Error:
+                names[proc.pid] = ''
+
+        def send(targets, signal_name):
+            sent = []
+            for proc in targets:
+                try:
+                    getattr(proc, signal_name)()
+                    sent.append(proc)
+                except psutil.NoSuchProcess:
+                    outcomes.append(StopOutcome(proc.pid, names[proc.pid], STOP_GONE))
+                except psutil.AccessDenied:
+                    outcomes.append(StopOutcome(proc.pid, names[proc.pid], STOP_DENIED, "Отказано в доступе"))
+                except Exception as e:
+                    outcomes.append(StopOutcome(proc.pid, names[proc.pid], STOP_ERROR, str(e)))
+            return sent
+
+        alive = processes
+        if not force:
+            gone, alive = ProcessController._wait_stopped(send(alive, 'terminate'), terminate_timeout)
+            outcomes.extend(StopOutcome(proc.pid, names[proc.pid], STOP_TERMINATED) for proc in gone)
+        gone, alive = ProcessController._wait_stopped(send(alive, 'kill'), kill_timeout)
+        outcomes.extend(StopOutcome(proc.pid, names[proc.pid], STOP_KILLED) for proc in gone)
+        outcomes.extend(StopOutcome(proc.pid, names[proc.pid], STOP_SURVIVED, "Не завершился после SIGKILL")
+                        for proc in alive)
+        return outcomes
+
+    @staticmethod
+    def _wait_stopped(processes: List[psutil.Process], timeout: float):
+        """
+        psutil.wait_procs, для которого зомби - уже завершённый процесс:
+        потомки завершённого родителя, которых никто не пожинает, иначе
+        считались бы живыми до истечения таймаута.
+        """
+        deadline = time.monotonic() + timeout
+        gone, alive = [], processes
+        while alive:
+            finished, alive = psutil.wait_procs(alive, timeout=min(STOP_POLL_INTERVAL, timeout))
+            gone.extend(finished)
+            running = []
+            for proc in alive:
+                try:
+                    zombie = proc.status() == psutil.STATUS_ZOMBIE
+                except psutil.NoSuchProcess:
+                    zombie = True
+                (gone if zombie else running).append(proc)
+            alive = running
+            if time.monotonic() >= deadline:
+                break
+        return gone, alive
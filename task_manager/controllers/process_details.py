@@ -0,0 +1,208 @@
+# process_details.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import psutil
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Разделы сведений о процессе
+SECTION_BASIC = 'basic'
+SECTION_OPEN_FILES = 'open_files'
+SECTION_CONNECTIONS = 'connections'
+SECTION_MEMORY_MAPS = 'memory_maps'
+# Дорогие разделы читаются в пуле потоков и приходят по мере готовности
+EXPENSIVE_SECTIONS = (SECTION_OPEN_FILES, SECTION_CONNECTIONS, SECTION_MEMORY_MAPS)
+
+# Сколько секунд сведения о процессе считаются свежими
+DETAILS_TTL = 5.0
+# Число потоков пула: по одному на дорогой раздел
+DETAIL_WORKERS = len(EXPENSIVE_SECTIONS)
+# Сколько элементов раздела передавать в интерфейс (общее число сохраняется)
+MAX_DETAIL_ITEMS = 1000
+
+# Ключ процесса: пара (pid, create_time) не переиспользуется
+ProcessKey = Tuple[int, float]
+
+
+def read_basic(proc: psutil.Process) -> Dict:
+    """Дешёвые поля процесса: одно чтение /proc/[pid] под oneshot"""
+    with proc.oneshot():
+        info = {
+            'pid': proc.pid,
+            'name': proc.name(),
+            'status': proc.status(),
+            'create_time': proc.create_time(),
+            'threads': proc.num_threads(),
+            'memory_info': proc.memory_info()._asdict(),
+        }
+        # Для процессов других пользователей часть полей недоступна
+        for field, getter, default in (('username', proc.username, ''),
+                                       ('exe', proc.exe, ''),
+                                       ('cmdline', lambda: ' '.join(proc.cmdline()), '')):
+            try:
+                info[field] = getter()
+            except psutil.AccessDenied:
+                info[field] = default
+    return info
+
+
+def _limited(items) -> Dict:
+    return {'total': len(items), 'items': items[:MAX_DETAIL_ITEMS]}
+
+
+def read_open_files(proc: psutil.Process) -> Dict:
+    return _limited([f.path for f in proc.open_files()])
+
+
+def read_connections(proc: psutil.Process) -> Dict:
+    # net_connections() появился в psutil 6.0, connections() - прежнее имя
+    connections = getattr(proc, 'net_connections', None) or proc.connections
+    items = []
+    for conn in connections(kind='inet'):
+        local = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ''
+        remote = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ''
+        items.append((local, remote, conn.status))
+    return _limited(items)
+
+
+def read_memory_maps(proc: psutil.Process) -> Dict:
+    maps = sorted(proc.memory_maps(grouped=True), key=lambda m: m.rss, reverse=True)
+    return _limited([(m.path, m.rss) for m in maps])
+
+
+SECTION_READERS = {
+    SECTION_OPEN_FILES: read_open_files,
+    SECTION_CONNECTIONS: read_connections,
+    SECTION_MEMORY_MAPS: read_memory_maps,
+}
+
+
+def _error(e: Exception) -> Dict:
+    if isinstance(e, psutil.NoSuchProcess):
+        return {'error': 'Процесс завершился'}
+    if isinstance(e, psutil.AccessDenied):
+        return {'error': 'Нет доступа'}
+    return {'error': str(e)}
+
+
+class DetailsRequest:
+    """Запрос сведений об одном процессе; отменяется при смене выбора"""
+
+    def __init__(self, proc: psutil.Process, key: ProcessKey):
+        self.process = proc
+        self.key = key
+        self.futures = []
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        # Ещё не начатые чтения снимаются с очереди, выполняющиеся доработают,
+        # но их результат попадёт только в кэш
+        for future in self.futures:
+            future.cancel()
+
+
+class ProcessDetailsService(QObject):
+    """
+    Сведения о выбранном процессе без блокировки интерфейса.
+
+    request() сразу возвращает дешёвые поля (и дорогие разделы из кэша),
+    а недостающие дорогие разделы - открытые файлы, сетевые соединения,
+    карты памяти - читаются параллельно в пуле потоков и приходят
+    по одному через сигнал section_ready. Новый запрос отменяет
+    предыдущий. Результаты кэшируются на DETAILS_TTL секунд по ключу
+    (pid, create_time), поэтому возврат к процессу ничего не перечитывает.
+
+    Сигнал испускается из потоков пула и доставляется в UI через очередь событий.
+    """
+    # (pid, create_time), раздел, значение
+    section_ready = pyqtSignal(object, str, object)
+
+    def __init__(self, max_workers: int = DETAIL_WORKERS, ttl: float = DETAILS_TTL):
+        super().__init__()
+        logger.info("Инициализация ProcessDetailsService.")
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ProcessDetails')
+        # Ключ -> (момент чтения, {раздел: значение})
+        self._cache: Dict[ProcessKey, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+        self._request: Optional[DetailsRequest] = None
+        logger.info("ProcessDetailsService инициализирован.")
+
+    def request(self, pid: int) -> Tuple[Optional[ProcessKey], Dict]:
+        """
+        Запрашивает сведения о процессе, отменяя предыдущий запрос.
+
+        Returns:
+            (ключ, разделы): ключ None, если процесс недоступен; разделы
+            содержат SECTION_BASIC и уже известные дорогие разделы, остальные
+            придут через section_ready с тем же ключом
+        """
+        self.cancel()
+        try:
+            proc = psutil.Process(pid)
+            key = (pid, proc.create_time())
+        except Exception as e:
+            return None, {SECTION_BASIC: _error(e)}
+
+        sections = self._cached(key)
+        if SECTION_BASIC not in sections:
+            try:
+                sections[SECTION_BASIC] = read_basic(proc)
+            except Exception as e:
+                return None, {SECTION_BASIC: _error(e)}
+            self._store(key, SECTION_BASIC, sections[SECTION_BASIC])
+
+        request = DetailsRequest(proc, key)
+        for section in EXPENSIVE_SECTIONS:
+            if section not in sections:
+                request.futures.append(self._executor.submit(self._read_section, request, section))
+        self._request = request
+        return key, sections
+
+    def cancel(self):
+        """Отменяет текущий запрос"""
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("ProcessDetailsService остановлен.")
+
+    def _read_section(self, request: DetailsRequest, section: str):
+        if request.cancelled:
+            return
+        started = time.perf_counter()
+        try:
+            value = SECTION_READERS[section](request.process)
+        except Exception as e:
+            value = _error(e)
+        logger.debug(f"Раздел '{section}' процесса {request.key[0]} прочитан "
+                     f"за {(time.perf_counter() - started) * 1000:.1f} мс.")
+        self._store(request.key, section, value)
+        if not request.cancelled:
+            self.section_ready.emit(request.key, section, value)
+
+    def _cached(self, key: ProcessKey) -> Dict:
+        now = time.monotonic()
+        with self._lock:
+            # Заодно вытесняем устаревшие записи: кэш не растёт со временем
+            for stale in [k for k, (stamp, _) in self._cache.items() if now - stamp > self.ttl]:
+                del self._cache[stale]
+            entry = self._cache.get(key)
+            return dict(entry[1]) if entry is not None else {}
+
+    def _store(self, key: ProcessKey, section: str, value):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                entry = self._cache[key] = (time.monotonic(), {})
+            entry[1][section] = value
@@ -0,0 +1,438 @@
+# process_sources.py
+
+import os
+import pwd
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+import psutil
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Уровни детализации сканирования: в сокращённом режиме пропускаются
+# повторные проверки доступности процессов
+DETAIL_FULL = 'full'
+DETAIL_BASIC = 'basic'
+
+# Неизменные атрибуты, которые источник отдаёт только для новых процессов:
+# ppid - родитель на момент появления, terminal - есть ли управляющий tty,
+# display - задан ли DISPLAY/WAYLAND_DISPLAY (None, если окружение недоступно)
+STATIC_FIELDS = ('name', 'user', 'exe', 'cmdline', 'ppid', 'terminal', 'display')
+
+# Признак графической сессии в /proc/[pid]/environ (непустое значение)
+_DISPLAY_ENV = re.compile(rb'(?:^|\0)(?:WAYLAND_)?DISPLAY=[^\0]')
+
+
+class ProcessSource(ABC):
+    """
+    Интерфейс источника процессов для ProcessController.
+
+    Источник перебирает процессы за одно сканирование и отдаёт кортежи
+    (pid, create_time, status, cpu, memory, ppid, static); cpu и memory - в
+    процентах, как у psutil. ppid - текущий родитель: он меняется, когда
+    осиротевший процесс переходит к init или subreaper. Для процессов,
+    ключа (pid, create_time) которых нет в known, static - словарь
+    неизменных атрибутов STATIC_FIELDS, для известных - None. Кортеж
+    вместо словаря на процесс заметно сокращает выделения памяти за такт.
+    """
+    name = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Доступен ли источник на текущей системе"""
+        return True
+
+    @abstractmethod
+    def iter_processes(self, detail: str = DETAIL_FULL, known=()) -> Iterator[Tuple]:
+        """Перебирает процессы одного сканирования (см. описание класса)"""
+
+
+class PsutilProcessSource(ProcessSource):
+    """Источник процессов на основе psutil.process_iter (кроссплатформенный)"""
+    name = 'psutil'
+
+    # Изменяемые атрибуты, запрашиваемые у всех процессов каждое сканирование
+    ATTRS = ['pid', 'create_time', 'status', 'cpu_percent', 'memory_percent', 'ppid']
+
+    def iter_processes(self, detail: str = DETAIL_FULL, known=()) -> Iterator[Tuple]:
+        """
+        Перебирает доступные процессы
+
+        Args:
+            detail: DETAIL_FULL или DETAIL_BASIC (без повторных проверок доступности)
+            known: Ключи (pid, create_time) процессов, чьи неизменные атрибуты
+                уже известны потребителю
+
+        Yields:
+            Tuple: см. ProcessSource
+        """
+        basic = detail == DETAIL_BASIC
+        for proc in psutil.process_iter(self.ATTRS):
+            try:
+                info = proc.info
+                if basic:
+                    if info.get('status') == psutil.STATUS_ZOMBIE:
+                        continue
+                elif not self._is_process_accessible(proc):
+                    continue
+                pid = info.get('pid', 0)
+                create_time = info.get('create_time') or 0.0
+                static = self._read_static(proc) if (pid, create_time) not in known else None
+                yield (pid, create_time, info.get('status') or 'unknown',
+                       info.get('cpu_percent') or 0, info.get('memory_percent') or 0,
+                       info.get('ppid') or 0, static)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+    @staticmethod
+    def _read_static(proc) -> Dict:
+        """Неизменные атрибуты процесса (читаются один раз за время его жизни)"""
+        with proc.oneshot():
+            static = {'name': proc.name() or 'unknown', 'ppid': proc.ppid()}
+            for field, getter, default in (('user', proc.username, 'unknown'),
+                                           ('exe', proc.exe, ''),
+                                           ('cmdline', proc.cmdline, ()),
+                                           ('terminal', proc.terminal, None),
+                                           ('environ', proc.environ, None)):
+                # Необязательные поля: любая ошибка psutil (в том числе NoSuchProcess,
+                # который environ() отдаёт для потоков ядра) - значение по умолчанию
+                try:
+                    static[field] = getter() or default
+                except psutil.Error:
+                    static[field] = default
+        static['cmdline'] = tuple(static['cmdline'])
+        static['terminal'] = static['terminal'] is not None
+        environ = static.pop('environ')
+        static['display'] = None if environ is None else bool(
+            environ.get('DISPLAY') or environ.get('WAYLAND_DISPLAY'))
+        return static
+
+    @staticmethod
+    def _is_process_accessible(proc) -> bool:
+        """Проверяет, доступен ли процесс для обработки"""
+        try:
+            return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+        except Exception:
+            return False
+
+
+class ProcfsProcessSource(ProcessSource):
+    """
+    Источник процессов, читающий /proc напрямую (только Linux).
+
+    Каждое сканирование читает только /proc/[pid]/stat и statm, без создания
+    объектов psutil.Process; status, cmdline и ссылка exe читаются один раз
+    для новых процессов. Загрузка ЦП считается по разнице jiffies между
+    двумя сканированиями, как это делает psutil.cpu_percent().
+    """
+    name = 'procfs'
+
+    # Состояния из /proc/[pid]/stat в терминах psutil
+    STATUS_MAP = {
+        'R': psutil.STATUS_RUNNING,
+        'S': psutil.STATUS_SLEEPING,
+        'D': psutil.STATUS_DISK_SLEEP,
+        'Z': psutil.STATUS_ZOMBIE,
+        'T': psutil.STATUS_STOPPED,
+        't': psutil.STATUS_TRACING_STOP,
+        'X': psutil.STATUS_DEAD,
+        'I': psutil.STATUS_IDLE,
+        'P': psutil.STATUS_PARKED,
+        'W': psutil.STATUS_WAKING,
+    }
+
+    # Индексы полей stat после имени процесса (номер поля в man proc минус 3)
+    _STATE, _PPID, _TTY_NR, _UTIME, _STIME, _NUM_THREADS, _STARTTIME = 0, 1, 4, 11, 12, 17, 19
+
+    def __init__(self, proc_root: str = '/proc'):
+        logger.info("Инициализация ProcfsProcessSource.")
+        self.proc_root = proc_root
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.total_memory = self._read_total_memory()
+        # create_time = boot_time + starttime / clock_ticks, как в psutil
+        self.boot_time = psutil.boot_time()
+        # pid -> (starttime, суммарные jiffies) с прошлого сканирования
+        self._prev_times = {}
+        self._prev_scan_time = None
+        self._usernames = {}
+        logger.info("ProcfsProcessSource инициализирован.")
+
+    @staticmethod
+    def is_supported(proc_root: str = '/proc') -> bool:
+        return os.path.isfile(os.path.join(proc_root, 'self', 'stat'))
+
+    def _read_total_memory(self) -> int:
+        try:
+            with open(os.path.join(self.proc_root, 'meminfo'), 'rb') as f:
+                for line in f:
+                    if line.startswith(b'MemTotal:'):
+                        return int(line.split()[1]) * 1024
+        except OSError as e:
+            logger.warning(f"Не удалось прочитать meminfo: {e}")
+        return psutil.virtual_memory().total
+
+    def _username(self, uid: int) -> str:
+        name = self._usernames.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid)
+            self._usernames[uid] = name
+        return name
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        # Небуферизованное чтение: файлы /proc маленькие, лишний буфер не нужен
+        with open(path, 'rb', buffering=0) as f:
+            return f.read()
+
+    def _read_static(self, base: str, name: bytes, fields: list) -> Dict:
+        """Неизменные атрибуты нового процесса из stat, status, cmdline, exe и environ"""
+        status = self._read(base + 'status')
+        uid_pos = status.find(b'\nUid:')
+        uid = int(status[uid_pos + 5:status.find(b'\n', uid_pos + 1)].split()[0])
+        try:
+            cmdline = tuple(arg.decode(errors='replace')
+                            for arg in self._read(base + 'cmdline').split(b'\0') if arg)
+        except OSError:
+            cmdline = ()
+        try:
+            exe = os.readlink(base + 'exe')
+        except OSError:
+            # Нет прав или поток ядра без исполняемого файла
+            exe = ''
+        try:
+            display = _DISPLAY_ENV.search(self._read(base + 'environ')) is not None
+        except OSError:
+            # Окружение чужих процессов недоступно
+            display = None
+        return {
+            'name': name.decode(errors='replace'),
+            'user': self._username(uid),
+            'exe': exe,
+            'cmdline': cmdline,
+            'ppid': int(fields[self._PPID]),
+            'terminal': int(fields[self._TTY_NR]) != 0,
+            'display': display,
+        }
+
+    def iter_processes(self, detail: str = DETAIL_FULL, known=()) -> Iterator[Tuple]:
+        """
+        Перебирает процессы из /proc
+
+        Args:
+            detail: Не влияет: неизменные атрибуты и так читаются только для новых процессов
+            known: Ключи (pid, create_time) процессов, чьи неизменные атрибуты
+                уже известны потребителю
+
+        Yields:
+            Tuple: см. ProcessSource
+        """
+        now = time.monotonic()
+        elapsed = (now - self._prev_scan_time) if self._prev_scan_time is not None else 0.0
+        cpu_scale = 100.0 / (self.clock_ticks * elapsed) if elapsed > 0 else 0.0
+        mem_scale = 100.0 * self.page_size / self.total_memory
+
+        prev_times = self._prev_times
+        new_times = {}
+        status_map = self.STATUS_MAP
+        read = self._read
+        root = self.proc_root
+        boot_time = self.boot_time
+        clock_ticks = self.clock_ticks
+
+        with os.scandir(root) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.isdigit():
+                    continue
+                base = f"{root}/{name}/"
+                try:
+                    stat = read(base + 'stat')
+                    statm = read(base + 'statm')
+                except OSError:
+                    # Процесс завершился во время сканирования или недоступен
+                    continue
+
+                try:
+                    lpar = stat.find(b'(')
+                    rpar = stat.rfind(b')')
+                    fields = stat[rpar + 2:].split()
+                    state = fields[self._STATE].decode()
+                    if state == 'Z':
+                        continue
+
+                    pid = int(name)
+                    starttime = int(fields[self._STARTTIME])
+                    jiffies = int(fields[self._UTIME]) + int(fields[self._STIME])
+                    new_times[pid] = (starttime, jiffies)
+
+                    prev = prev_times.get(pid)
+                    if prev is not None and prev[0] == starttime:
+                        cpu = (jiffies - prev[1]) * cpu_scale
+                    else:
+                        # Новый процесс (или переиспользованный PID) - как в psutil, первое значение 0
+                        cpu = 0.0
+
+                    create_time = boot_time + starttime / clock_ticks
+                    memory = int(statm.split(None, 2)[1]) * mem_scale
+                    ppid = int(fields[self._PPID])
+                    static = None
+                    if (pid, create_time) not in known:
+                        static = self._read_static(base, stat[lpar + 1:rpar], fields)
+                except OSError:
+                    continue
+                except (ValueError, IndexError) as e:
+                    logger.warning(f"Не удалось разобрать /proc/{name}: {e}")
+                    continue
+
+                yield pid, create_time, status_map.get(state, state), cpu, memory, ppid, static
+
+        self._prev_times = new_times
+        self._prev_scan_time = now
+
+
+class SyntheticProcessSource(ProcessSource):
+    """
+    Синтетический источник для нагрузочных замеров и проверки на "чужих" объёмах.
+
+    Начинает с count процессов; за каждое сканирование в среднем spawn_rate
+    процессов появляется и exit_rate завершается (дробные значения
+    накапливаются между сканированиями). Загрузка ЦП распределена
+    экспоненциально со средним cpu_mean, память - логнормально со средним
+    memory_mean (оба в процентах). С unique_names имя каждого процесса
+    уникально (как у временных скриптов), что нагружает кэши по имени.
+    Родителем нового процесса становится случайный живой процесс (доля
+    ROOT_SHARE - сразу init), сироты переходят к init, как в ядре.
+    При заданном seed последовательность сканирований воспроизводима.
+    """
+    name = 'synthetic'
+
+    NAMES = ('firefox', 'code', 'python3', 'bash', 'systemd', 'dbus-daemon', 'pipewire',
+             'chrome', 'java', 'postgres', 'nginx', 'sshd', 'kworker/0:1', 'gnome-shell')
+    USERS = ('root', 'postgres', 'www-data')
+    # Имена, которым синтетический источник задаёт DISPLAY в окружении
+    DISPLAY_NAMES = frozenset(('firefox', 'code', 'chrome', 'java', 'gnome-shell'))
+    # Состояния и их доли среди процессов
+    STATUSES = ((psutil.STATUS_SLEEPING, 0.85), (psutil.STATUS_RUNNING, 0.05),
+                (psutil.STATUS_IDLE, 0.08), (psutil.STATUS_DISK_SLEEP, 0.02))
+    # Разброс логнормального распределения памяти
+    MEMORY_SIGMA = 1.0
+    # Доля новых процессов, запускаемых напрямую init (PID 1)
+    ROOT_SHARE = 0.05
+
+    def __init__(self, count: int = 1000, spawn_rate: float = 0.0, exit_rate: float = 0.0,
+                 cpu_mean: float = 0.5, memory_mean: float = 0.1, unique_names: bool = False,
+                 seed: int = None):
+        logger.info(f"Инициализация SyntheticProcessSource: {count} процессов, "
+                    f"+{spawn_rate}/-{exit_rate} за сканирование.")
+        self.spawn_rate = spawn_rate
+        self.exit_rate = exit_rate
+        self.cpu_mean = cpu_mean
+        self.memory_mean = memory_mean
+        self.unique_names = unique_names
+        self._rng = np.random.default_rng(seed)
+        self._spawn_credit = 0.0
+        self._exit_credit = 0.0
+        self._next_pid = 1000
+        # Процессы текущего пользователя тоже нужны, иначе не будет GUI-процессов
+        self._users = self.USERS + (self._current_user(),)
+        self._statuses = [status for status, _ in self.STATUSES]
+        self._status_weights = [weight for _, weight in self.STATUSES]
+        # Неизменные поля процессов: (pid, create_time, name, user, display, parent)
+        self._procs = []
+        self._spawn(count)
+
+    @staticmethod
+    def _current_user() -> str:
+        try:
+            return psutil.Process().username()
+        except Exception:
+            return 'user'
+
+    def _spawn(self, count: int):
+        rng = self._rng
+        names = rng.integers(len(self.NAMES), size=count).tolist()
+        users = rng.integers(len(self._users), size=count).tolist()
+        parents = rng.random(count).tolist()
+        create_time = time.time()
+        procs = self._procs
+        root_share = self.ROOT_SHARE
+        for name, user, parent in zip(names, users, parents):
+            pid = self._next_pid
+            self._next_pid += 1
+            base_name = self.NAMES[name]
+            name = f"{base_name}-{pid}" if self.unique_names else base_name
+            if parent < root_share or not procs:
+                parent = 1
+            else:
+                parent = procs[int((parent - root_share) / (1 - root_share) * len(procs))][0]
+            procs.append((pid, create_time, name, self._users[user], base_name in self.DISPLAY_NAMES, parent))
+
+    def _exit(self, count: int):
+        procs = self._procs
+        chosen = self._rng.choice(len(procs), size=min(count, len(procs)), replace=False)
+        # Удаление перестановкой с последним элементом за O(1); по убыванию
+        # индексов, чтобы перестановки не задевали ещё не удалённые
+        for index in sorted(chosen.tolist(), reverse=True):
+            procs[index] = procs[-1]
+            procs.pop()
+
+    def iter_processes(self, detail: str = DETAIL_FULL, known=()) -> Iterator[Tuple]:
+        """Одно сканирование: сначала смена процессов, затем новые значения загрузки"""
+        self._exit_credit += self.exit_rate
+        exits = int(self._exit_credit)
+        self._exit_credit -= exits
+        self._exit(exits)
+
+        self._spawn_credit += self.spawn_rate
+        spawns = int(self._spawn_credit)
+        self._spawn_credit -= spawns
+        self._spawn(spawns)
+
+        rng = self._rng
+        count = len(self._procs)
+        cpu = np.minimum(rng.exponential(self.cpu_mean, count), 100.0).tolist()
+        # Среднее логнормального распределения exp(mu + sigma^2 / 2) равно memory_mean
+        mu = np.log(self.memory_mean) - self.MEMORY_SIGMA ** 2 / 2
+        memory = np.minimum(rng.lognormal(mu, self.MEMORY_SIGMA, count), 100.0).tolist()
+        statuses = rng.choice(self._statuses, size=count, p=self._status_weights).tolist()
+        alive = {proc[0] for proc in self._procs}
+
+        for (pid, create_time, name, user, display, parent), cpu_value, memory_value, status in zip(
+                self._procs, cpu, memory, statuses):
+            # Сирота переходит к init
+            ppid = parent if parent in alive else 1
+            static = None
+            if (pid, create_time) not in known:
+                exe = f"/usr/bin/{name}"
+                static = {'name': name, 'user': user, 'exe': exe, 'cmdline': (exe,),
+                          'ppid': ppid, 'terminal': False, 'display': display}
+            yield pid, create_time, status, cpu_value, memory_value, ppid, static
+
+
+PROCESS_SOURCES = {
+    PsutilProcessSource.name: PsutilProcessSource,
+    ProcfsProcessSource.name: ProcfsProcessSource,
+    SyntheticProcessSource.name: SyntheticProcessSource,
+}
+
+
+def create_process_source(name: str = 'psutil', **options) -> ProcessSource:
+    """
+    Создаёт источник процессов по имени, при необходимости откатываясь на psutil.
+    options передаются конструктору источника (например, параметры синтетического).
+    """
+    if name not in PROCESS_SOURCES:
+        raise ValueError(f"Unknown process source: {name}")
+    if not PROCESS_SOURCES[name].is_supported():
+        logger.warning(f"Источник процессов '{name}' недоступен, используется источник psutil.")
+        name, options = PsutilProcessSource.name, {}
+    logger.info(f"Используется источник процессов: {name}.")
+    return PROCESS_SOURCES[name](**options)
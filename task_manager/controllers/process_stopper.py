@@ -0,0 +1,50 @@
+# process_stopper.py
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from controllers.process_controller import ProcessController, ProcessTarget
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+class ProcessStopService(QObject):
+    """
+    Массовое завершение процессов вне потока интерфейса.
+
+    ProcessController.stop_processes ждёт завершения процессов секундами,
+    поэтому выполняется в отдельном потоке; итог по каждому PID приходит
+    через сигнал finished. Запросы выполняются по очереди.
+
+    Сигнал испускается из рабочего потока и доставляется в UI через очередь событий.
+    """
+    # Описание запроса, List[StopOutcome]
+    finished = pyqtSignal(str, object)
+
+    def __init__(self, controller: ProcessController):
+        super().__init__()
+        self.controller = controller
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ProcessStopper')
+
+    def stop(self, description: str, targets: List[ProcessTarget], include_children: bool = False,
+             force: bool = False):
+        logger.warning(f"{description}: {len(targets)} процессов "
+                       f"(потомки: {'да' if include_children else 'нет'}, SIGKILL сразу: {'да' if force else 'нет'}).")
+        self._executor.submit(self._run, description, list(targets), include_children, force)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, description, targets, include_children, force):
+        try:
+            outcomes = self.controller.stop_processes(targets, include_children=include_children, force=force)
+        except Exception as e:
+            logger.error(f"Ошибка массового завершения процессов: {e}")
+            outcomes = []
+        for outcome in outcomes:
+            logger.info(f"{description}: PID {outcome.pid} ({outcome.name}) - {outcome.result}"
+                        + (f": {outcome.message}" if outcome.message else ""))
+        self.finished.emit(description, outcomes)
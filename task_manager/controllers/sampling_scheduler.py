@@ -0,0 +1,132 @@
+# sampling_scheduler.py
+
+import math
+import time
+from typing import Dict, List
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+class CollectorSchedule:
+    """Расписание одного сборщика: собственный интервал и бюджет времени на замер"""
+
+    def __init__(self, name: str, interval: float, budget: float, max_interval: float):
+        self.name = name
+        self.base_interval = interval
+        self.interval = interval
+        self.budget = budget
+        self.max_interval = max_interval
+        # Дополнительные замедления, задаваемые извне: причина -> множитель
+        # (например, режим энергосбережения или ограничение собственной нагрузки)
+        self.slowdowns = {}
+        self.next_due = 0.0
+        self.last_cost = 0.0
+
+    @property
+    def slowdown(self) -> float:
+        factor = 1.0
+        for value in self.slowdowns.values():
+            factor *= value
+        return factor
+
+    @property
+    def effective_interval(self) -> float:
+        return self.interval * self.slowdown
+
+
+class SamplingScheduler:
+    """
+    Планировщик сборщиков метрик с независимыми интервалами.
+
+    Время замера каждого сборщика сравнивается с его бюджетом: при
+    превышении интервал удваивается (до max_interval), а когда замер
+    снова укладывается в четверть бюджета - постепенно возвращается
+    к базовому. Сроки выравниваются по общей сетке (начало работы плюс
+    кратное базовому интервалу), поэтому долгий замер одного сборщика не
+    разводит его с остальными по разным пробуждениям. Все моменты
+    времени - time.monotonic().
+    """
+
+    # Имя, базовый интервал (с), бюджет на замер (с), максимальный интервал (с)
+    DEFAULT_SCHEDULES = (
+        ('cpu', 1.0, 0.02, 10.0),
+        ('memory', 1.0, 0.01, 10.0),
+        ('disk', 1.0, 0.02, 10.0),
+        ('network', 1.0, 0.02, 10.0),
+        ('processes', 1.0, 0.25, 30.0),
+        ('overhead', 1.0, 0.01, 10.0),
+    )
+
+    # Допуск, в пределах которого сборщик считается уже подошедшим по сроку (с)
+    DUE_TOLERANCE = 0.05
+
+    def __init__(self, schedules=DEFAULT_SCHEDULES):
+        self.schedules: Dict[str, CollectorSchedule] = {
+            name: CollectorSchedule(name, interval, budget, max_interval)
+            for name, interval, budget, max_interval in schedules
+        }
+        # Начало сетки сроков: первый вызов due() или record()
+        self._origin = None
+
+    def __getitem__(self, name: str) -> CollectorSchedule:
+        return self.schedules[name]
+
+    def due(self, now: float = None) -> List[str]:
+        """Возвращает имена сборщиков, которым пора выполнить замер"""
+        now = time.monotonic() if now is None else now
+        if self._origin is None:
+            self._origin = now
+        # Сборщики, которым пора "почти сейчас", запускаются в том же пробуждении
+        deadline = now + self.DUE_TOLERANCE
+        return [name for name, schedule in self.schedules.items() if schedule.next_due <= deadline]
+
+    def record(self, name: str, cost: float, now: float = None):
+        """Учитывает длительность замера и назначает следующий запуск"""
+        now = time.monotonic() if now is None else now
+        if self._origin is None:
+            self._origin = now
+        schedule = self.schedules[name]
+        schedule.last_cost = cost
+
+        if cost > schedule.budget and schedule.interval < schedule.max_interval:
+            schedule.interval = min(schedule.interval * 2, schedule.max_interval)
+            logger.info(f"Сборщик '{name}' превысил бюджет ({cost * 1000:.1f} мс > "
+                        f"{schedule.budget * 1000:.1f} мс), интервал увеличен до {schedule.interval:.1f} с.")
+        elif cost < schedule.budget / 4 and schedule.interval > schedule.base_interval:
+            schedule.interval = max(schedule.interval / 2, schedule.base_interval)
+            logger.info(f"Сборщик '{name}' укладывается в бюджет, интервал уменьшен до {schedule.interval:.1f} с.")
+
+        # Планируем от предыдущего срока, а не от окончания замера, чтобы
+        # длительность замеров не сдвигала сборщики друг относительно друга
+        next_due = schedule.next_due + schedule.effective_interval
+        if next_due <= now:
+            # Опоздавший сборщик пропускает сроки, но остаётся на сетке вместе с остальными
+            next_due = now
+        schedule.next_due = self._on_grid(schedule, next_due)
+
+    def set_slowdown(self, name: str, factor: float, reason: str = 'default'):
+        """
+        Замедляет сборщик в factor раз независимо от адаптации по бюджету.
+        Замедления от разных причин перемножаются; factor <= 1 снимает замедление.
+        """
+        schedule = self.schedules[name]
+        if factor > 1:
+            schedule.slowdowns[reason] = factor
+        else:
+            schedule.slowdowns.pop(reason, None)
+        # Ускорение вступает в силу сразу, не дожидаясь ранее назначенного запуска
+        if self._origin is not None:
+            schedule.next_due = min(schedule.next_due,
+                                    self._on_grid(schedule, time.monotonic() + schedule.effective_interval))
+
+    def _on_grid(self, schedule: CollectorSchedule, moment: float) -> float:
+        """Первый срок сетки (начало плюс кратное базовому интервалу) не раньше moment"""
+        # Допуск на погрешность сложения float, чтобы срок на сетке не сдвигался на шаг
+        steps = math.ceil((moment - self._origin) / schedule.base_interval - 1e-9)
+        return self._origin + steps * schedule.base_interval
+
+    def time_until_next(self, now: float = None) -> float:
+        """Время в секундах до ближайшего запланированного замера"""
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(schedule.next_due for schedule in self.schedules.values()) - now)
@@ -0,0 +1,85 @@
+# snapshot_collector.py
+
+import time
+from typing import Optional
+
+from controllers.overhead_governor import OverheadGovernor, DEFAULT_CPU_BUDGET_PERCENT
+from controllers.process_controller import ProcessController
+from controllers.sampling_scheduler import SamplingScheduler
+from models.process_records import ProcessRecords
+from models.snapshot import SystemSnapshot, freeze
+from models.system_monitor import SystemMonitor
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+class SnapshotCollector:
+    """
+    Собирает системную статистику и список процессов в один SystemSnapshot.
+
+    Не зависит от Qt: используется фоновым потоком GUI и может
+    переиспользоваться в любом другом окружении.
+    """
+
+    def __init__(self, system_monitor=None, process_controller=None, scheduler=None,
+                 cpu_budget_percent: float = DEFAULT_CPU_BUDGET_PERCENT, rss_budget_mb: float = None):
+        logger.info("Инициализация SnapshotCollector.")
+        self.system_monitor = system_monitor or SystemMonitor()
+        self.process_controller = process_controller or ProcessController()
+        self.scheduler = scheduler or SamplingScheduler()
+        self.governor = OverheadGovernor(self.scheduler, self.process_controller,
+                                         cpu_budget_percent, rss_budget_mb)
+        self._seq = 0
+        # Последний собранный список процессов; переиспользуется, пока не пришло время нового
+        self._processes = ProcessRecords()
+        logger.info("SnapshotCollector инициализирован.")
+
+    def collect(self) -> SystemSnapshot:
+        """Выполняет замер всех сборщиков сразу и возвращает неизменяемый снимок"""
+        for name in self.scheduler.schedules:
+            self._run_collector(name)
+        return self._build_snapshot()
+
+    def collect_due(self) -> Optional[SystemSnapshot]:
+        """
+        Выполняет замер только тех сборщиков, которым пора по расписанию.
+
+        Returns:
+            Optional[SystemSnapshot]: Новый снимок или None, если замеров не было
+        """
+        due = self.scheduler.due()
+        if not due:
+            return None
+        for name in due:
+            self._run_collector(name)
+        return self._build_snapshot()
+
+    def _run_collector(self, name: str):
+        started = time.perf_counter()
+        try:
+            if name == 'processes':
+                self._processes = self.process_controller.get_processes()
+            elif name == 'overhead':
+                self.governor.update()
+            else:
+                self.system_monitor.update(name)
+        finally:
+            # Следующий запуск назначается и при ошибке, иначе сборщик будет вызываться непрерывно
+            self.scheduler.record(name, time.perf_counter() - started)
+
+    def _build_snapshot(self) -> SystemSnapshot:
+        monitor = self.system_monitor
+        self._seq += 1
+        return SystemSnapshot(
+            seq=self._seq,
+            timestamp=time.time(),
+            cpu_percent=monitor.cpu_percent,
+            mem_percent=monitor.mem_percent,
+            cpu_per_core=tuple(monitor.get_cpu_per_core()),
+            memory_info=freeze(monitor.get_memory_info()),
+            disk_info=freeze(monitor.get_disk_info()),
+            network_info=freeze(monitor.get_network_info()),
+            processes=self._processes,
+            overhead=self.governor.last_sample,
+        )
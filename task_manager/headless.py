@@ -0,0 +1,146 @@
+# headless.py
+#
+# Сбор данных без графического интерфейса. Модуль не импортирует PyQt5:
+# снимки строит тот же SnapshotCollector, что и фоновый поток GUI,
+# а результат потоково пишется в JSONL или CSV.
+
+import csv
+import json
+import sys
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+from controllers.overhead_governor import DEFAULT_CPU_BUDGET_PERCENT
+from controllers.process_controller import ProcessController
+from controllers.sampling_scheduler import SamplingScheduler
+from controllers.snapshot_collector import SnapshotCollector
+from models.snapshot import SystemSnapshot
+from models.system_monitor import SystemMonitor
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+SYSTEM_FIELDS = ['timestamp', 'seq', 'cpu_percent', 'mem_percent',
+                 'disk_read_speed', 'disk_write_speed', 'net_send_speed', 'net_receive_speed',
+                 'overhead_cpu_percent', 'overhead_collector_cpu_percent', 'overhead_rss_mb']
+PROCESS_FIELDS = ['timestamp', 'seq', 'pid', 'name', 'user', 'status', 'cpu', 'memory', 'is_gui']
+
+
+def create_collector(process_source='psutil', interval: float = 1.0,
+                     cpu_budget_percent: float = DEFAULT_CPU_BUDGET_PERCENT) -> SnapshotCollector:
+    """Создаёт сборщик, у которого все метрики снимаются с интервалом interval секунд"""
+    scheduler = SamplingScheduler([
+        (name, interval, budget, max(max_interval, interval))
+        for name, _, budget, max_interval in SamplingScheduler.DEFAULT_SCHEDULES
+    ])
+    return SnapshotCollector(SystemMonitor(), ProcessController(process_source), scheduler,
+                             cpu_budget_percent=cpu_budget_percent)
+
+
+def iter_snapshots(collector: SnapshotCollector, count: Optional[int] = None) -> Iterator[SystemSnapshot]:
+    """Генерирует снимки по расписанию сборщика (бесконечно, если count не задан)"""
+    produced = 0
+    while count is None or produced < count:
+        snapshot = collector.collect_due()
+        if snapshot is None:
+            time.sleep(collector.scheduler.time_until_next())
+            continue
+        produced += 1
+        yield snapshot
+
+
+def system_record(snapshot: SystemSnapshot) -> Dict:
+    """Плоская запись системных метрик снимка"""
+    return {
+        'timestamp': snapshot.timestamp,
+        'seq': snapshot.seq,
+        'cpu_percent': snapshot.cpu_percent,
+        'mem_percent': snapshot.mem_percent,
+        'disk_read_speed': snapshot.disk_info['read_speed'],
+        'disk_write_speed': snapshot.disk_info['write_speed'],
+        'net_send_speed': snapshot.network_info['send_speed'],
+        'net_receive_speed': snapshot.network_info['receive_speed'],
+        'overhead_cpu_percent': snapshot.overhead.cpu_percent,
+        'overhead_collector_cpu_percent': snapshot.overhead.collector_cpu_percent,
+        'overhead_rss_mb': snapshot.overhead.rss_mb,
+    }
+
+
+def process_records(snapshot: SystemSnapshot) -> Iterator[Dict]:
+    """Записи процессов снимка"""
+    processes = snapshot.processes
+    for pid, status, cpu, memory, static in zip(processes.pids, processes.statuses, processes.cpu,
+                                                processes.memory, processes.static):
+        yield {
+            'timestamp': snapshot.timestamp,
+            'seq': snapshot.seq,
+            'pid': pid,
+            'name': static.name,
+            'user': static.user,
+            'status': status,
+            'cpu': cpu,
+            'memory': memory,
+            'is_gui': static.is_gui,
+        }
+
+
+def jsonl_lines(snapshots: Iterable[SystemSnapshot], include_processes: bool) -> Iterator[str]:
+    """
+    Одна JSON-строка на снимок; процессы - вложенным списком, только в
+    снимках, где список процессов обновился
+    """
+    last_processes = None
+    for snapshot in snapshots:
+        record = system_record(snapshot)
+        record['per_core'] = list(snapshot.cpu_per_core)
+        if include_processes and snapshot.processes is not last_processes:
+            record['processes'] = list(process_records(snapshot))
+            last_processes = snapshot.processes
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def csv_rows(snapshot: SystemSnapshot, include_processes: bool, last_processes=None) -> Iterable[Dict]:
+    """
+    Строки CSV снимка: системные метрики или (с include_processes) процессы.
+    Процессы обновляются реже системных метрик: если у снимка тот же
+    список, что и у предыдущего (last_processes), строк процессов нет
+    """
+    if not include_processes:
+        return (system_record(snapshot),)
+    return process_records(snapshot) if snapshot.processes is not last_processes else ()
+
+
+def run_headless(output_format: str = 'jsonl', output_path: Optional[str] = None,
+                 include_processes: bool = False, count: Optional[int] = None,
+                 interval: float = 1.0, process_source='psutil',
+                 cpu_budget_percent: float = DEFAULT_CPU_BUDGET_PERCENT) -> int:
+    """Запускает сбор без GUI и пишет снимки в файл или stdout. Возвращает код выхода."""
+    # stdout занят данными, журнал уходит в stderr
+    logger.set_stream(sys.stderr)
+    collector = create_collector(process_source, interval, cpu_budget_percent)
+    snapshots = iter_snapshots(collector, count)
+
+    stream = open(output_path, 'w', newline='', encoding='utf-8') if output_path else sys.stdout
+    try:
+        if output_format == 'csv':
+            writer = csv.DictWriter(stream, fieldnames=PROCESS_FIELDS if include_processes else SYSTEM_FIELDS)
+            writer.writeheader()
+            last_processes = None
+            for snapshot in snapshots:
+                writer.writerows(csv_rows(snapshot, include_processes, last_processes))
+                last_processes = snapshot.processes
+                # Каждый снимок отдаётся потребителю сразу, не накапливаясь в буфере
+                stream.flush()
+        else:
+            for line in jsonl_lines(snapshots, include_processes):
+                stream.write(line)
+                stream.flush()
+    except KeyboardInterrupt:
+        logger.info("Сбор без GUI остановлен пользователем.")
+    except BrokenPipeError:
+        # Потребитель закрыл поток (например, head), это штатное завершение
+        return 0
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
@@ -0,0 +1,53 @@
+# downsampling.py
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int):
+    """
+    Прореживает ряд до threshold точек методом Largest-Triangle-Three-Buckets.
+
+    Точки делятся на threshold - 2 корзины (первая и последняя точки
+    сохраняются всегда), из каждой корзины берётся точка, образующая
+    треугольник наибольшей площади с соседними корзинами, поэтому пики
+    и провалы не сглаживаются, в отличие от усреднения.
+
+    Реализация полностью векторизована: вершиной треугольника со стороны
+    предыдущей корзины служит её среднее, а не ранее выбранная точка, что
+    делает корзины независимыми и убирает цикл Python по корзинам.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Прореженные x и y
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Границы корзин для внутренних точек 1..n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    bucket_ids = np.repeat(np.arange(threshold - 2), sizes)
+
+    # Средние точки корзин, по краям - первая и последняя точки ряда
+    counts = sizes.astype(np.float64)
+    mean_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+    anchor_x = np.concatenate(([x[0]], mean_x, [x[-1]]))
+    anchor_y = np.concatenate(([y[0]], mean_y, [y[-1]]))
+
+    # Для корзины i вершины треугольника - средние корзин i-1 и i+1
+    ax, ay = anchor_x[bucket_ids], anchor_y[bucket_ids]
+    cx, cy = anchor_x[bucket_ids + 2], anchor_y[bucket_ids + 2]
+    bx, by = x[1:n - 1], y[1:n - 1]
+    # Удвоенная площадь треугольника (множитель не влияет на выбор)
+    areas = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+
+    # Индекс точки с максимальной площадью в каждой корзине
+    bucket_max = np.maximum.reduceat(areas, starts - 1)
+    candidates = np.flatnonzero(areas == bucket_max[bucket_ids])
+    _, first = np.unique(bucket_ids[candidates], return_index=True)
+    selected = candidates[first] + 1
+
+    indices = np.concatenate(([0], selected, [n - 1]))
+    return x[indices], y[indices]
@@ -0,0 +1,124 @@
+# hardware_inventory.py
+
+import platform
+
+import psutil
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+class HardwareInventory:
+    """
+    Статические сведения об оборудовании: модель и топология ЦП, объём памяти,
+    диски и сетевые интерфейсы.
+
+    Собираются один раз при первом обращении (или по явному refresh())
+    и разделяются всеми потребителями, поэтому в каждом такте
+    опрашиваются только изменяющиеся счётчики.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(HardwareInventory, cls).__new__(cls)
+            cls._instance.refresh()
+        return cls._instance
+
+    def refresh(self):
+        """Заново собирает сведения об оборудовании"""
+        logger.info("Сбор сведений об оборудовании.")
+        cpu = self._collect_cpu()
+        memory_total = psutil.virtual_memory().total
+        disks = self._collect_disks()
+        network_interfaces = self._collect_network_interfaces()
+
+        # Атрибуты заменяются целиком, чтобы читатели из других потоков
+        # не видели частично обновлённых данных
+        self.cpu = cpu
+        self.memory_total = memory_total
+        self.disks = disks
+        self.network_interfaces = network_interfaces
+        logger.info(f"Сведения об оборудовании собраны: {cpu['name']}, "
+                    f"{cpu['cores']} ядер ({cpu['logical']} логических).")
+
+    @staticmethod
+    def _read_cpuinfo():
+        """Разбирает /proc/cpuinfo в список словарей по логическим процессорам"""
+        processors = []
+        try:
+            with open('/proc/cpuinfo') as f:
+                current = {}
+                for line in f:
+                    if not line.strip():
+                        if current:
+                            processors.append(current)
+                            current = {}
+                        continue
+                    key, _, value = line.partition(':')
+                    current[key.strip()] = value.strip()
+                if current:
+                    processors.append(current)
+        except OSError:
+            pass
+        return processors
+
+    def _collect_cpu(self):
+        processors = self._read_cpuinfo()
+        first = processors[0] if processors else {}
+        cpu_name = first.get('model name') or platform.processor() or platform.machine() or "N/A"
+
+        base_speed_ghz = "N/A"
+        try:
+            # On some systems, psutil.cpu_freq().max gives the max advertised frequency
+            cpu_freq = psutil.cpu_freq()
+            if cpu_freq and cpu_freq.max:
+                base_speed_ghz = f"{(cpu_freq.max / 1000):.2f}" # Format to 2 decimal places
+        except Exception as e:
+            logger.warning(f"Ошибка при получении частоты ЦП: {e}")
+
+        sockets = {p.get('physical id') for p in processors if 'physical id' in p}
+        return {
+            'name': cpu_name,
+            'base_speed': base_speed_ghz,
+            'cores': psutil.cpu_count(logical=False),
+            'logical': psutil.cpu_count(logical=True),
+            'sockets': len(sockets) or 1,
+        }
+
+    @staticmethod
+    def _collect_disks():
+        disks = []
+        try:
+            for part in psutil.disk_partitions(all=False):
+                try:
+                    total = psutil.disk_usage(part.mountpoint).total
+                except OSError:
+                    total = 0
+                disks.append({
+                    'device': part.device,
+                    'mountpoint': part.mountpoint,
+                    'fstype': part.fstype,
+                    'total': total,
+                })
+        except Exception as e:
+            logger.warning(f"Ошибка при получении списка дисков: {e}")
+        return disks
+
+    @staticmethod
+    def _collect_network_interfaces():
+        interfaces = []
+        try:
+            stats = psutil.net_if_stats()
+            addrs = psutil.net_if_addrs()
+            for name, stat in stats.items():
+                interfaces.append({
+                    'name': name,
+                    'is_up': stat.isup,
+                    'speed': stat.speed,  # Мбит/с, 0 если неизвестно
+                    'mtu': stat.mtu,
+                    'addresses': [addr.address for addr in addrs.get(name, [])],
+                })
+        except Exception as e:
+            logger.warning(f"Ошибка при получении сетевых интерфейсов: {e}")
+        return interfaces
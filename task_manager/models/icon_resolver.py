@@ -0,0 +1,292 @@
+# icon_resolver.py
+
+import bisect
+import json
+import os
+import re
+import shlex
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
+
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication, QStyle
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Сопоставление фрагментов имён процессов с иконками темы (резервный способ,
+# если приложение не нашлось среди .desktop файлов)
+ICON_MAPPING = {
+    'chrome': 'google-chrome',
+    'firefox': 'firefox',
+    'nautilus': 'system-file-manager',
+    'code': 'visual-studio-code',
+    'pycharm': 'pycharm',
+    'gedit': 'accessories-text-editor',
+    'libreoffice': 'libreoffice',
+    'thunderbird': 'thunderbird',
+    'discord': 'discord',
+    'spotify': 'spotify-client',
+    'telegram': 'telegram-desktop',
+    'slack': 'slack',
+    'python': 'python',
+    'bash': 'utilities-terminal',
+    'zsh': 'utilities-terminal',
+    'ssh': 'network-wired',
+    'systemd': 'system-run',
+    'dbus': 'system-run',
+    'pipewire': 'audio-card',
+    'pulseaudio': 'audio-card',
+    'gnome': 'gnome',
+    'kde': 'kde',
+    'xdg': 'system-run',
+}
+
+# Каталоги с .desktop файлами (XDG), в порядке убывания приоритета
+DESKTOP_DIRS = (
+    os.path.expanduser('~/.local/share/applications'),
+    os.path.expanduser('~/.local/share/flatpak/exports/share/applications'),
+    '/var/lib/flatpak/exports/share/applications',
+    '/var/lib/snapd/desktop/applications',
+    '/usr/local/share/applications',
+    '/usr/share/applications',
+)
+
+# Длина имени процесса в /proc/[pid]/stat (comm) ограничена 15 символами
+COMM_LENGTH = 15
+
+# Предельный размер кэша разрешённых имён (включая промахи)
+MAX_CACHE_SIZE = 1024
+
+
+def default_cache_path() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'task_manager', 'desktop_icons.json')
+
+
+class DesktopIndex:
+    """
+    Индекс "имя исполняемого файла -> иконка" по .desktop файлам.
+
+    Строится один раз; результат сохраняется на диск вместе с временем
+    изменения каталогов и при следующем запуске загружается без разбора
+    файлов, если ни один каталог не менялся.
+    """
+
+    def __init__(self, dirs=DESKTOP_DIRS, cache_path: Optional[str] = None):
+        self.dirs = tuple(dirs)
+        self.cache_path = cache_path or default_cache_path()
+        self.icons: Dict[str, str] = {}
+        self._sorted_keys: List[str] = []
+
+    def _dir_stamps(self) -> Dict[str, float]:
+        stamps = {}
+        for directory in self.dirs:
+            try:
+                stamps[directory] = os.stat(directory).st_mtime
+            except OSError:
+                continue
+        return stamps
+
+    def load(self):
+        """Загружает индекс с диска или строит его заново"""
+        stamps = self._dir_stamps()
+        icons = self._load_cached(stamps)
+        if icons is None:
+            icons = self._build()
+            self._save(stamps, icons)
+            logger.info(f"Индекс .desktop файлов построен: {len(icons)} приложений.")
+        else:
+            logger.info(f"Индекс .desktop файлов загружен из кэша: {len(icons)} приложений.")
+        self.icons = icons
+        self._sorted_keys = sorted(icons)
+
+    def _load_cached(self, stamps) -> Optional[Dict[str, str]]:
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('dirs') != stamps:
+            return None
+        return data.get('icons')
+
+    def _save(self, stamps, icons):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'dirs': stamps, 'icons': icons}, f)
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить индекс .desktop файлов: {e}")
+
+    def _build(self) -> Dict[str, str]:
+        icons = {}
+        # Каталоги с меньшим приоритетом обрабатываются первыми и перезаписываются
+        for directory in reversed(self.dirs):
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith('.desktop'):
+                        self._index_file(entry.path, entry.name[:-len('.desktop')], icons)
+        return icons
+
+    @staticmethod
+    def _index_file(path: str, stem: str, icons: Dict[str, str]):
+        fields = {}
+        in_entry = False
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('['):
+                        in_entry = line == '[Desktop Entry]'
+                        continue
+                    if in_entry and '=' in line:
+                        key, _, value = line.partition('=')
+                        if key in ('Exec', 'Icon', 'StartupWMClass'):
+                            fields[key] = value.strip()
+        except OSError:
+            return
+
+        icon = fields.get('Icon')
+        if not icon:
+            return
+        keys = {stem.lower()}
+        if stem.count('.') >= 2:
+            # Идентификатор вида org.gnome.Nautilus: процесс обычно называется по последней части
+            keys.add(stem.rsplit('.', 1)[-1].lower())
+        if fields.get('StartupWMClass'):
+            keys.add(fields['StartupWMClass'].lower())
+        executable = DesktopIndex._executable(fields.get('Exec', ''))
+        if executable:
+            keys.add(executable.lower())
+        for key in keys:
+            icons[key] = icon
+
+    @staticmethod
+    def _executable(exec_line: str) -> str:
+        """Имя исполняемого файла из строки Exec (без env, переменных и аргументов)"""
+        try:
+            tokens = shlex.split(exec_line)
+        except ValueError:
+            tokens = exec_line.split()
+        for token in tokens:
+            if token == 'env' or '=' in token:
+                continue
+            return os.path.basename(token)
+        return ''
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Иконка приложения по имени процесса (с учётом усечения comm до 15 символов)"""
+        name = name.lower()
+        icon = self.icons.get(name)
+        if icon is not None or len(name) < COMM_LENGTH:
+            return icon
+        # Усечённое имя: ключи с таким префиксом идут подряд; неоднозначный
+        # префикс (разные иконки у нескольких приложений) не разрешается
+        keys = self._sorted_keys
+        position = bisect.bisect_left(keys, name)
+        icons = set()
+        while position < len(keys) and keys[position].startswith(name):
+            icons.add(self.icons[keys[position]])
+            if len(icons) > 1:
+                return None
+            position += 1
+        return icons.pop() if icons else None
+
+
+class IconResolver:
+    """
+    Поиск иконок процессов по имени.
+
+    Кандидаты: иконка из индекса .desktop файлов, затем иконки всех
+    фрагментов ICON_MAPPING, найденных одним скомпилированным выражением
+    (длинные фрагменты в приоритете); берётся первый кандидат, который
+    есть в теме.
+    Результаты - и найденные иконки, и промахи - хранятся в LRU-кэше
+    ограниченного размера, поэтому повторные имена не ищутся заново.
+    Один экземпляр на приложение.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(IconResolver, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        logger.info("Инициализация IconResolver.")
+        keys = sorted(ICON_MAPPING, key=len, reverse=True)
+        self._matcher = re.compile('|'.join(re.escape(key) for key in keys))
+        self.desktop_index = DesktopIndex()
+        self.desktop_index.load()
+        # Имя процесса -> QIcon или None (промах)
+        self._cache: "OrderedDict[str, Optional[QIcon]]" = OrderedDict()
+        # Иконки темы по имени: несколько процессов часто разделяют одну иконку
+        self._theme_icons: Dict[str, Optional[QIcon]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.default_icon = self._load_default_icon()
+        logger.info("IconResolver инициализирован.")
+
+    @staticmethod
+    def _load_default_icon() -> QIcon:
+        """Иконка-шестерёнка для процессов без собственной иконки"""
+        icon = QIcon.fromTheme("system-run")
+        if icon.isNull():
+            logger.warning("Не удалось загрузить иконку 'system-run'. Попытка использовать SP_ComputerIcon.")
+            # Если тема не предоставляет иконку, создаём простую из ресурсов Qt
+            icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
+            if icon.isNull():
+                logger.critical("Не удалось загрузить стандартную иконку SP_ComputerIcon.")
+        return icon
+
+    def resolve(self, process_name: str) -> Optional[QIcon]:
+        """Возвращает иконку процесса или None, если подходящей нет"""
+        cache = self._cache
+        if process_name in cache:
+            cache.move_to_end(process_name)
+            self.hits += 1
+            return cache[process_name]
+
+        self.misses += 1
+        icon = self._find(process_name)
+        cache[process_name] = icon
+        if len(cache) > MAX_CACHE_SIZE:
+            cache.popitem(last=False)
+        return icon
+
+    def _find(self, process_name: str) -> Optional[QIcon]:
+        for icon_name in self._candidates(process_name):
+            icon = self._load_icon(icon_name)
+            if icon is not None:
+                return icon
+        return None
+
+    def _candidates(self, process_name: str) -> Iterator[str]:
+        """Имена иконок в порядке приоритета"""
+        icon_name = self.desktop_index.lookup(process_name)
+        if icon_name is not None:
+            yield icon_name
+        fragments = {match.group() for match in self._matcher.finditer(process_name.lower())}
+        for fragment in sorted(fragments, key=len, reverse=True):
+            yield ICON_MAPPING[fragment]
+
+    def _load_icon(self, icon_name: str) -> Optional[QIcon]:
+        if icon_name not in self._theme_icons:
+            icon = None
+            try:
+                # В .desktop файле иконка может быть задана абсолютным путём
+                if os.path.isabs(icon_name):
+                    if os.path.isfile(icon_name):
+                        icon = QIcon(icon_name)
+                elif QIcon.hasThemeIcon(icon_name):
+                    icon = QIcon.fromTheme(icon_name)
+            except Exception as e:
+                logger.warning(f"Ошибка при попытке загрузить иконку '{icon_name}': {e}")
+            self._theme_icons[icon_name] = icon if icon is not None and not icon.isNull() else None
+        return self._theme_icons[icon_name]
@@ -0,0 +1,155 @@
+# metric_history.py
+
+import threading
+import time
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+from models.ring_buffer import RingBuffer
+
+
+class HistoryWindow(NamedTuple):
+    """Срез истории метрики для отображения"""
+    seconds_ago: np.ndarray  # Возраст каждой точки в секундах (от старых к новым)
+    values: np.ndarray       # Значения (для агрегатов - среднее за интервал)
+    peaks: np.ndarray        # Максимумы (для исходных отсчётов совпадают с values)
+    maximum: float           # Максимум за окно (для агрегатов - по максимумам интервалов)
+
+
+class RawTier:
+    """Уровень с исходными отсчётами"""
+
+    def __init__(self, capacity: int):
+        self.times = RingBuffer(capacity)
+        self.values = RingBuffer(capacity)
+
+    def add(self, timestamp: float, value: float):
+        self.times.push(timestamp)
+        self.values.push(value)
+
+    def window(self, since: float):
+        times = self.times.values()
+        start = np.searchsorted(times, since)
+        values = self.values.values()[start:]
+        return times[start:], values, values
+
+
+class RollupTier:
+    """
+    Уровень агрегатов avg/max за интервалы bucket_seconds.
+
+    Агрегаты накапливаются инкрементально: каждый отсчёт обновляет текущий
+    интервал, завершённый интервал записывается в кольцевые буферы.
+    Максимумы сохраняют короткие всплески, которые среднее сглаживает.
+    """
+
+    def __init__(self, bucket_seconds: int, capacity: int):
+        self.bucket_seconds = bucket_seconds
+        self.retention = bucket_seconds * capacity
+        self.times = RingBuffer(capacity)
+        self.avgs = RingBuffer(capacity)
+        self.maxs = RingBuffer(capacity)
+        self._bucket = None
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def add(self, timestamp: float, value: float):
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket != self._bucket:
+            self._flush()
+            self._bucket = bucket
+            self._max = value
+        elif value > self._max:
+            self._max = value
+        self._count += 1
+        self._sum += value
+
+    def _flush(self):
+        if self._count:
+            self.times.push((self._bucket + 1) * self.bucket_seconds)
+            self.avgs.push(self._sum / self._count)
+            self.maxs.push(self._max)
+        self._count = 0
+        self._sum = 0.0
+
+    def window(self, since: float):
+        times = self.times.values()
+        start = np.searchsorted(times, since)
+        times, avgs, maxs = times[start:], self.avgs.values()[start:], self.maxs.values()[start:]
+        if self._count:
+            # Незавершённый интервал добавляем последней точкой, чтобы окно не отставало
+            times = np.append(times, self._bucket * self.bucket_seconds + self.bucket_seconds)
+            avgs = np.append(avgs, self._sum / self._count)
+            maxs = np.append(maxs, self._max)
+        return times, avgs, maxs
+
+
+class MetricHistory:
+    """
+    Многоуровневая история метрик с ограниченным объёмом памяти:
+    исходные отсчёты за 16 минут (при секундном периоде),
+    агрегаты по 10 с за час и по 60 с за сутки.
+
+    Запись выполняет фоновый сборщик, чтение - UI, поэтому доступ
+    к уровням защищён блокировкой.
+    """
+    RAW_CAPACITY = 960
+    ROLLUPS = ((10, 360), (60, 1440))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, list] = {}
+        self._last_timestamp = None
+
+    def _tiers(self, metric: str) -> list:
+        tiers = self._metrics.get(metric)
+        if tiers is None:
+            tiers = [RawTier(self.RAW_CAPACITY)]
+            tiers.extend(RollupTier(bucket, capacity) for bucket, capacity in self.ROLLUPS)
+            self._metrics[metric] = tiers
+        return tiers
+
+    def record(self, values: Dict[str, float], timestamp: float = None):
+        """Добавляет отсчёт для нескольких метрик с общей отметкой времени"""
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            self._last_timestamp = timestamp
+            for metric, value in values.items():
+                for tier in self._tiers(metric):
+                    tier.add(timestamp, value)
+
+    def window(self, metric: str, span_seconds: float, now: float = None) -> HistoryWindow:
+        """
+        Возвращает точки метрики за последние span_seconds секунд из самого
+        подробного уровня, который покрывает этот период целиком.
+        """
+        with self._lock:
+            tiers = self._metrics.get(metric)
+            if not tiers:
+                empty = np.empty(0)
+                return HistoryWindow(empty, empty, empty, 0.0)
+            now = self._last_timestamp if now is None else now
+            tier = self._select_tier(tiers, span_seconds)
+            times, values, maxs = tier.window(now - span_seconds)
+
+        maximum = float(maxs.max()) if len(maxs) else 0.0
+        return HistoryWindow(np.maximum(now - times, 0.0), values, maxs, maximum)
+
+    @staticmethod
+    def _select_tier(tiers, span_seconds):
+        raw = tiers[0]
+        times = raw.times
+        if len(times) == times.capacity:
+            # Буфер заполнен: исходные отсчёты покрывают только период от самого старого
+            values = times.values()
+            raw_retention = values[-1] - values[0]
+        else:
+            raw_retention = float('inf')
+        if span_seconds <= raw_retention:
+            return raw
+        for tier in tiers[1:]:
+            if span_seconds <= tier.retention:
+                return tier
+        return tiers[-1]
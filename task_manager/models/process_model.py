@@ -1,220 +1,412 @@
-from PyQt5.QtWidgets import QStyle
-from PyQt5.QtCore import Qt, QSortFilterProxyModel
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
+import time
+from contextlib import contextmanager
+from operator import itemgetter
+
+import numpy as np
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QAbstractTableModel, QAbstractItemModel, QModelIndex
 
 # Импортируем наш логгер
 from utils.loggerService.logger import logger
+from models.icon_resolver import IconResolver
+from models.process_search import ProcessSearchIndex
 
 
-class ProcessTableModel(QStandardItemModel):
-    def __init__(self):
-        super().__init__()
-        logger.info("Инициализация ProcessTableModel.")
-        self.setHorizontalHeaderLabels(["", "Имя", "PID", "ЦП", "Память", "Статус", "Пользователь"])
-        self.process_icons = {}
-        self.current_pids = set()
-
-        # Загружаем стандартную иконку-шестерёнку
-        self.default_icon = QIcon.fromTheme("system-run")  # Или другой подходящий вариант
-        if self.default_icon.isNull():
-            logger.warning("Не удалось загрузить иконку 'system-run'. Попытка использовать SP_ComputerIcon.")
-            # Если тема не предоставляет иконку, создаём простую из ресурсов Qt
-            self.default_icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
-            if self.default_icon.isNull():
-                 logger.critical("Не удалось загрузить стандартную иконку SP_ComputerIcon.")
+# Колонки таблицы процессов
+COL_ICON, COL_NAME, COL_PID, COL_CPU, COL_MEMORY, COL_STATUS, COL_USER = range(7)
+COLUMN_HEADERS = ["", "Имя", "PID", "ЦП", "Память", "Статус", "Пользователь"]
 
-        logger.info("ProcessTableModel инициализирована.")
+# Роль с "сырым" значением ячейки (числа без форматирования)
+SORT_ROLE = Qt.UserRole + 1
+# Роль со временем создания процесса: вместе с PID однозначно определяет процесс
+CREATE_TIME_ROLE = Qt.UserRole + 2
 
+# Текстовые колонки сортируются без учёта регистра
+_TEXT_SORT_COLUMNS = (COL_ICON, COL_NAME, COL_STATUS, COL_USER)
 
-    def update_data(self, gui_procs, bg_procs):
-        """Обновляет данные модели на основе списков процессов"""
-        # logger.debug("Начало обновления данных модели процессов.")
-        new_pids = {str(proc['pid']) for proc in gui_procs + bg_procs}
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Табличная модель процессов, хранящая данные по колонкам.
 
-        # Удаление исчезнувших процессов
-        self.remove_disappeared_processes(new_pids)
+    Каждая колонка - отдельный список, строка процесса находится через
+    постоянный индекс pid -> row. Такт обновления применяется пакетно:
+    исчезнувшие процессы удаляются непрерывными диапазонами, новые
+    вставляются одной операцией, а изменения значений сообщаются одним
+    dataChanged на колонку. Процесс определяется парой (pid, create_time):
+    строка с переиспользованным PID удаляется и вставляется заново, чтобы
+    не остались имя, пользователь и иконка прежнего процесса.
 
-        # Обновление или добавление процессов
-        all_procs = gui_procs + bg_procs
-        existing_rows = self.get_existing_rows()
+    Сортирует сама модель (sort/apply_sort): порядок строк вычисляется
+    numpy.argsort по колонке значений, и колонки переставляются целиком -
+    без вызовов data() на каждое сравнение, как в QSortFilterProxyModel.
+    """
 
-        for proc in all_procs:
-            pid = str(proc['pid'])
-            if pid in existing_rows:
-                self.update_row(existing_rows[pid], proc)
-            else:
-                self.add_row(proc, pid in {str(p['pid']) for p in gui_procs})
+    def __init__(self):
+        super().__init__()
+        logger.info("Инициализация ProcessTableModel.")
+        self.icon_resolver = IconResolver()
+
+        # Данные по колонкам
+        self._pids = []
+        self._create_times = []
+        self._names = []
+        self._cpu = []
+        self._memory = []
+        self._status = []
+        self._users = []
+        self._icons = []
+        self._row_by_pid = {}
+        # Колонка -> список сырых значений для SORT_ROLE и сортировки
+        self._sort_values = {
+            COL_ICON: self._names,
+            COL_NAME: self._names,
+            COL_PID: self._pids,
+            COL_CPU: self._cpu,
+            COL_MEMORY: self._memory,
+            COL_STATUS: self._status,
+            COL_USER: self._users,
+        }
 
-        self.current_pids = new_pids
-        # logger.debug("Данные модели процессов обновлены.")
+        # Колонка и порядок сортировки (-1 - строки в порядке добавления)
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        # Порядок мог нарушиться: изменились значения колонки сортировки или добавлены строки
+        self._sort_dirty = False
 
+        # Стандартная иконка-шестерёнка
+        self.default_icon = self.icon_resolver.default_icon
 
-    def remove_disappeared_processes(self, new_pids):
-        """Удаляет процессы, которые больше не существуют"""
-        # logger.debug("Проверка и удаление исчезнувших процессов.")
-        removed_count = 0
-        for row in reversed(range(self.rowCount())):
-            if self.item(row, 2).text() not in new_pids:
-                pid_to_remove = self.item(row, 2).text()
-                self.removeRow(row)
-                # logger.debug(f"Удален процесс с PID {pid_to_remove}.")
-                removed_count += 1
-        # if removed_count > 0:
-            # logger.info(f"Удалено {removed_count} исчезнувших процессов.")
-
-
-    def get_existing_rows(self):
-        """Возвращает словарь {pid: row} для существующих процессов"""
-        # logger.debug("Получение словаря существующих строк.")
-        existing_rows = {self.item(row, 2).text(): row for row in range(self.rowCount())}
-        # logger.debug(f"Найдено {len(existing_rows)} существующих процессов в модели.")
-        return existing_rows
-
-    def add_row(self, proc, is_app):
-        """Добавляет новую строку с информацией о процессе"""
-        pid = proc.get('pid', 0)
-        name = proc.get('name', 'N/A')
-        # logger.debug(f"Попытка добавить процесс PID: {pid}, Имя: {name}.")
-        try:
-            icon_item = self.create_icon_item(name if is_app else None)
-            name_item = QStandardItem(name)
-            pid_item = QStandardItem(str(pid))
-            cpu_item = QStandardItem(f"{proc.get('cpu', 0):.1f}%")
-            mem_item = QStandardItem(f"{proc.get('memory', 0):.1f}%")
-            status_item = QStandardItem(proc.get('status', 'N/A'))
-            user_item = QStandardItem(proc.get('user', 'N/A'))
+        logger.info("ProcessTableModel инициализирована.")
 
+    def _columns(self):
+        return (self._pids, self._create_times, self._names, self._cpu, self._memory,
+                self._status, self._users, self._icons)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(COLUMN_HEADERS):
+            return COLUMN_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == Qt.DisplayRole:
+            # Форматирование выполняется только для запрошенных (видимых) ячеек
+            if column == COL_NAME:
+                return self._names[row]
+            if column == COL_PID:
+                return str(self._pids[row])
+            if column == COL_CPU:
+                return f"{self._cpu[row]:.1f}%"
+            if column == COL_MEMORY:
+                return f"{self._memory[row]:.1f}%"
+            if column == COL_STATUS:
+                return self._status[row]
+            if column == COL_USER:
+                return self._users[row]
+            return None
+
+        if role == SORT_ROLE:
+            return self._sort_values[column][row]
+
+        if role == CREATE_TIME_ROLE:
+            return self._create_times[row]
+
+        if role == Qt.DecorationRole and column == COL_ICON:
+            return self._icons[row]
+
+        if role == Qt.TextAlignmentRole and column >= COL_PID:
             # Центрирование текста для числовых колонок
-            for item in [pid_item, cpu_item, mem_item, status_item, user_item]:
-                item.setTextAlignment(Qt.AlignCenter)
-
-            # Добавление в начало для GUI процессов, в конец для фоновых
-            if is_app:
-                self.insertRow(0, [icon_item, name_item, pid_item, cpu_item, mem_item, status_item, user_item])
-                logger.debug(f"Добавлен GUI процесс PID: {pid}, Имя: {name}.")
-            else:
-                self.appendRow([icon_item, name_item, pid_item, cpu_item, mem_item, status_item, user_item])
-                # logger.debug(f"Добавлен фоновый процесс PID: {pid}, Имя: {name}.")
-
-        except Exception as e:
-            logger.error(f"Ошибка при добавлении процесса PID {pid} ({name}): {e}")
-
-
-    def create_icon_item(self, process_name):
-        """Создает элемент с иконкой процесса"""
-        icon_item = QStandardItem()
-        if process_name:
-            icon = self.get_process_icon(process_name)
-            if not icon.isNull():
-                icon_item.setIcon(icon)
-                # logger.debug(f"Иконка для '{process_name}' найдена и установлена.")
-            else:
-                # Устанавливаем иконку-шестерёнку по умолчанию
-                icon_item.setIcon(self.default_icon)
-                # logger.debug(f"Иконка для '{process_name}' не найдена, использована иконка по умолчанию.")
-            icon_item.setText("")  # Убираем текст полностью
-        else:
-            # Для процессов без имени тоже используем шестерёнку
-            icon_item.setIcon(self.default_icon)
-            icon_item.setText("")
-            # logger.debug("Иконка для процесса без имени установлена по умолчанию.")
-        return icon_item
-
-    def get_process_icon(self, process_name):
-        """Возвращает иконку для процесса по его имени"""
-        if process_name in self.process_icons:
-            # logger.debug(f"Иконка для '{process_name}' найдена в кэше.")
-            return self.process_icons[process_name]
-
-        # Расширенное сопоставление имен процессов с иконками
-        icon_mapping = {
-            'chrome': 'google-chrome',
-            'firefox': 'firefox',
-            'nautilus': 'system-file-manager',
-            'code': 'visual-studio-code',
-            'pycharm': 'pycharm',
-            'gedit': 'accessories-text-editor',
-            'libreoffice': 'libreoffice',
-            'thunderbird': 'thunderbird',
-            'discord': 'discord',
-            'spotify': 'spotify-client',
-            'telegram': 'telegram-desktop',
-            'slack': 'slack',
-            'python': 'python',
-            'python3': 'python',
-            'python3.12': 'python',
-            'bash': 'utilities-terminal',
-            'zsh': 'utilities-terminal',
-            'ssh': 'network-wired',
-            'systemd': 'system-run',
-            'dbus': 'system-run',
-            'pipewire': 'audio-card',
-            'pulseaudio': 'audio-card',
-            'gnome': 'gnome',
-            'kde': 'kde',
-            'xdg': 'system-run'
-        }
-
-        name_lower = process_name.lower()
-        for key, icon_name in icon_mapping.items():
-            if key in name_lower:
-                try:
-                    icon = QIcon.fromTheme(icon_name)
-                    if not icon.isNull():
-                        self.process_icons[process_name] = icon
-                        # logger.debug(f"Иконка '{icon_name}' для '{process_name}' найдена в теме.")
-                        return icon
-                except Exception as e:
-                    logger.warning(f"Ошибка при попытке загрузить иконку '{icon_name}' для '{process_name}': {e}")
-                    continue
-
-        # Если иконка не найдена, возвращаем пустую иконку
-        # (метод create_icon_item подставит шестерёнку)
-        # logger.debug(f"Иконка для '{process_name}' не найдена по сопоставлению.")
-        return QIcon()
-
-    def update_row(self, row, proc):
-        """Обновляет данные в существующей строке"""
-        pid = self.item(row, 2).text()
-        # logger.debug(f"Попытка обновить процесс PID: {pid}.")
+            return Qt.AlignCenter
+
+        return None
+
+    def update_data(self, records):
+        """Обновляет данные модели по снимку процессов (ProcessRecords)"""
+        pids = records.pids
+        statics = records.static
+
+        # Удаление исчезнувших процессов и строк с переиспользованными PID
+        self.remove_disappeared_processes(dict(zip(pids, records.create_times)))
+
+        # Обновление существующих строк, сбор индексов новых процессов
+        row_by_pid = self._row_by_pid
+        cpu, memory, status = self._cpu, self._memory, self._status
+        cpu_rows, memory_rows, status_rows = [], [], []
+        new_gui, new_bg = [], []
+        for i, (pid, cpu_value, memory_value, status_value) in enumerate(
+                zip(pids, records.cpu, records.memory, records.statuses)):
+            row = row_by_pid.get(pid)
+            if row is None:
+                (new_gui if statics[i].is_gui else new_bg).append(i)
+                continue
+            if cpu[row] != cpu_value:
+                cpu[row] = cpu_value
+                cpu_rows.append(row)
+            if memory[row] != memory_value:
+                memory[row] = memory_value
+                memory_rows.append(row)
+            if status[row] != status_value:
+                status[row] = status_value
+                status_rows.append(row)
+
+        # Один сигнал dataChanged на колонку, покрывающий все изменённые строки
+        for column, rows in ((COL_CPU, cpu_rows), (COL_MEMORY, memory_rows), (COL_STATUS, status_rows)):
+            if rows:
+                self.dataChanged.emit(self.index(min(rows), column), self.index(max(rows), column),
+                                      [Qt.DisplayRole])
+                if column == self._sort_column:
+                    self._sort_dirty = True
+
+        # Добавление в начало для GUI процессов, в конец для фоновых
+        if new_gui:
+            self.insert_rows(0, records, new_gui, True)
+            for i in new_gui:
+                logger.debug(f"Добавлен GUI процесс PID: {pids[i]}, Имя: {statics[i].name}.")
+        if new_bg:
+            self.insert_rows(len(self._pids), records, new_bg, False)
+
+    def remove_disappeared_processes(self, alive):
+        """
+        Удаляет непрерывными диапазонами процессы, которых нет в alive
+        (pid -> create_time), включая строки, чей PID занят новым процессом
+        """
+        pids, create_times = self._pids, self._create_times
+        row = len(pids) - 1
+        removed_count = 0
+        while row >= 0:
+            if alive.get(pids[row]) == create_times[row]:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and alive.get(pids[row]) != create_times[row]:
+                row -= 1
+            first = row + 1
+
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for column in self._columns():
+                del column[first:last + 1]
+            self.endRemoveRows()
+            removed_count += last - first + 1
+
+        if removed_count:
+            self._rebuild_index()
+
+    def pid_at(self, row: int) -> int:
+        return self._pids[row]
+
+    def _rebuild_index(self):
+        self._row_by_pid = {pid: row for row, pid in enumerate(self._pids)}
+
+    def insert_rows(self, position, records, indices, is_app):
+        """Вставляет процессы records с номерами indices одной операцией начиная со строки position"""
+        count = len(indices)
+        statics = [records.static[i] for i in indices]
+        self.beginInsertRows(QModelIndex(), position, position + count - 1)
         try:
-            self.item(row, 3).setText(f"{proc.get('cpu', 0):.1f}%")
-            self.item(row, 4).setText(f"{proc.get('memory', 0):.1f}%")
-            self.item(row, 5).setText(proc.get('status', 'N/A'))
-            # logger.debug(f"Процесс PID {pid} обновлен успешно.")
-        except Exception as e:
-            logger.error(f"Ошибка при обновлении процесса PID {pid}: {e}")
+            self._pids[position:position] = [records.pids[i] for i in indices]
+            self._create_times[position:position] = [records.create_times[i] for i in indices]
+            self._names[position:position] = [static.name for static in statics]
+            self._cpu[position:position] = [records.cpu[i] for i in indices]
+            self._memory[position:position] = [records.memory[i] for i in indices]
+            self._status[position:position] = [records.statuses[i] for i in indices]
+            self._users[position:position] = [static.user for static in statics]
+            self._icons[position:position] = [self.create_icon(static.name if is_app else None)
+                                              for static in statics]
+        finally:
+            self.endInsertRows()
+        self._sort_dirty = True
+
+        if position == len(self._pids) - count:
+            # Добавление в конец не сдвигает существующие строки
+            for row in range(position, position + count):
+                self._row_by_pid[self._pids[row]] = row
+        else:
+            self._rebuild_index()
+
+    @property
+    def sort_column(self) -> int:
+        return self._sort_column
+
+    @property
+    def sort_order(self) -> Qt.SortOrder:
+        return self._sort_order
+
+    @property
+    def needs_resort(self) -> bool:
+        """Удаление строк порядок не нарушает, поэтому пересортировка нужна не каждый такт"""
+        return self._sort_dirty and self._sort_column >= 0
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.apply_sort()
+
+    def apply_sort(self) -> bool:
+        """Упорядочивает строки по текущей колонке сортировки; True, если порядок изменился"""
+        self._sort_dirty = False
+        count = len(self._pids)
+        if self._sort_column < 0 or count < 2:
+            return False
+        order = self._sort_permutation()
+        if np.array_equal(order, np.arange(count)):
+            return False
+
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        persistent = self.persistentIndexList()
+        take = itemgetter(*order.tolist())
+        for column in self._columns():
+            # Присваивание срезу сохраняет сами списки: на них ссылается _sort_values
+            column[:] = take(column)
+        # Новая строка для каждой старой
+        new_rows = np.empty(count, dtype=np.intp)
+        new_rows[order] = np.arange(count)
+        self.changePersistentIndexList(persistent, [
+            self.index(int(new_rows[index.row()]), index.column()) for index in persistent])
+        self._rebuild_index()
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        return True
+
+    def _sort_permutation(self) -> np.ndarray:
+        """Устойчивая перестановка строк: равные значения сохраняют текущий порядок"""
+        values = self._sort_values[self._sort_column]
+        if self._sort_column in _TEXT_SORT_COLUMNS:
+            keys = np.array([value.lower() for value in values])
+        else:
+            keys = np.array(values)
+        if self._sort_order == Qt.AscendingOrder:
+            return np.argsort(keys, kind='stable')
+        # По убыванию устойчиво: сортировка перевёрнутого массива, затем обратный порядок
+        reversed_order = np.argsort(keys[::-1], kind='stable')[::-1]
+        return len(keys) - 1 - reversed_order
+
+    def create_icon(self, process_name):
+        """Возвращает иконку процесса или шестерёнку по умолчанию"""
+        if process_name:
+            icon = self.icon_resolver.resolve(process_name)
+            if icon is not None:
+                return icon
+        # Для процессов без имени и без найденной иконки используем шестерёнку
+        return self.default_icon
 
 
 class ProcessSortFilterProxyModel(QSortFilterProxyModel):
-    """Прокси-модель для сортировки и фильтрации процессов"""
-
-    def __init__(self):
+    """
+    Прокси-модель для сортировки и фильтрации процессов.
+
+    Сортировку выполняет исходная ProcessTableModel: sort() прокси передаёт
+    колонку модели, а сам прокси сохраняет порядок её строк. Динамическая
+    пересортировка отключена: модель применяет снимок целиком внутри
+    update_transaction(), и строки пересортировываются и перефильтровываются
+    один раз по его завершении (или реже, если задан resort_interval_ms) -
+    только если за такт изменились значения колонки сортировки или
+    добавились строки.
+
+    Поиск (set_search_query) фильтрует строки по множеству PID из индекса
+    ProcessSearchIndex. Поля поиска не меняются за время жизни процесса,
+    поэтому по тактам строки не перефильтровываются: индекс обновляется
+    разницей снимков в update_search(), а новые строки проверяются по
+    множеству при вставке. Исключение - запрос, заданный до первого
+    снимка: строки перефильтровываются, когда появятся совпадения.
+    """
+
+    def __init__(self, resort_interval_ms: int = 0):
         super().__init__()
         logger.info("Инициализация ProcessSortFilterProxyModel.")
-        self.setDynamicSortFilter(True)
-        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+        self.setDynamicSortFilter(False)
+
+        self.resort_interval_ms = resort_interval_ms
+        self.sort_count = 0
+        self._last_resort = None
+        self._update_depth = 0
+
+        # Индекс поиска строится при первом запросе и дальше обновляется по тактам
+        self.search_index = None
+        self._search_query = ''
+        self._search_matches = None
+        self._search_records = None
+        # Запрос задан, но снимка для поиска ещё не было: фильтр применится после update_search
+        self._search_pending = False
         logger.info("ProcessSortFilterProxyModel инициализирована.")
 
-
-    def lessThan(self, left, right):
-        """Кастомная сортировка для числовых колонок"""
-        column = left.column()
-
-        # Специальная обработка для колонок с процентами (ЦП и Память)
-        if column in (3, 4):  # Колонки ЦП и Памяти
-            try:
-                left_value = float(left.data().replace('%', ''))
-                right_value = float(right.data().replace('%', ''))
-                # logger.debug(f"Сортировка числовых значений в колонке {column}.")
-                return left_value < right_value
-            except ValueError:
-                logger.warning(f"Ошибка преобразования значений в колонке {column} для сортировки.")
-                # Fallback to default comparison if conversion fails
-                pass
-
-        # Стандартная сортировка для остальных колонок
-        # logger.debug(f"Стандартная сортировка в колонке {column}.")
-        return super().lessThan(left, right)
\ No newline at end of file
+    def set_resort_interval(self, interval_ms: int):
+        """Задаёт минимальный интервал между пересортировками по тактам (0 - каждый такт)"""
+        self.resort_interval_ms = max(0, interval_ms)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # QSortFilterProxyModel.sort сравнивает строки через data() исходной модели,
+        # по два вызова Python на сравнение; модель сортирует свои колонки сама
+        self.sort_count += 1
+        self._last_resort = time.monotonic()
+        self.sourceModel().sort(column, order)
+
+    @contextmanager
+    def update_transaction(self):
+        """Объединяет все изменения исходной модели за такт в одну пересортировку"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                self._finish_update()
+
+    def set_search_query(self, query: str):
+        """Задаёт поисковый запрос (см. parse_query) и перефильтровывает строки; пустой - без фильтра"""
+        self._search_query = query.strip()
+        self._search_matches = None
+        if self._search_query and self._search_records is not None:
+            self._refresh_search()
+        self._search_pending = bool(self._search_query) and self._search_matches is None
+        # Полная перестройка отображения строк: invalidateFilter() вставляет и удаляет
+        # строки интервалами, что на десятках тысяч строк в разы медленнее
+        self.invalidate()
+
+    def search_match_count(self) -> int:
+        return len(self._search_matches) if self._search_matches is not None else 0
+
+    def update_search(self, records):
+        """Обновляет результаты поиска по снимку; вызывается до применения снимка к модели"""
+        self._search_records = records
+        if self._search_query:
+            self._refresh_search()
+
+    def _refresh_search(self):
+        if self.search_index is None:
+            self.search_index = ProcessSearchIndex()
+        self.search_index.update(self._search_records)
+        self._search_matches = self.search_index.search(self._search_query)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        matches = self._search_matches
+        if matches is None:
+            return super().filterAcceptsRow(source_row, source_parent)
+        return self.sourceModel().pid_at(source_row) in matches
+
+    def _has_filter(self) -> bool:
+        return bool(self.filterRegExp().pattern())
+
+    def _finish_update(self):
+        # Поиск сюда не входит: совпадения существующих строк не меняются между тактами
+        if self._has_filter():
+            self.invalidateFilter()
+        if self._search_pending and self._search_matches is not None:
+            # Первые совпадения запроса, заданного до снимка: показанные строки ещё не отфильтрованы
+            self._search_pending = False
+            self.invalidate()
+
+        source = self.sourceModel()
+        if not source.needs_resort:
+            return
+        if self._last_resort is not None and self.resort_interval_ms > 0:
+            elapsed_ms = (time.monotonic() - self._last_resort) * 1000
+            if elapsed_ms < self.resort_interval_ms:
+                return
+        self.sort(source.sort_column, source.sort_order)
@@ -0,0 +1,35 @@
+# process_records.py
+
+from typing import Any, Sequence, Tuple
+
+
+class ProcessRecords:
+    """
+    Список процессов за одно сканирование в виде столбцов (struct of arrays).
+
+    Вместо словаря на каждый процесс снимок хранит по одному кортежу на поле;
+    i-й элемент каждого столбца относится к одному процессу. Неизменные
+    атрибуты (имя, пользователь, exe, cmdline, классификация) не копируются:
+    static[i] - общий для всех сканирований StaticProcessInfo процесса.
+    После создания столбцы не изменяются, поэтому снимок можно передавать
+    между потоками.
+    """
+    __slots__ = ('pids', 'create_times', 'statuses', 'cpu', 'memory', 'ppids', 'static')
+
+    def __init__(self, pids: Sequence[int] = (), create_times: Sequence[float] = (),
+                 statuses: Sequence[str] = (), cpu: Sequence[float] = (),
+                 memory: Sequence[float] = (), ppids: Sequence[int] = (), static: Sequence[Any] = ()):
+        self.pids: Tuple[int, ...] = tuple(pids)
+        self.create_times: Tuple[float, ...] = tuple(create_times)
+        self.statuses: Tuple[str, ...] = tuple(statuses)
+        self.cpu: Tuple[float, ...] = tuple(cpu)
+        self.memory: Tuple[float, ...] = tuple(memory)
+        # Текущий родитель (в отличие от static[i].ppid - родителя при появлении)
+        self.ppids: Tuple[int, ...] = tuple(ppids)
+        self.static: Tuple[Any, ...] = tuple(static)
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def gui_count(self) -> int:
+        return sum(1 for static in self.static if static.is_gui)
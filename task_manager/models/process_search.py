@@ -0,0 +1,206 @@
+# process_search.py
+
+import bisect
+import re
+from itertools import compress
+from operator import ne
+from typing import Dict, List, NamedTuple, Optional, Set
+
+# Поля поиска и их имена в запросе вида field:value
+SEARCH_FIELDS = ('name', 'user', 'cmd')
+FIELD_ALIASES = {'name': 'name', 'user': 'user', 'cmd': 'cmd', 'cmdline': 'cmd'}
+
+# Длина n-грамм индекса подстрок
+NGRAM = 3
+# Сколько символов командной строки индексируется (длинные аргументы не ищутся)
+MAX_INDEXED_LENGTH = 256
+
+# Слова для поиска по префиксу: последовательности букв и цифр
+_TOKEN = re.compile(r'\w+')
+
+
+class SearchTerm(NamedTuple):
+    """Одно условие запроса: все условия запроса должны выполняться"""
+    field: Optional[str]    # None - любое поле
+    value: str
+    prefix: bool            # value* - слово, начинающееся с value
+
+
+def parse_query(query: str) -> List[SearchTerm]:
+    """
+    Разбирает запрос: слова через пробел, каждое - подстрока без учёта регистра.
+
+        firefox         подстрока в имени, пользователе или командной строке
+        user:root       условие только для поля (name, user, cmd/cmdline)
+        pyth*           слово, начинающееся с "pyth"
+        cmd:--port*     можно сочетать
+    """
+    terms = []
+    for word in query.lower().split():
+        field = None
+        name, sep, value = word.partition(':')
+        if sep and name in FIELD_ALIASES and value:
+            field, word = FIELD_ALIASES[name], value
+        prefix = word.endswith('*') and len(word) > 1
+        if prefix:
+            word = word.rstrip('*')
+            # Префикс, не являющийся словом (с разделителями), ищется как подстрока
+            prefix = _TOKEN.fullmatch(word) is not None
+        if word:
+            terms.append(SearchTerm(field, word, prefix))
+    return terms
+
+
+class _FieldIndex:
+    """
+    Индекс одного поля. Одинаковые тексты (имена, пользователи, командные
+    строки) у многих процессов, поэтому n-граммы (для подстрок) и слова
+    (для префиксов) ссылаются на различные тексты, а текст - на PID.
+    """
+
+    def __init__(self):
+        # pid -> текст и текст -> множество PID
+        self.texts: Dict[int, str] = {}
+        self.pids: Dict[str, Set[int]] = {}
+        self.grams: Dict[str, Set[str]] = {}
+        self.tokens: Dict[str, Set[str]] = {}
+        # Отсортированные слова для поиска префикса; None - нужно пересобрать
+        self._sorted_tokens: Optional[List[str]] = []
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        if len(text) < NGRAM:
+            # Короткий текст индексируется целиком, чтобы находиться по коротким запросам
+            return {text} if text else set()
+        return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+    def add(self, pid: int, text: str):
+        self.texts[pid] = text
+        pids = self.pids.get(text)
+        if pids is not None:
+            pids.add(pid)
+            return
+        self.pids[text] = {pid}
+        for index, keys in ((self.grams, self._grams(text)), (self.tokens, set(_TOKEN.findall(text)))):
+            for key in keys:
+                postings = index.get(key)
+                if postings is None:
+                    index[key] = {text}
+                    if index is self.tokens:
+                        self._sorted_tokens = None
+                else:
+                    postings.add(text)
+
+    def remove(self, pid: int):
+        text = self.texts.pop(pid, None)
+        if text is None:
+            return
+        pids = self.pids[text]
+        pids.discard(pid)
+        if pids:
+            return
+        del self.pids[text]
+        for index, keys in ((self.grams, self._grams(text)), (self.tokens, set(_TOKEN.findall(text)))):
+            for key in keys:
+                postings = index[key]
+                postings.discard(text)
+                if not postings:
+                    del index[key]
+                    if index is self.tokens:
+                        self._sorted_tokens = None
+
+    def _collect(self, texts) -> Set[int]:
+        pids = self.pids
+        return set().union(*(pids[text] for text in texts))
+
+    def substring(self, value: str) -> Set[int]:
+        if len(value) < NGRAM:
+            # Короткий запрос: объединяем n-граммы, которые его содержат
+            texts = set().union(*(postings for gram, postings in self.grams.items() if value in gram))
+            return self._collect(texts)
+        # Пересечение множеств всех n-грамм запроса, начиная с самого короткого
+        postings = sorted((self.grams.get(value[i:i + NGRAM], set())
+                           for i in range(len(value) - NGRAM + 1)), key=len)
+        texts = postings[0].intersection(*postings[1:])
+        if len(value) > NGRAM:
+            # n-граммы могут совпасть в разных местах текста - проверяем подстроку
+            texts = [text for text in texts if value in text]
+        return self._collect(texts)
+
+    def prefix(self, value: str) -> Set[int]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self.tokens)
+        keys = self._sorted_tokens
+        start = bisect.bisect_left(keys, value)
+        # Все слова с префиксом value идут подряд, начиная с start
+        end = bisect.bisect_left(keys, value + '\uffff', start)
+        texts = set().union(*(self.tokens[key] for key in keys[start:end]))
+        return self._collect(texts)
+
+
+class ProcessSearchIndex:
+    """
+    Поисковый индекс процессов по имени, пользователю и командной строке.
+
+    Тексты приводятся к нижнему регистру один раз при появлении процесса;
+    подстроки ищутся пересечением множеств триграмм, префиксы - двоичным
+    поиском по отсортированным словам; одинаковые тексты индексируются
+    один раз. update() применяет разницу со
+    снимком прошлого такта: индексируются только новые процессы (ключ
+    (pid, create_time)), завершившиеся удаляются - поля поиска за время
+    жизни процесса не меняются.
+    """
+
+    def __init__(self):
+        self._fields = {field: _FieldIndex() for field in SEARCH_FIELDS}
+        # pid -> create_time проиндексированного процесса
+        self._keys: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, records):
+        """Приводит индекс к снимку процессов (ProcessRecords)"""
+        keys = self._keys
+        # Номера новых процессов (PID не проиндексирован или с другим create_time) без цикла Python
+        added = list(compress(range(len(records.pids)),
+                              map(ne, map(keys.get, records.pids), records.create_times)))
+        stale = keys.keys() - set(records.pids)
+        # Переиспользованный PID: старый документ удаляется перед добавлением нового
+        stale.update(records.pids[i] for i in added if records.pids[i] in keys)
+        for pid in stale:
+            self._remove(pid)
+        for i in added:
+            self._add(records.pids[i], records.create_times[i], records.static[i])
+
+    def _add(self, pid: int, create_time: float, static):
+        self._keys[pid] = create_time
+        fields = self._fields
+        fields['name'].add(pid, static.name.lower())
+        fields['user'].add(pid, static.user.lower())
+        fields['cmd'].add(pid, ' '.join(static.cmdline)[:MAX_INDEXED_LENGTH].lower())
+
+    def _remove(self, pid: int):
+        del self._keys[pid]
+        for index in self._fields.values():
+            index.remove(pid)
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """
+        Возвращает PID процессов, подходящих под запрос (см. parse_query),
+        или None для пустого запроса (фильтр не задан)
+        """
+        terms = parse_query(query)
+        if not terms:
+            return None
+        result = None
+        for term in terms:
+            fields = [term.field] if term.field else SEARCH_FIELDS
+            matches = set()
+            for field in fields:
+                index = self._fields[field]
+                matches |= index.prefix(term.value) if term.prefix else index.substring(term.value)
+            result = matches if result is None else result & matches
+            if not result:
+                break
+        return result
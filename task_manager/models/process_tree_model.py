@@ -0,0 +1,446 @@
+from operator import attrgetter
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+from models.icon_resolver import IconResolver
+from models.process_model import SORT_ROLE, CREATE_TIME_ROLE
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+# Колонки дерева процессов
+(TREE_COL_NAME, TREE_COL_PID, TREE_COL_CPU, TREE_COL_TREE_CPU, TREE_COL_MEMORY,
+ TREE_COL_TREE_MEMORY, TREE_COL_STATUS, TREE_COL_USER) = range(8)
+TREE_COLUMN_HEADERS = ["Имя", "PID", "ЦП", "ЦП (с потомками)", "Память", "Память (с потомками)",
+                       "Статус", "Пользователь"]
+
+# Колонка -> атрибут узла с сырым значением (для SORT_ROLE и сортировки)
+TREE_SORT_ATTRS = {
+    TREE_COL_NAME: 'sort_name',
+    TREE_COL_PID: 'pid',
+    TREE_COL_CPU: 'cpu',
+    TREE_COL_TREE_CPU: 'total_cpu',
+    TREE_COL_MEMORY: 'memory',
+    TREE_COL_TREE_MEMORY: 'total_memory',
+    TREE_COL_STATUS: 'status',
+    TREE_COL_USER: 'user',
+}
+
+# Атрибуты, которые меняются от такта к такту: сортировка по ним требует
+# пересортировки ветвей с изменёнными значениями
+_DYNAMIC_SORT_ATTRS = frozenset(('cpu', 'total_cpu', 'memory', 'total_memory', 'status'))
+
+
+class _Node:
+    """Узел дерева процессов; на него указывает internalPointer индексов модели"""
+    __slots__ = ('pid', 'create_time', 'parent', 'children', 'row', 'name', 'sort_name', 'user',
+                 'status', 'cpu', 'memory', 'total_cpu', 'total_memory', 'acc_cpu', 'acc_memory', 'icon', 'seq', 'dirty')
+
+    def __init__(self, pid=None, create_time=0.0, parent=None):
+        self.pid = pid
+        self.create_time = create_time
+        self.parent = parent
+        self.children = []
+        self.row = 0
+        self.name = self.sort_name = self.user = self.status = ''
+        self.cpu = self.memory = self.total_cpu = self.total_memory = 0.0
+        # Накопитель сумм потомков на время прохода _aggregate
+        self.acc_cpu = self.acc_memory = 0.0
+        self.icon = None
+        # Позиция в порядке обхода (родитель всегда меньше потомков)
+        self.seq = 0
+        # Собственные значения изменились в этом такте
+        self.dirty = False
+
+
+class ProcessTreeModel(QAbstractItemModel):
+    """
+    Дерево процессов по связям ppid.
+
+    Индекс родитель -> потомки не перестраивается каждый такт, а правится
+    по разнице со снимком прошлого такта: завершившиеся поддеревья
+    удаляются, новые процессы добавляются к родителям, процессы со
+    сменившимся родителем (сироты, перешедшие к init или subreaper)
+    переносятся через beginMoveRows, сохраняя выделение и раскрытые узлы.
+    Процесс, чей родитель не виден в снимке, становится корнем.
+
+    Суммы ЦП и памяти по поддеревьям пересчитываются одним проходом снизу
+    вверх по порядку "родитель раньше потомков", который обновляется
+    только при изменении структуры. Сигналы dataChanged и пересортировка
+    затрагивают только ветви, в которых что-то изменилось.
+    """
+
+    def __init__(self):
+        super().__init__()
+        logger.info("Инициализация ProcessTreeModel.")
+        self.icon_resolver = IconResolver()
+        self.default_icon = self.icon_resolver.default_icon
+        self._root = _Node()
+        # pid -> узел
+        self._nodes = {}
+        # Все узлы в порядке "родитель раньше потомков" (по возрастанию seq)
+        self._order = []
+        self._order_valid = True
+        self._next_seq = 0
+        # Ветви, в которые добавлялись узлы: нуждаются в пересортировке
+        self._dirty_branches = set()
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        logger.info("ProcessTreeModel инициализирована.")
+
+    # --- Интерфейс QAbstractItemModel ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = parent.internalPointer() if parent.isValid() else self._root
+        if 0 <= row < len(node.children) and 0 <= column < len(TREE_COLUMN_HEADERS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._root.children)
+        if parent.column() > 0:
+            return 0
+        return len(parent.internalPointer().children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(TREE_COLUMN_HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self.rowCount(parent) > 0
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(TREE_COLUMN_HEADERS):
+            return TREE_COLUMN_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node, column = index.internalPointer(), index.column()
+
+        if role == Qt.DisplayRole:
+            if column == TREE_COL_NAME:
+                return node.name
+            if column == TREE_COL_PID:
+                return str(node.pid)
+            if column == TREE_COL_CPU:
+                return f"{node.cpu:.1f}%"
+            if column == TREE_COL_TREE_CPU:
+                return f"{node.total_cpu:.1f}%"
+            if column == TREE_COL_MEMORY:
+                return f"{node.memory:.1f}%"
+            if column == TREE_COL_TREE_MEMORY:
+                return f"{node.total_memory:.1f}%"
+            if column == TREE_COL_STATUS:
+                return node.status
+            if column == TREE_COL_USER:
+                return node.user
+            return None
+
+        if role == SORT_ROLE:
+            return getattr(node, TREE_SORT_ATTRS[column])
+
+        if role == CREATE_TIME_ROLE:
+            return node.create_time
+
+        if role == Qt.DecorationRole and column == TREE_COL_NAME:
+            return node.icon
+
+        if role == Qt.TextAlignmentRole and TREE_COL_PID <= column < TREE_COL_STATUS:
+            return Qt.AlignCenter
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Сортирует потомков каждого узла; порядок сохраняется при обновлениях"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0:
+            return
+        parents = [self._root] + [node for node in self._nodes.values() if node.children]
+        self._sort_branches(parents)
+
+    # --- Обновление по снимку ---
+
+    def update_data(self, records):
+        """Применяет снимок процессов (ProcessRecords) к дереву"""
+        nodes = self._nodes
+        root = self._root
+        pids = records.pids
+        alive = set(pids)
+
+        new_indices = []
+        # Узел -> pid нового родителя (None - корень)
+        moves = {}
+        replaced = set()
+        for i, (pid, create_time, ppid, cpu, memory, status) in enumerate(zip(
+                pids, records.create_times, records.ppids, records.cpu, records.memory, records.statuses)):
+            node = nodes.get(pid)
+            if node is None or node.create_time != create_time:
+                # Новый процесс или переиспользованный PID
+                if node is not None:
+                    replaced.add(pid)
+                new_indices.append(i)
+                continue
+            if node.cpu != cpu or node.memory != memory or node.status != status:
+                node.cpu, node.memory, node.status = cpu, memory, status
+                node.dirty = True
+            parent_pid = ppid if ppid in alive and ppid != pid else None
+            if parent_pid != node.parent.pid:
+                moves[node] = parent_pid
+
+        removed = [node for pid, node in nodes.items() if pid not in alive or pid in replaced]
+        for pid in replaced:
+            # Потомки остаются у того же PID, но это уже другой узел
+            for child in nodes[pid].children:
+                moves.setdefault(child, pid)
+        if removed:
+            self._remove_nodes(removed, moves)
+        if new_indices:
+            self._insert_nodes(records, new_indices, alive)
+        pending = list(moves.items())
+        while pending:
+            # Перенос в узел, который пока в поддереве переносимого, откладываем:
+            # другие переносы этого снимка могут его оттуда вывести
+            deferred = []
+            for node, parent_pid in pending:
+                parent = nodes.get(parent_pid, root) if parent_pid is not None else root
+                if self._is_ancestor(node, parent):
+                    deferred.append((node, parent_pid))
+                else:
+                    self._move_node(node, parent)
+            if len(deferred) == len(pending):
+                # Цикл ppid в самом снимке - один из узлов цикла в корень
+                node, _ = deferred.pop(0)
+                self._move_node(node, root)
+            pending = deferred
+
+        self._emit_changes(self._aggregate())
+
+    def _remove_nodes(self, removed, moves):
+        """Удаляет поддеревья завершившихся процессов; выжившие потомки переносятся заранее"""
+        nodes = self._nodes
+        removed_set = set(map(id, removed))
+        for node in removed:
+            for child in list(node.children):
+                if id(child) in removed_set:
+                    continue
+                # Сразу к новому родителю, если он уже в дереве, иначе временно в корень
+                # (окончательный перенос - после добавления новых процессов)
+                target = nodes.get(moves.get(child))
+                if target is not None and id(target) not in removed_set:
+                    self._move_node(child, target)
+                    del moves[child]
+                else:
+                    self._move_node(child, self._root)
+
+        # Удаляем только верхние узлы удаляемых поддеревьев, по родителям
+        by_parent = {}
+        for node in removed:
+            if id(node.parent) not in removed_set:
+                by_parent.setdefault(node.parent, []).append(node.row)
+        for parent, rows in by_parent.items():
+            parent_index = self._index_of(parent)
+            rows.sort()
+            # Непрерывные диапазоны с конца, чтобы номера оставшихся строк не сдвигались
+            end = len(rows) - 1
+            while end >= 0:
+                start = end
+                while start > 0 and rows[start - 1] == rows[start] - 1:
+                    start -= 1
+                self.beginRemoveRows(parent_index, rows[start], rows[end])
+                del parent.children[rows[start]:rows[end] + 1]
+                self._renumber(parent, rows[start])
+                self.endRemoveRows()
+                end = start - 1
+
+        for node in removed:
+            if nodes.get(node.pid) is node:
+                del nodes[node.pid]
+            node.parent = None
+            node.children = []
+        # Удаление не нарушает порядок оставшихся узлов
+        self._order = [node for node in self._order if node.parent is not None]
+
+    def _insert_nodes(self, records, indices, alive):
+        """Добавляет новые процессы: сначала родителей, затем их потомков"""
+        nodes = self._nodes
+        root = self._root
+        pending = indices
+        while pending:
+            by_parent = {}
+            waiting = []
+            pending_pids = {records.pids[i] for i in pending}
+            for i in pending:
+                pid, ppid = records.pids[i], records.ppids[i]
+                if ppid == pid or ppid not in alive:
+                    parent = root
+                elif ppid in pending_pids:
+                    # Родитель тоже новый: добавим в следующем проходе
+                    waiting.append(i)
+                    continue
+                else:
+                    parent = nodes.get(ppid, root)
+                by_parent.setdefault(parent, []).append(i)
+            if not by_parent:
+                # Цикл среди новых процессов (не бывает при согласованном снимке) - в корень
+                by_parent[root] = waiting
+                waiting = []
+
+            for parent, parent_indices in by_parent.items():
+                first = len(parent.children)
+                self.beginInsertRows(self._index_of(parent), first, first + len(parent_indices) - 1)
+                for row, i in enumerate(parent_indices, first):
+                    node = self._create_node(records, i, parent)
+                    node.row = row
+                    # Родитель уже в порядке обхода, новый узел - в конец
+                    node.seq = self._next_seq
+                    self._next_seq += 1
+                    self._order.append(node)
+                    parent.children.append(node)
+                    nodes[node.pid] = node
+                self.endInsertRows()
+                self._dirty_branches.add(parent)
+            pending = waiting
+
+    def _create_node(self, records, i, parent) -> _Node:
+        static = records.static[i]
+        node = _Node(records.pids[i], records.create_times[i], parent)
+        node.name = static.name
+        node.sort_name = static.name.lower()
+        node.user = static.user
+        node.status = records.statuses[i]
+        node.cpu = records.cpu[i]
+        node.memory = records.memory[i]
+        icon = self.icon_resolver.resolve(static.name) if static.is_gui else None
+        node.icon = icon if icon is not None else self.default_icon
+        return node
+
+    def _move_node(self, node, parent):
+        """Переносит узел со всем поддеревом к другому родителю"""
+        if node.parent is parent or node.parent is None:
+            return
+        # Перенос в собственного потомка образовал бы цикл
+        if self._is_ancestor(node, parent):
+            parent = self._root
+        if node.parent is parent:
+            return
+
+        source = node.parent
+        destination_row = len(parent.children)
+        self.beginMoveRows(self._index_of(source), node.row, node.row, self._index_of(parent), destination_row)
+        del source.children[node.row]
+        self._renumber(source, node.row)
+        node.parent = parent
+        node.row = destination_row
+        parent.children.append(node)
+        self.endMoveRows()
+        self._dirty_branches.add(parent)
+        # Порядок сохраняется, если новый родитель идёт раньше узла (его
+        # поддерево и так после узла); иначе порядок перестраивается
+        if parent is not self._root and parent.seq > node.seq:
+            self._order_valid = False
+
+    @staticmethod
+    def _is_ancestor(node, other) -> bool:
+        """Является ли node предком other (или им самим)"""
+        while other is not None:
+            if other is node:
+                return True
+            other = other.parent
+        return False
+
+    def _aggregate(self):
+        """
+        Суммы ЦП и памяти по поддеревьям за один проход снизу вверх.
+
+        В обратном порядке обхода каждый узел посещается после всех своих
+        потомков: к этому моменту в acc_* накоплены их суммы, узел забирает
+        их, обнуляет накопитель и передаёт свою сумму родителю.
+
+        Returns:
+            dict: Родитель -> [первая, последняя] строки потомков, у которых
+            изменились собственные значения или суммы
+        """
+        if not self._order_valid:
+            self._rebuild_order()
+        ranges = {}
+        for node in reversed(self._order):
+            total_cpu = node.cpu + node.acc_cpu
+            total_memory = node.memory + node.acc_memory
+            node.acc_cpu = node.acc_memory = 0.0
+            parent = node.parent
+            parent.acc_cpu += total_cpu
+            parent.acc_memory += total_memory
+            if node.dirty or total_cpu != node.total_cpu or total_memory != node.total_memory:
+                node.dirty = False
+                node.total_cpu, node.total_memory = total_cpu, total_memory
+                row = node.row
+                rows = ranges.get(parent)
+                if rows is None:
+                    ranges[parent] = [row, row]
+                elif row < rows[0]:
+                    rows[0] = row
+                elif row > rows[1]:
+                    rows[1] = row
+        self._root.acc_cpu = self._root.acc_memory = 0.0
+        return ranges
+
+    def _rebuild_order(self):
+        order = []
+        stack = list(reversed(self._root.children))
+        while stack:
+            node = stack.pop()
+            node.seq = len(order)
+            order.append(node)
+            stack.extend(reversed(node.children))
+        self._order = order
+        self._next_seq = len(order)
+        self._order_valid = True
+
+    def _emit_changes(self, ranges):
+        """dataChanged по одному диапазону строк на затронутую ветвь, пересортировка этих ветвей"""
+        for parent, (first, last) in ranges.items():
+            self.dataChanged.emit(self.createIndex(first, TREE_COL_CPU, parent.children[first]),
+                                  self.createIndex(last, TREE_COL_STATUS, parent.children[last]),
+                                  [Qt.DisplayRole])
+        if self._sort_column < 0:
+            self._dirty_branches.clear()
+            return
+        branches = self._dirty_branches
+        if TREE_SORT_ATTRS[self._sort_column] in _DYNAMIC_SORT_ATTRS:
+            branches.update(ranges)
+        if branches:
+            self._sort_branches([parent for parent in branches if parent is self._root or parent.parent is not None])
+            branches.clear()
+
+    def _sort_branches(self, parents):
+        key = attrgetter(TREE_SORT_ATTRS[self._sort_column])
+        reverse = self._sort_order == Qt.DescendingOrder
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        persistent = self.persistentIndexList()
+        for parent in parents:
+            parent.children.sort(key=key, reverse=reverse)
+            self._renumber(parent)
+        self.changePersistentIndexList(persistent, [
+            self.createIndex(index.internalPointer().row, index.column(), index.internalPointer())
+            for index in persistent])
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+
+    def _index_of(self, node):
+        if node is self._root or node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    @staticmethod
+    def _renumber(parent, start=0):
+        children = parent.children
+        for row in range(start, len(children)):
+            children[row].row = row
@@ -0,0 +1,40 @@
+# ring_buffer.py
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер фиксированной ёмкости на массиве NumPy.
+
+    Хранит последние capacity значений метрики; запись не выделяет
+    память, значения отдаются одним массивом от старого к новому.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("RingBuffer capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._head = 0  # Индекс следующей записи
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, value):
+        """Добавляет значение, вытесняя самое старое при заполнении"""
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def values(self) -> np.ndarray:
+        """Возвращает хранимые значения от старого к новому (копия)"""
+        if self._size < self.capacity:
+            return self._data[:self._size].copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
@@ -0,0 +1,30 @@
+# snapshot.py
+
+from types import MappingProxyType
+from typing import Any, NamedTuple, Tuple, Mapping
+
+from models.process_records import ProcessRecords
+
+
+class SystemSnapshot(NamedTuple):
+    """
+    Неизменяемый снимок состояния системы за один такт сбора.
+
+    Создаётся фоновым сборщиком и передаётся в UI целиком, поэтому
+    все вложенные коллекции доступны только для чтения.
+    """
+    seq: int
+    timestamp: float
+    cpu_percent: float
+    mem_percent: float
+    cpu_per_core: Tuple[float, ...]
+    memory_info: Mapping
+    disk_info: Mapping
+    network_info: Mapping
+    processes: ProcessRecords
+    overhead: Any  # OverheadSample - собственная нагрузка приложения
+
+
+def freeze(mapping) -> Mapping:
+    """Возвращает представление словаря только для чтения"""
+    return MappingProxyType(dict(mapping))
@@ -1,85 +1,112 @@
 # system_monitor.py
 
+import time
+
 import psutil
-import platform # Import platform for potentially getting CPU name differently
+from models.hardware_inventory import HardwareInventory
+from models.metric_history import MetricHistory
 
 # Импортируем наш логгер
 from utils.loggerService.logger import logger
 
 
 class SystemMonitor:
+    # Метрики, которые снимает каждый сборщик (используются планировщиком)
+    COLLECTORS = ('cpu', 'memory', 'disk', 'network')
+
     def __init__(self):
         logger.info("Инициализация SystemMonitor.")
         self.cpu_percent = 0
         self.mem_percent = 0
+        self.memory = psutil.virtual_memory()
+        self.disk_usage = None
         self.disk_io = psutil.disk_io_counters()
         self.net_io = psutil.net_io_counters()
         self.prev_disk_io = self.disk_io
         self.prev_net_io = self.net_io
+        # Моменты (time.monotonic) последних замеров счётчиков диска и сети
+        self.disk_io_time = self.net_io_time = time.monotonic()
         # Добавляем хранилище для загрузки по ядрам
         self.cpu_per_core = []
         # Store initial network stats to calculate total sent/received
-        self.initial_net_io = psutil.net_io_counters()
+        self.initial_net_io = self.net_io
+        # Скорости диска (MB/s) и сети (Mbps) за последний замер
+        self.disk_read_speed = 0.0
+        self.disk_write_speed = 0.0
+        self.net_send_speed = 0.0
+        self.net_receive_speed = 0.0
+        # Многоуровневая история метрик для графиков
+        self.history = MetricHistory()
+        self.hardware = HardwareInventory()
         logger.info("SystemMonitor инициализирован.")
 
 
     def update_stats(self):
+        """Обновляет все метрики сразу (без планировщика)"""
         # logger.debug("Обновление статистики системы.")
+        for name in self.COLLECTORS:
+            self.update(name)
+        # Возвращаем общую загрузку ЦП и памяти
+        return self.cpu_percent, self.mem_percent
+
+    def update(self, collector: str):
+        """Снимает метрики одного сборщика ('cpu', 'memory', 'disk' или 'network')"""
         try:
-            self.cpu_percent = psutil.cpu_percent(percpu=False) # Общая загрузка
-            self.cpu_per_core = psutil.cpu_percent(percpu=True) # Загрузка по ядрам
-            self.mem_percent = psutil.virtual_memory().percent
-
-            # Update disk and network stats
-            self.prev_disk_io = self.disk_io
-            self.prev_net_io = self.net_io
-            self.disk_io = psutil.disk_io_counters()
-            self.net_io = psutil.net_io_counters()
-
-            # logger.debug("Статистика системы успешно обновлена.")
-            # Возвращаем общую загрузку ЦП и памяти
-            return self.cpu_percent, self.mem_percent
+            getattr(self, f'update_{collector}')()
         except Exception as e:
-            logger.error(f"Ошибка при обновлении статистики системы: {e}")
-            return 0, 0 # Return default values on error
+            logger.error(f"Ошибка при обновлении статистики системы ({collector}): {e}")
+
+    def update_cpu(self):
+        self.cpu_percent = psutil.cpu_percent(percpu=False) # Общая загрузка
+        self.cpu_per_core = psutil.cpu_percent(percpu=True) # Загрузка по ядрам
+        values = {'cpu': self.cpu_percent}
+        for i, core_usage in enumerate(self.cpu_per_core):
+            values[f'cpu_core_{i}'] = core_usage
+        self.history.record(values)
+
+    def update_memory(self):
+        self.memory = psutil.virtual_memory()
+        self.mem_percent = self.memory.percent
+        self.history.record({'memory': self.mem_percent})
+
+    def update_disk(self):
+        now = time.monotonic()
+        self.prev_disk_io = self.disk_io
+        self.disk_io = psutil.disk_io_counters()
+        self.disk_usage = psutil.disk_usage('/')
+        # Скорость считается по реально прошедшему времени, а не по номинальному интервалу
+        time_delta = now - self.disk_io_time
+        self.disk_io_time = now
+        if time_delta > 0 and self.disk_io and self.prev_disk_io:
+            # Calculate speed in MB/s
+            self.disk_read_speed = (self.disk_io.read_bytes - self.prev_disk_io.read_bytes) / (1024 ** 2) / time_delta
+            self.disk_write_speed = (self.disk_io.write_bytes - self.prev_disk_io.write_bytes) / (1024 ** 2) / time_delta
+        self.history.record({'disk_read': self.disk_read_speed, 'disk_write': self.disk_write_speed}, now)
+
+    def update_network(self):
+        now = time.monotonic()
+        self.prev_net_io = self.net_io
+        self.net_io = psutil.net_io_counters()
+        time_delta = now - self.net_io_time
+        self.net_io_time = now
+        if time_delta > 0:
+            # Calculate speed in Mbps
+            self.net_send_speed = (self.net_io.bytes_sent - self.prev_net_io.bytes_sent) * 8 / (1024 ** 2) / time_delta
+            self.net_receive_speed = (self.net_io.bytes_recv - self.prev_net_io.bytes_recv) * 8 / (1024 ** 2) / time_delta
+        self.history.record({'net_sent': self.net_send_speed, 'net_received': self.net_receive_speed}, now)
 
     # Добавляем новый метод для получения загрузки по ядрам
     def get_cpu_per_core(self):
         return self.cpu_per_core
 
     def get_cpu_info(self):
-        # logger.debug("Получение информации о ЦП.")
-        cpu_name = platform.processor() if platform.processor() else "N/A"
-        # Try to get base speed more robustly
-        base_speed_ghz = "N/A"
-        try:
-            # On some systems, psutil.cpu_freq().max gives the max advertised frequency
-            # On others, it might be the current max or dynamic.
-            # Let's try to get it and format it.
-            cpu_freq = psutil.cpu_freq()
-            if cpu_freq and cpu_freq.max:
-                 base_speed_ghz = f"{(cpu_freq.max / 1000):.2f}" # Format to 2 decimal places
-                 # logger.debug(f"Определена базовая частота ЦП: {base_speed_ghz} GHz.")
-            else:
-                 # logger.debug("Не удалось определить базовую частоту ЦП.")
-                 pass
-        except Exception as e:
-            logger.warning(f"Ошибка при получении частоты ЦП: {e}")
-            pass # Keep "N/A" if it fails
-
-        cpu_info = {
-            'name': cpu_name,
-            'base_speed': base_speed_ghz,
-            'cores': psutil.cpu_count(logical=False),
-            'logical': psutil.cpu_count(logical=True)
-        }
-        # logger.debug(f"Информация о ЦП получена: {cpu_info}")
-        return cpu_info
+        # Статические сведения о ЦП собираются один раз в HardwareInventory
+        return dict(self.hardware.cpu)
 
     def get_memory_info(self):
         # logger.debug("Получение информации о памяти.")
         try:
-            mem = psutil.virtual_memory()
+            mem = self.memory
             memory_info = {
                 'used': mem.used / (1024 ** 3),
                 'total': mem.total / (1024 ** 3),
@@ -99,19 +126,12 @@ class SystemMonitor:
     def get_disk_info(self):
         # logger.debug("Получение информации о диске.")
         try:
-            disk_usage = psutil.disk_usage('/')
-            # Calculate speed in MB/s
-            time_delta = 1.0 # Assuming update_stats is called every second
-            read_speed = (self.disk_io.read_bytes - self.prev_disk_io.read_bytes) / (1024 ** 2) / time_delta
-            write_speed = (self.disk_io.write_bytes - self.prev_disk_io.write_bytes) / (1024 ** 2) / time_delta
-
-
             disk_info = {
-                'usage_percent': disk_usage.percent,
+                'usage_percent': self.disk_usage.percent if self.disk_usage else 0,
                 'active_time': 0, # psutil does not directly provide active time easily
                 'response_time': 0, # psutil does not directly provide response time easily
-                'read_speed': read_speed,
-                'write_speed': write_speed
+                'read_speed': self.disk_read_speed,
+                'write_speed': self.disk_write_speed
             }
             # logger.debug(f"Информация о диске получена: {disk_info}")
             return disk_info
@@ -125,14 +145,6 @@ class SystemMonitor:
     def get_network_info(self):
         # logger.debug("Получение информации о сети.")
         try:
-            # Calculate speed in Mbps
-            time_delta = 1.0 # Assuming update_stats is called every second
-            send_speed_bytes = (self.net_io.bytes_sent - self.prev_net_io.bytes_sent) / time_delta
-            receive_speed_bytes = (self.net_io.bytes_recv - self.prev_net_io.bytes_recv) / time_delta
-
-            send_speed_mbps = (send_speed_bytes * 8) / (1024 ** 2)
-            receive_speed_mbps = (receive_speed_bytes * 8) / (1024 ** 2)
-
             # Calculate total sent and received in MB
             total_sent_mb = (self.net_io.bytes_sent - self.initial_net_io.bytes_sent) / (1024 ** 2)
             total_received_mb = (self.net_io.bytes_recv - self.initial_net_io.bytes_recv) / (1024 ** 2)
@@ -141,8 +153,8 @@ class SystemMonitor:
             network_info = {
                 'sent': total_sent_mb,
                 'received': total_received_mb,
-                'send_speed': send_speed_mbps,
-                'receive_speed': receive_speed_mbps,
+                'send_speed': self.net_send_speed,
+                'receive_speed': self.net_receive_speed,
                 # Network usage percent is hard to define universally without knowing link speed.
                 # We can calculate a hypothetical usage based on a common speed, but it's not accurate.
                 # Let's remove usage_percent or provide a placeholder.
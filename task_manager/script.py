@@ -1,19 +1,88 @@
+# Отсчёт времени запуска начинается с первого импорта
+from utils.startup_timer import startup_timer
+
 import sys
-from PyQt5.QtWidgets import QApplication
+import argparse
 # Импортируем наш логгер
 from utils.loggerService.logger import logger
 
-from views.main_window import TaskManagerWindow
+from controllers.overhead_governor import DEFAULT_CPU_BUDGET_PERCENT
+from controllers.process_sources import PROCESS_SOURCES, SyntheticProcessSource, create_process_source
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Диспетчер задач")
+    parser.add_argument("--process-source", choices=sorted(PROCESS_SOURCES), default="psutil",
+                        help="Источник списка процессов (procfs - прямое чтение /proc, только Linux; "
+                             "synthetic - генерируемые процессы для нагрузочной проверки)")
+    parser.add_argument("--cpu-budget", type=float, default=DEFAULT_CPU_BUDGET_PERCENT,
+                        help="Бюджет нагрузки потока сбора данных на ЦП, %% одного ядра")
+
+    synthetic = parser.add_argument_group("Синтетический источник процессов")
+    synthetic.add_argument("--synthetic-count", type=int, default=1000, help="Начальное число процессов")
+    synthetic.add_argument("--synthetic-spawn-rate", type=float, default=0.0,
+                           help="Новых процессов за сканирование")
+    synthetic.add_argument("--synthetic-exit-rate", type=float, default=0.0,
+                           help="Завершившихся процессов за сканирование")
+    synthetic.add_argument("--synthetic-cpu-mean", type=float, default=0.5,
+                           help="Средняя загрузка ЦП процесса, %%")
+    synthetic.add_argument("--synthetic-memory-mean", type=float, default=0.1,
+                           help="Средняя доля памяти процесса, %%")
+    synthetic.add_argument("--synthetic-seed", type=int, help="Seed для воспроизводимости")
+
+    headless = parser.add_argument_group("Режим без GUI")
+    headless.add_argument("--headless", action="store_true",
+                          help="Собирать данные без графического интерфейса (PyQt5 не загружается)")
+    headless.add_argument("--format", choices=["jsonl", "csv"], default="jsonl",
+                          help="Формат вывода снимков")
+    headless.add_argument("--output", help="Файл для вывода (по умолчанию stdout)")
+    headless.add_argument("--processes", action="store_true",
+                          help="Включать в вывод список процессов")
+    headless.add_argument("--count", type=int, help="Число снимков (по умолчанию без ограничения)")
+    headless.add_argument("--interval", type=float, default=1.0, help="Интервал сбора, секунды")
+    # Остальные аргументы оставляем Qt
+    return parser.parse_known_args(argv)
+
+
+def create_source(args):
+    """Источник процессов по аргументам командной строки"""
+    if args.process_source != SyntheticProcessSource.name:
+        return create_process_source(args.process_source)
+    return create_process_source(
+        args.process_source, count=args.synthetic_count,
+        spawn_rate=args.synthetic_spawn_rate, exit_rate=args.synthetic_exit_rate,
+        cpu_mean=args.synthetic_cpu_mean, memory_mean=args.synthetic_memory_mean,
+        seed=args.synthetic_seed)
+
+
+def run_gui(args, qt_args):
+    # Qt импортируется только для графического режима
+    from PyQt5.QtWidgets import QApplication
+    from views.main_window import TaskManagerWindow
+    startup_timer.mark('import')
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = TaskManagerWindow(process_source=create_source(args), cpu_budget_percent=args.cpu_budget)
+    window.show()
+    return app.exec_()
 
 
 def main():
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.headless:
+        # stdout занят данными, журнал уходит в stderr
+        logger.set_stream(sys.stderr)
     # Логгируем старт приложения
     logger.info("Приложение Task Manager запускается.")
 
-    app = QApplication(sys.argv)
-    window = TaskManagerWindow()
-    window.show()
-    exit_code = app.exec_()
+    if args.headless:
+        from headless import run_headless
+        exit_code = run_headless(output_format=args.format, output_path=args.output,
+                                 include_processes=args.processes, count=args.count,
+                                 interval=args.interval, process_source=create_source(args),
+                                 cpu_budget_percent=args.cpu_budget)
+    else:
+        exit_code = run_gui(args, qt_args)
 
     # Логгируем завершение приложения
     logger.info(f"Приложение Task Manager завершено с кодом: {exit_code}")
@@ -21,4 +90,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -35,6 +35,12 @@ class Logger:
             # self.logger.addHandler(file_handler)
 
 
+    def set_stream(self, stream):
+        """Redirects console output (e.g. to stderr when stdout carries data)."""
+        for handler in self.logger.handlers:
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+                handler.setStream(stream)
+
     def debug(self, message):
         self.logger.debug(message)
 
@@ -0,0 +1,61 @@
+# startup_timer.py
+import time
+
+from utils.loggerService.logger import logger
+
+
+class StartupTimer:
+    """
+    Замеры холодного старта приложения.
+
+    Отсчёт ведётся от импорта модуля (первая строка script.py). Каждый этап
+    отмечается один раз; когда отмечены все этапы STAGES, в журнал выводится
+    сводка с длительностью каждого этапа и общим временем до первых данных.
+    """
+    _instance = None
+
+    # Этапы в порядке прохождения: (ключ, описание)
+    STAGES = (
+        ('import', "Импорт модулей"),
+        ('model_init', "Инициализация моделей"),
+        ('ui_init', "Построение интерфейса"),
+        ('first_paint', "Первая отрисовка"),
+        ('first_data', "Первые данные"),
+    )
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(StartupTimer, cls).__new__(cls)
+            cls._instance.reset()
+        return cls._instance
+
+    def reset(self):
+        self.origin = time.perf_counter()
+        self.marks = {}
+        self.reported = False
+
+    def mark(self, stage: str):
+        """Отмечает завершение этапа (повторные отметки игнорируются)"""
+        if stage in self.marks:
+            return
+        self.marks[stage] = time.perf_counter() - self.origin
+        if not self.reported and all(key in self.marks for key, _ in self.STAGES):
+            self.reported = True
+            logger.info(self.report())
+
+    def report(self) -> str:
+        """Сводка по этапам: время от старта и длительность этапа в миллисекундах"""
+        lines = ["Время запуска:"]
+        previous = 0.0
+        for key, title in self.STAGES:
+            elapsed = self.marks.get(key)
+            if elapsed is None:
+                lines.append(f"  {title}: -")
+                continue
+            lines.append(f"  {title}: {elapsed * 1000:.0f} мс (+{(elapsed - previous) * 1000:.0f} мс)")
+            previous = elapsed
+        return "\n".join(lines)
+
+
+# Create a global instance for easy access
+startup_timer = StartupTimer()
@@ -1,59 +1,76 @@
 # main_window.py
 
 import sys
-import psutil
+import time
 
-from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis
-from PyQt5.QtCore import QTimer, Qt, QMargins, QPointF
-# Добавили QGridLayout
-from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QTabWidget,
-                             QLabel, QSizePolicy, QScrollArea, QGridLayout)
-from PyQt5.QtGui import QColor, QPen # Импортируем QColor и QPen
+from PyQt5.QtCore import Qt, QTimer, QEvent, pyqtSignal
+from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QTabWidget, QLabel, QSizePolicy,
+                             QSplitter, QStackedWidget, QCheckBox, QLineEdit)
 
+from controllers.collector_worker import CollectorWorker, start_collector_thread, stop_collector_thread
+from controllers.overhead_governor import DEFAULT_CPU_BUDGET_PERCENT
 from controllers.process_controller import ProcessController
-from models.process_model import ProcessTableModel
+from controllers.process_details import ProcessDetailsService
+from controllers.snapshot_collector import SnapshotCollector
+from models.process_model import ProcessTableModel, ProcessSortFilterProxyModel
+from models.process_tree_model import ProcessTreeModel
+from models.hardware_inventory import HardwareInventory
+from models.snapshot import SystemSnapshot
 from models.system_monitor import SystemMonitor
-# CoreUsageWidget больше не используется для основного графика ЦП, но может остаться если нужен в другом месте
-from views.widgets.performance_widget import PerformanceWidget, ResourceMeter, CoreUsageWidget
+from views.widgets.process_details_panel import ProcessDetailsPanel
 from views.widgets.process_table import ProcessTableView
+from views.widgets.process_tree import ProcessTreeView
 from views.widgets.system_panel import SystemPanel
 
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+from utils.startup_timer import startup_timer
+
+# Задержка применения поиска после последнего нажатия клавиши, мс
+SEARCH_DEBOUNCE_MS = 250
+
 
 class TaskManagerWindow(QMainWindow):
-    def __init__(self):
+    # Переключение режима энергосбережения фонового сборщика (queued в его поток)
+    low_power_requested = pyqtSignal(bool)
+
+    def __init__(self, process_source='psutil', low_power_mode=True,
+                 cpu_budget_percent=DEFAULT_CPU_BUDGET_PERCENT):
         super().__init__()
         self.setWindowTitle("Диспетчер задач")
         self.setGeometry(100, 100, 1000, 700)
 
         self.source_model = ProcessTableModel()
+        self.proxy_model = ProcessSortFilterProxyModel()
+        self.proxy_model.setSourceModel(self.source_model)
+        self.hardware = HardwareInventory()
         self.system_monitor = SystemMonitor()
-        self.process_controller = ProcessController()
-
-        # Список для хранения серий каждого ядра для единого графика ЦП
-        self.cpu_core_series = []
-        self.cpu_chart = None # Будет инициализирован в create_performance_tab
-
-        # Список для хранения меток с процентами загрузки ядер
-        self.cpu_core_labels = []
-
-        # Список цветов для графиков ядер
-        self.core_colors = [
-            QColor(0, 150, 0),    # Зеленый
-            QColor(255, 0, 0),    # Красный
-            QColor(0, 0, 255),    # Синий
-            QColor(255, 165, 0),  # Оранжевый
-            QColor(128, 0, 128),  # Фиолетовый
-            QColor(0, 128, 128),  # Бирюзовый
-            QColor(255, 192, 203),# Розовый
-            QColor(100, 149, 237),# Cornflower Blue
-            QColor(218, 165, 32), # Goldenrod
-            QColor(64, 224, 208), # Turquoise
-            QColor(138, 43, 226), # BlueViolet
-            QColor(255, 99, 71),  # Tomato
-        ] # Добавьте больше цветов при необходимости
+        self.process_controller = ProcessController(process_source)
+        self.details_service = ProcessDetailsService()
+        startup_timer.mark('model_init')
+
+        # Последний полученный, но ещё не применённый снимок
+        self._pending_snapshot = None
+        self._apply_scheduled = False
+        self._last_applied_seq = 0
+        self._dropped_snapshots = 0
+
+        # Последний применённый снимок и вкладки, ожидающие перерисовки после показа
+        self._latest_snapshot = None
+        # Списки процессов, уже применённые к таблице и к дереву: если сбор процессов
+        # в такте пропущен, снимок несёт тот же объект ProcessRecords
+        self._last_processes = None
+        self._last_tree_processes = None
+        self._process_tab_stale = False
+        self._performance_tab_stale = False
+        # Снижать частоту сбора списка процессов, пока окно свёрнуто
+        self.low_power_mode = low_power_mode
+        # Бюджет собственной нагрузки приложения, % одного ядра
+        self.cpu_budget_percent = cpu_budget_percent
 
         self.init_ui()
-        self.init_timer()
+        startup_timer.mark('ui_init')
+        self.init_collector()
 
     def init_ui(self):
         self.tab_widget = QTabWidget()
@@ -61,9 +78,18 @@ class TaskManagerWindow(QMainWindow):
 
         self.create_process_tab()
         self.create_performance_tab()
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        # Момент первой отрисовки для отчёта о времени запуска
+        self.tab_widget.installEventFilter(self)
 
         self.setCentralWidget(self.tab_widget)
 
+        # Строка состояния со служебными счётчиками
+        self.sort_count_label = QLabel("Сортировок: 0")
+        self.statusBar().addPermanentWidget(self.sort_count_label)
+        self.overhead_label = QLabel()
+        self.statusBar().addPermanentWidget(self.overhead_label)
+
     def create_process_tab(self):
         process_tab = QWidget()
         layout = QVBoxLayout(process_tab)
@@ -73,417 +99,229 @@ class TaskManagerWindow(QMainWindow):
         self.system_panel = SystemPanel()
         layout.addWidget(self.system_panel)
 
+        toolbar = QHBoxLayout()
+        self.tree_mode_checkbox = QCheckBox("Дерево процессов")
+        self.tree_mode_checkbox.toggled.connect(self.set_tree_mode)
+        toolbar.addWidget(self.tree_mode_checkbox)
+        toolbar.addStretch(1)
+        # Поиск применяется с задержкой, а не на каждое нажатие клавиши
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Поиск: имя, user:root, cmd:--port, pyth*")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setMinimumWidth(300)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        toolbar.addWidget(self.search_edit)
+        layout.addLayout(toolbar)
+
         self.process_table = ProcessTableView()
         self.process_table.set_process_controller(self.process_controller)
-        self.process_table.setModel(self.source_model)
-        layout.addWidget(self.process_table, 1)
-
+        self.process_table.setModel(self.proxy_model)
+
+        # Таблица и дерево процессов; дерево создаётся при первом включении
+        self.process_views = QStackedWidget()
+        self.process_views.addWidget(self.process_table)
+        self.tree_model = None
+        self.process_tree = None
+
+        # Сведения о выбранном процессе под таблицей
+        self.details_panel = ProcessDetailsPanel(self.details_service)
+        self.process_table.process_selected.connect(self.details_panel.show_process)
+
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self.process_views)
+        splitter.addWidget(self.details_panel)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+        layout.addWidget(splitter, 1)
+
+        self.process_tab = process_tab
         self.tab_widget.addTab(process_tab, "Процессы")
 
-    def create_performance_tab(self):
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setContentsMargins(0, 0, 0, 0)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(scroll_widget)
-
-        content_widget = QWidget()
-        layout = QVBoxLayout(content_widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(15)
-
-        scroll_layout.addWidget(content_widget)
-        scroll_layout.addStretch(1)
-
-        # CPU Section
-        cpu_section = PerformanceWidget("Процессор")
-
-        # Контейнер для информации о процессоре и легенды ядер
-        cpu_info_and_legend_layout = QVBoxLayout()
-
-        # Добавляем информацию о процессоре
-        self.cpu_info_label = QLabel()
-        cpu_info_and_legend_layout.addWidget(self.cpu_info_label)
-
-        # Создаем сетку для легенды ядер (цветные квадраты + проценты)
-        cores_legend_grid = QGridLayout()
-        cores_legend_grid.setSpacing(5) # Устанавливаем отступы между элементами сетки
-
-        num_logical_cores = psutil.cpu_count(logical=True)
-        cores_per_row = 4 # Количество элементов легенды на строку
-        self.cpu_core_labels.clear() # Очищаем список на случай повторного вызова
-
-        for i in range(num_logical_cores):
-            # Создаем виджет для цветного квадрата
-            color_square = QLabel()
-            color_square.setFixedSize(15, 15) # Фиксированный размер для квадрата
-            color_square.setStyleSheet(f"background-color: {self.core_colors[i % len(self.core_colors)].name()}; border: 1px solid black;") # Устанавливаем цвет и рамку
-
-            # Создаем метку для текста легенды (например, "ЦП 1: 0.0%")
-            usage_label = QLabel(f"ЦП {i + 1}: 0.0%")
-            self.cpu_core_labels.append(usage_label) # Сохраняем ссылку на метку
-
-            row = i // cores_per_row
-            col = i % cores_per_row * 2 # Удваиваем колонку, чтобы добавить место для текста
-
-            cores_legend_grid.addWidget(color_square, row, col)
-            cores_legend_grid.addWidget(usage_label, row, col + 1)
-
-        # Добавляем сетку с легендой ядер в макет информации
-        cpu_info_and_legend_layout.addLayout(cores_legend_grid)
-        cpu_info_and_legend_layout.addStretch(1) # Растяжка после легенды
-
-
-        # Удалим существующие элементы из info_container_layout перед добавлением нового макета
-        while cpu_section.info_container_layout.count():
-            item = cpu_section.info_container_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-            del item
-
-        # Добавляем вертикальный макет информации и легенды в горизонтальный макет информации PerformanceWidget
-        cpu_section.info_container_layout.addLayout(cpu_info_and_legend_layout)
-        cpu_section.info_container_layout.addStretch(1) # Растяжка после этого блока
-
-
-        # Создаем единый график для всех ядер ЦП
-        self.cpu_chart = QChart()
-        self.cpu_chart.setBackgroundVisible(False)
-        # Увеличиваем левый отступ для оси Y
-        self.cpu_chart.setMargins(QMargins(30, 0, 0, 0)) # Увеличено левый отступ
-        self.cpu_chart.layout().setContentsMargins(0, 0, 0, 0)
-        self.cpu_chart.legend().hide() # Скрываем стандартную легенду, т.к. создаем свою
-
-        # Оси для графика ЦП
-        axis_x = QValueAxis()
-        axis_x.setRange(0, 60)
-        axis_x.setTickCount(7)
-        axis_x.setLabelFormat("%.0f")
-        axis_x.setTitleText("Seconds ago")
-        self.cpu_chart.addAxis(axis_x, Qt.AlignBottom)
-
-        axis_y = QValueAxis()
-        axis_y.setRange(0, 100)
-        axis_y.setTitleText("Usage (%)")
-        self.cpu_chart.addAxis(axis_y, Qt.AlignLeft)
-
-        # Создаем серии для каждого ядра с толстыми линиями
-        self.cpu_core_series.clear() # Очищаем список на случай повторного вызова
-        for i in range(num_logical_cores):
-            series = QLineSeries()
-            series.setName(f"ЦП {i + 1}") # Имя серии (хоть и скрыто, может быть полезно)
-            pen = QPen(self.core_colors[i % len(self.core_colors)])
-            pen.setWidth(2) # Устанавливаем толщину линии
-            series.setPen(pen)
-            self.cpu_chart.addSeries(series)
-            series.attachAxis(axis_x)
-            series.attachAxis(axis_y)
-            self.cpu_core_series.append(series)
-
-
-        cpu_chart_view = QChartView(self.cpu_chart)
-        cpu_chart_view.setFixedHeight(200) # Увеличиваем высоту графика ЦП
-        cpu_section.add_chart_view(cpu_chart_view) # Добавляем график в charts_layout
-
-        layout.addWidget(cpu_section)
-
-
-        # Memory Section (остается без изменений)
-        memory_section = PerformanceWidget("Память")
-
-        self.memory_meter = ResourceMeter()
-        self.memory_meter.setFixedSize(80, 80)
-        self.memory_info_label = QLabel()
-        memory_section.info_container_layout.addWidget(self.memory_meter)
-        memory_section.info_container_layout.addWidget(self.memory_info_label)
-        memory_section.info_container_layout.addStretch(1)
-
-        memory_chart = QChart()
-        memory_chart.setBackgroundVisible(False)
-        memory_chart.legend().hide()
-        # Увеличиваем нижний и левый отступ для осей X и Y на графике памяти
-        memory_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
-        memory_chart.layout().setContentsMargins(0, 0, 0, 0)
-
-        axis_x = QValueAxis()
-        axis_x.setRange(0, 60)
-        axis_x.setTickCount(7)
-        axis_x.setLabelFormat("%.0f")
-        axis_x.setTitleText("Seconds ago")
-        memory_chart.addAxis(axis_x, Qt.AlignBottom)
-
-        axis_y = QValueAxis()
-        axis_y.setRange(0, 100)
-        axis_y.setTitleText("Usage (%)")
-        memory_chart.addAxis(axis_y, Qt.AlignLeft)
-
-        self.memory_series = QLineSeries()
-        # Устанавливаем толщину линии для графика памяти
-        pen_mem = QPen(QColor(0, 0, 255)) # Цвет синий, например
-        pen_mem.setWidth(2)
-        self.memory_series.setPen(pen_mem)
-        memory_chart.addSeries(self.memory_series)
-        self.memory_series.attachAxis(axis_x)
-        self.memory_series.attachAxis(axis_y)
-
-        memory_chart_view = QChartView(memory_chart)
-        memory_chart_view.setFixedHeight(150)
-        memory_section.add_chart_view(memory_chart_view)
-
-        layout.addWidget(memory_section)
-
-        # Disk Section
-        disk_section = PerformanceWidget("Диск")
-
-        self.disk_meter = ResourceMeter()
-        self.disk_meter.setFixedSize(80, 80)
-        self.disk_info_label = QLabel()
-        disk_section.info_container_layout.addWidget(self.disk_meter)
-        disk_section.info_container_layout.addWidget(self.disk_info_label)
-        disk_section.info_container_layout.addStretch(1)
-
-
-        disk_chart = QChart()
-        disk_chart.setBackgroundVisible(False)
-        #disk_chart.legend().hide() # Легенда для диска остается видимой
-        # Увеличиваем нижний и левый отступ для осей X и Y на графике диска
-        disk_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
-        disk_chart.layout().setContentsMargins(0, 0, 0, 0)
-
-        axis_x = QValueAxis()
-        axis_x.setRange(0, 60)
-        axis_x.setTickCount(7)
-        axis_x.setLabelFormat("%.0f")
-        axis_x.setTitleText("Seconds ago")
-        disk_chart.addAxis(axis_x, Qt.AlignBottom)
-
-        axis_y = QValueAxis()
-        # Увеличиваем диапазон оси Y для диска
-        axis_y.setRange(0, 200) # Увеличено с 50 до 200
-        # Изменяем текст заголовка оси Y
-        axis_y.setTitleText("MB/s") # Изменено с "Speed (MB/s)"
-        disk_chart.addAxis(axis_y, Qt.AlignLeft)
-
-        self.disk_read_series = QLineSeries()
-        self.disk_write_series = QLineSeries()
-        self.disk_read_series.setName("Чтение")
-        self.disk_write_series.setName("Запись")
-
-        # Устанавливаем толщину линий для графика диска
-        pen_read = QPen(QColor(0, 150, 0)) # Зеленый для чтения
-        pen_read.setWidth(2)
-        self.disk_read_series.setPen(pen_read)
-
-        pen_write = QPen(QColor(255, 0, 0)) # Красный для записи
-        pen_write.setWidth(2)
-        self.disk_write_series.setPen(pen_write)
-
-
-        disk_chart.addSeries(self.disk_read_series)
-        disk_chart.addSeries(self.disk_write_series)
-        self.disk_read_series.attachAxis(axis_x)
-        self.disk_read_series.attachAxis(axis_y)
-        self.disk_write_series.attachAxis(axis_x)
-        self.disk_write_series.attachAxis(axis_y)
-        disk_chart.legend().setVisible(True)
-
-        disk_chart_view = QChartView(disk_chart)
-        disk_chart_view.setFixedHeight(200) # Увеличено с 150 до 200
-        disk_section.add_chart_view(disk_chart_view)
-
-        layout.addWidget(disk_section)
-
-        # Network Section
-        network_section = PerformanceWidget("Сеть")
-
-        # Метр для сети (можно убрать или изменить)
-        # self.network_meter = ResourceMeter()
-        # self.network_meter.setFixedSize(80, 80)
-        # network_section.info_container_layout.addWidget(self.network_meter)
-
-        self.network_info_label = QLabel()
-        network_section.info_container_layout.addWidget(self.network_info_label)
-        network_section.info_container_layout.addStretch(1)
-
-
-        network_chart = QChart()
-        network_chart.setBackgroundVisible(False)
-        #network_chart.legend().hide() # Легенда для сети остается видимой
-        # Увеличиваем нижний и левый отступ для осей X и Y на графике сети
-        network_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
-        network_chart.layout().setContentsMargins(0, 0, 0, 0)
-
-
-        axis_x = QValueAxis()
-        axis_x.setRange(0, 60)
-        axis_x.setTickCount(7)
-        axis_x.setLabelFormat("%.0f")
-        axis_x.setTitleText("Seconds ago")
-        network_chart.addAxis(axis_x, Qt.AlignBottom)
-
-        axis_y = QValueAxis()
-        axis_y.setRange(0, 5) # Начальный диапазон для скорости сети в Mbps
-        # Изменяем текст заголовка оси Y
-        axis_y.setTitleText("Mbps") # Изменено с "Speed (Mbps)"
-        network_chart.addAxis(axis_y, Qt.AlignLeft)
-
-        self.network_sent_series = QLineSeries()
-        self.network_received_series = QLineSeries()
-        self.network_sent_series.setName("Отправка")
-        self.network_received_series.setName("Получение")
-
-        # Устанавливаем толщину линий для графика сети
-        pen_sent = QPen(QColor(0, 0, 255)) # Синий для отправки
-        pen_sent.setWidth(2)
-        self.network_sent_series.setPen(pen_sent)
-
-        pen_recv = QPen(QColor(255, 165, 0)) # Оранжевый для получения
-        pen_recv.setWidth(2)
-        self.network_received_series.setPen(pen_recv)
-
-
-        network_chart.addSeries(self.network_sent_series)
-        network_chart.addSeries(self.network_received_series)
-        self.network_sent_series.attachAxis(axis_x)
-        self.network_sent_series.attachAxis(axis_y)
-        self.network_received_series.attachAxis(axis_x)
-        self.network_received_series.attachAxis(axis_y)
-        network_chart.legend().setVisible(True)
-
-        network_chart_view = QChartView(network_chart)
-        network_chart_view.setFixedHeight(200) # Увеличено с 150 до 200
-        network_section.add_chart_view(network_chart_view)
-
-        layout.addWidget(network_section)
-
-        layout.addStretch(1)
-        self.tab_widget.addTab(scroll_area, "Производительность")
-
-
-    def init_timer(self):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_all)
-        self.timer.start(1000)
-
-    def update_all(self):
-        # Вызываем update_stats, чтобы обновить внутренние данные system_monitor,
-        # включая загрузку ядер.
-        self.system_monitor.update_stats()
-
-        # Обновление панели сверху (общая загрузка ЦП и Памяти)
-        self.system_panel.update_stats(self.system_monitor.cpu_percent, self.system_monitor.mem_percent)
-
-        gui_procs, bg_procs = self.process_controller.get_processes()
-        self.source_model.update_data(gui_procs, bg_procs)
-
-        self.update_performance_tab()
+    def apply_search(self):
+        query = self.search_edit.text()
+        start = time.perf_counter()
+        self.proxy_model.set_search_query(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if query.strip():
+            self.statusBar().showMessage(
+                f"Найдено процессов: {self.proxy_model.search_match_count()} ({elapsed_ms:.1f} мс)", 5000)
+        else:
+            self.statusBar().clearMessage()
+
+    def build_process_tree(self):
+        self.tree_model = ProcessTreeModel()
+        self.process_tree = ProcessTreeView()
+        self.process_tree.set_process_controller(self.process_controller)
+        self.process_tree.setModel(self.tree_model)
+        self.process_tree.process_selected.connect(self.details_panel.show_process)
+        self.process_views.addWidget(self.process_tree)
+
+    def is_tree_mode(self) -> bool:
+        return self.process_tree is not None and self.process_views.currentWidget() is self.process_tree
+
+    def set_tree_mode(self, enabled: bool):
+        """Переключает таблицу и дерево процессов; обновляется только видимое представление"""
+        first_build = enabled and self.process_tree is None
+        if first_build:
+            self.build_process_tree()
+        self.process_views.setCurrentWidget(self.process_tree if enabled else self.process_table)
+        # Поиск фильтрует таблицу; дерево показывает все процессы
+        self.search_edit.setEnabled(not enabled)
+        if self._latest_snapshot is not None:
+            self.update_process_tab(self._latest_snapshot)
+        if first_build:
+            self.process_tree.expandToDepth(0)
 
-    def update_performance_tab(self):
-        # Обновление информации о CPU (общая информация о процессоре)
-        cpu_info = self.system_monitor.get_cpu_info()
-        self.cpu_info_label.setText(
-            f"Процессор: {cpu_info['name']}\n"
-            # Удалена строка с базовой скоростью
-            f"Ядра: {cpu_info['cores']} (логических: {cpu_info['logical']})"
+    def create_performance_tab(self):
+        # Вкладка с графиками (и PyQt5.QtChart) создаётся при первом открытии,
+        # до этого на её месте пустая заглушка
+        self.performance_tab = QWidget()
+        self.performance_tab_built = False
+        self.tab_widget.addTab(self.performance_tab, "Производительность")
+
+    def build_performance_tab(self):
+        """Создаёт вкладку "Производительность" на месте заглушки"""
+        started = time.perf_counter()
+        from views.performance_tab import PerformanceTab
+
+        placeholder = self.performance_tab
+        self.performance_tab = PerformanceTab(self.hardware, self.system_monitor.history)
+        self.performance_tab_built = True
+
+        # Замена вкладки не должна порождать повторных переключений
+        index = self.tab_widget.indexOf(placeholder)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, self.performance_tab, "Производительность")
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        logger.info(f"Вкладка производительности создана за {(time.perf_counter() - started) * 1000:.0f} мс.")
+
+    def on_tab_changed(self, index):
+        if not self.performance_tab_built and self.tab_widget.widget(index) is self.performance_tab:
+            self.build_performance_tab()
+        self.refresh_stale_tabs()
+
+    def eventFilter(self, obj, event):
+        if obj is self.tab_widget and event.type() == QEvent.Paint:
+            startup_timer.mark('first_paint')
+            self.tab_widget.removeEventFilter(self)
+        return super().eventFilter(obj, event)
+
+
+    def init_collector(self):
+        # Сбор данных выполняется в фоновом потоке, UI только применяет снимки
+        collector = SnapshotCollector(self.system_monitor, self.process_controller,
+                                      cpu_budget_percent=self.cpu_budget_percent)
+        self.collector_worker = CollectorWorker(collector)
+        self.collector_worker.snapshot_ready.connect(self.on_snapshot_ready)
+        self.low_power_requested.connect(self.collector_worker.set_low_power)
+        self.collector_thread = start_collector_thread(self.collector_worker)
+
+    def on_snapshot_ready(self, snapshot: SystemSnapshot):
+        """
+        Принимает снимок из фонового потока. Если UI не успевает,
+        промежуточные снимки заменяются более свежими и не применяются.
+        """
+        if self._pending_snapshot is not None:
+            self._dropped_snapshots += 1
+            logger.debug(f"Пропущен устаревший снимок #{self._pending_snapshot.seq}.")
+        self._pending_snapshot = snapshot
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_snapshot)
+
+    def _apply_pending_snapshot(self):
+        self._apply_scheduled = False
+        snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if snapshot is None or snapshot.seq <= self._last_applied_seq:
+            return
+        self._last_applied_seq = snapshot.seq
+        self.apply_snapshot(snapshot)
+        startup_timer.mark('first_data')
+
+    def is_tab_visible(self, tab) -> bool:
+        """Видна ли вкладка пользователю (окно показано, не свёрнуто и вкладка активна)"""
+        return self.isVisible() and not self.isMinimized() and self.tab_widget.currentWidget() is tab
+
+    def apply_snapshot(self, snapshot: SystemSnapshot):
+        # История уже записана сборщиком; скрытые вкладки только помечаются устаревшими
+        self._latest_snapshot = snapshot
+
+        overhead = snapshot.overhead
+        self.overhead_label.setText(
+            f"Нагрузка монитора: ЦП {overhead.cpu_percent:.1f}%, сбор {overhead.collector_cpu_percent:.1f}% "
+            f"(бюджет {self.cpu_budget_percent:.1f}%), RSS {overhead.rss_mb:.0f} MB"
+            + (f", ограничение {overhead.level}" if overhead.level else "")
         )
 
-        # Обновление единого графика ядер ЦП и меток процентов
-        cpu_per_core = self.system_monitor.get_cpu_per_core()
-        # Убедимся, что количество данных по ядрам соответствует количеству серий и меток
-        if len(cpu_per_core) == len(self.cpu_core_series) and len(cpu_per_core) == len(self.cpu_core_labels):
-            for i, core_usage in enumerate(cpu_per_core):
-                 # Обновляем серию графика
-                self.update_chart_series(self.cpu_core_series[i], core_usage, is_cpu=True)
-                # Обновляем метку с процентом загрузки
-                self.cpu_core_labels[i].setText(f"ЦП {i + 1}: {core_usage:.1f}%")
-        # else:
-            # print("Warning: Mismatch in number of CPU cores, series, or labels.")
-
-
-        # Обновление информации о памяти
-        memory_info = self.system_monitor.get_memory_info()
-        memory_usage = self.system_monitor.mem_percent
-        self.memory_meter.set_value(memory_usage)
-        self.memory_info_label.setText(
-            f"Использовано: {memory_info['used']:.1f} GB из {memory_info['total']:.1f} GB\n"
-            f"({memory_usage:.1f}%)\n"
-            f"Доступно: {memory_info['available']:.1f} GB\n"
-            f"Кэшировано: {memory_info['cached']:.1f} GB"
-
-        )
-        self.update_chart_series(self.memory_series, memory_usage)
-
-        # Обновление информации о диске
-        disk_info = self.system_monitor.get_disk_info()
-        disk_usage_percent = disk_info['usage_percent']
-        self.disk_meter.set_value(disk_usage_percent)
-        self.disk_info_label.setText(
-            f"Свободно: {(100 - disk_usage_percent):.1f}%\n"
-            f"Скорость чтения: {disk_info['read_speed']:.1f} MB/s\n"
-            f"Скорость записи: {disk_info['write_speed']:.1f} MB/s"
-        )
-        self.update_chart_series(self.disk_read_series, disk_info['read_speed'], is_disk=True)
-        self.update_chart_series(self.disk_write_series, disk_info['write_speed'], is_disk=True)
-
-
-        # Обновление информации о сети
-        network_info = self.system_monitor.get_network_info()
-        # network_usage_percent = network_info['usage_percent'] # Использование метра для сети можно убрать
-        # self.network_meter.set_value(network_usage_percent) # Закомментировано
-        self.network_info_label.setText(
-            f"Всего отправлено: {network_info['sent']:.1f} MB\n"
-            f"Всего получено: {network_info['received']:.1f} MB\n"
-            f"Скорость отправки: {network_info['send_speed']:.1f} Mbps\n"
-            f"Скорость приема: {network_info['receive_speed']:.1f} Mbps"
-        )
-        self.update_chart_series(self.network_sent_series, network_info['send_speed'], is_network=True)
-        self.update_chart_series(self.network_received_series, network_info['receive_speed'], is_network=True)
-
-
-    # Модифицируем update_chart_series для поддержки диска, сети и ЦПУ по ядрам
-    def update_chart_series(self, series: QLineSeries, new_value: float, is_network=False, is_disk=False, is_cpu=False):
-        """Обновляет серию графика новым значением"""
-        current_time = series.count()
-        series.append(current_time, new_value)
-
-        # Определяем, какой график нужно обновить
-        if is_cpu:
-             chart = self.cpu_chart
-        elif is_network:
-             chart = self.network_sent_series.chart()
-        elif is_disk:
-             chart = self.disk_read_series.chart()
+        if self.is_tab_visible(self.process_tab):
+            self.update_process_tab(snapshot)
         else:
-             chart = self.memory_series.chart()
-
-
-        if series.count() > 60:
-            series.remove(0)
-            # Сдвигаем оставшиеся точки по оси X
-            for i in range(series.count()):
-                point = series.pointsVector()[i]
-                series.replace(i, QPointF(i, point.y()))
-
-        # Обновляем диапазон оси X - всегда показываем последние 60 секунд
-        axis_x = chart.axes(Qt.Horizontal)[0]
-        # Устанавливаем диапазон от текущего времени минус 60 до текущего времени
-        # Используем series.count() как текущее "время" в количестве точек
-        max_x = series.count()
-        min_x = max(0, max_x - 60)
-        axis_x.setRange(min_x, max_x)
-
-
-        axis_y = chart.axes(Qt.Vertical)[0]
-        current_max = max(point.y() for point in series.pointsVector()) if series.count() > 0 else 1.0
-
-        if is_network:
-             axis_y.setRange(0, max(5.0, current_max * 1.2)) # Динамическое масштабирование для сети
-        elif is_disk:
-            axis_y.setRange(0, max(50.0, current_max * 1.2)) # Динамическое масштабирование для диска
-        elif is_cpu:
-             axis_y.setRange(0, 100) # Фиксированный диапазон для загрузки ЦПУ по ядрам
+            self._process_tab_stale = True
+
+        if self.is_tab_visible(self.performance_tab):
+            self.performance_tab.update_snapshot(snapshot)
         else:
-             axis_y.setRange(0, 100) # Фиксированный диапазон для загрузки памяти
\ No newline at end of file
+            self._performance_tab_stale = True
+
+    def refresh_stale_tabs(self):
+        """Догоняющая перерисовка ставшей видимой вкладки по последнему снимку"""
+        snapshot = self._latest_snapshot
+        if snapshot is None:
+            return
+        if self._process_tab_stale and self.is_tab_visible(self.process_tab):
+            self._process_tab_stale = False
+            self.update_process_tab(snapshot)
+        if self._performance_tab_stale and self.is_tab_visible(self.performance_tab):
+            self._performance_tab_stale = False
+            self.performance_tab.update_snapshot(snapshot)
+
+    def update_process_tab(self, snapshot: SystemSnapshot):
+        # Обновление панели сверху (общая загрузка ЦП и Памяти)
+        self.system_panel.update_stats(snapshot.cpu_percent, snapshot.mem_percent)
+
+        processes = snapshot.processes
+        if self.is_tree_mode():
+            if processes is not self._last_tree_processes:
+                self._last_tree_processes = processes
+                with self.process_tree.preserved_scroll_position():
+                    self.tree_model.update_data(processes)
+            return
+        if processes is self._last_processes:
+            return
+        self._last_processes = processes
+
+        # Снимок применяется целиком, прокси пересортировывает строки один раз за такт;
+        # выделение сохраняется через постоянные индексы прокси
+        self.proxy_model.update_search(processes)
+        with self.process_table.preserved_scroll_position(), self.proxy_model.update_transaction():
+            self.source_model.update_data(processes)
+        self.sort_count_label.setText(f"Сортировок: {self.proxy_model.sort_count}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_stale_tabs()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            minimized = self.isMinimized()
+            if self.low_power_mode:
+                self.low_power_requested.emit(minimized)
+            if not minimized:
+                self.refresh_stale_tabs()
+
+    def closeEvent(self, event):
+        stop_collector_thread(self.collector_worker, self.collector_thread)
+        self.details_service.shutdown()
+        self.process_table.shutdown()
+        if self.process_tree is not None:
+            self.process_tree.shutdown()
+        super().closeEvent(event)
+
@@ -0,0 +1,468 @@
+# views/performance_tab.py
+#
+# Вкладка "Производительность". Модуль импортируется только при первом
+# открытии вкладки, вместе с ним загружается и PyQt5.QtChart.
+
+from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis
+from PyQt5.QtCore import Qt, QMargins
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QWidget, QLabel, QScrollArea,
+                             QGridLayout, QComboBox)
+from PyQt5.QtGui import QColor, QPen
+
+from models.downsampling import lttb
+from models.snapshot import SystemSnapshot
+from views.widgets.performance_widget import PerformanceWidget, ResourceMeter, set_series_values
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+# Периоды истории на вкладке "Производительность":
+# (название, длительность в секундах, единица оси X в секундах, подпись оси X)
+HISTORY_VIEWS = (
+    ("1 мин", 60, 1, "Seconds ago"),
+    ("15 мин", 900, 60, "Minutes ago"),
+    ("1 ч", 3600, 60, "Minutes ago"),
+    ("24 ч", 86400, 3600, "Hours ago"),
+)
+
+# Нижняя граница числа точек на графике, если ширина области графика ещё неизвестна
+MIN_CHART_POINTS = 200
+
+# Список цветов для графиков ядер
+CORE_COLORS = [
+    QColor(0, 150, 0),    # Зеленый
+    QColor(255, 0, 0),    # Красный
+    QColor(0, 0, 255),    # Синий
+    QColor(255, 165, 0),  # Оранжевый
+    QColor(128, 0, 128),  # Фиолетовый
+    QColor(0, 128, 128),  # Бирюзовый
+    QColor(255, 192, 203),# Розовый
+    QColor(100, 149, 237),# Cornflower Blue
+    QColor(218, 165, 32), # Goldenrod
+    QColor(64, 224, 208), # Turquoise
+    QColor(138, 43, 226), # BlueViolet
+    QColor(255, 99, 71),  # Tomato
+] # Добавьте больше цветов при необходимости
+
+
+class PerformanceTab(QScrollArea):
+    """Графики и сводки ЦП, памяти, диска и сети по истории SystemMonitor"""
+
+    def __init__(self, hardware, history, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация PerformanceTab.")
+        self.hardware = hardware
+        self.history = history
+
+        # Список для хранения серий каждого ядра для единого графика ЦП
+        self.cpu_core_series = []
+        # Список для хранения меток с процентами загрузки ядер
+        self.cpu_core_labels = []
+        self.core_colors = CORE_COLORS
+
+        # Оси времени всех графиков и выбранный период истории
+        self.history_axes = []
+        self.history_view = HISTORY_VIEWS[0]
+
+        self.init_ui()
+        logger.info("PerformanceTab инициализирован.")
+
+    def init_ui(self):
+        scroll_widget = QWidget()
+        scroll_layout = QVBoxLayout(scroll_widget)
+        scroll_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.setWidgetResizable(True)
+        self.setWidget(scroll_widget)
+
+        content_widget = QWidget()
+        layout = QVBoxLayout(content_widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(15)
+
+        scroll_layout.addWidget(content_widget)
+        scroll_layout.addStretch(1)
+
+        # Выбор периода истории для всех графиков
+        view_layout = QHBoxLayout()
+        view_layout.addWidget(QLabel("Период:"))
+        self.history_view_combo = QComboBox()
+        self.history_view_combo.addItems([view[0] for view in HISTORY_VIEWS])
+        self.history_view_combo.currentIndexChanged.connect(self.set_history_view)
+        view_layout.addWidget(self.history_view_combo)
+        view_layout.addStretch(1)
+        layout.addLayout(view_layout)
+
+        # CPU Section
+        cpu_section = PerformanceWidget("Процессор")
+
+        # Контейнер для информации о процессоре и легенды ядер
+        cpu_info_and_legend_layout = QVBoxLayout()
+
+        # Добавляем информацию о процессоре (статическая, берётся из инвентаризации один раз)
+        cpu_info = self.hardware.cpu
+        self.cpu_info_label = QLabel(
+            f"Процессор: {cpu_info['name']}\n"
+            f"Ядра: {cpu_info['cores']} (логических: {cpu_info['logical']})"
+        )
+        cpu_info_and_legend_layout.addWidget(self.cpu_info_label)
+
+        # Создаем сетку для легенды ядер (цветные квадраты + проценты)
+        cores_legend_grid = QGridLayout()
+        cores_legend_grid.setSpacing(5) # Устанавливаем отступы между элементами сетки
+
+        num_logical_cores = cpu_info['logical']
+        cores_per_row = 4 # Количество элементов легенды на строку
+        self.cpu_core_labels.clear() # Очищаем список на случай повторного вызова
+
+        for i in range(num_logical_cores):
+            # Создаем виджет для цветного квадрата
+            color_square = QLabel()
+            color_square.setFixedSize(15, 15) # Фиксированный размер для квадрата
+            color_square.setStyleSheet(f"background-color: {self.core_colors[i % len(self.core_colors)].name()}; border: 1px solid black;") # Устанавливаем цвет и рамку
+
+            # Создаем метку для текста легенды (например, "ЦП 1: 0.0%")
+            usage_label = QLabel(f"ЦП {i + 1}: 0.0%")
+            self.cpu_core_labels.append(usage_label) # Сохраняем ссылку на метку
+
+            row = i // cores_per_row
+            col = i % cores_per_row * 2 # Удваиваем колонку, чтобы добавить место для текста
+
+            cores_legend_grid.addWidget(color_square, row, col)
+            cores_legend_grid.addWidget(usage_label, row, col + 1)
+
+        # Добавляем сетку с легендой ядер в макет информации
+        cpu_info_and_legend_layout.addLayout(cores_legend_grid)
+        cpu_info_and_legend_layout.addStretch(1) # Растяжка после легенды
+
+
+        # Удалим существующие элементы из info_container_layout перед добавлением нового макета
+        while cpu_section.info_container_layout.count():
+            item = cpu_section.info_container_layout.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.deleteLater()
+            del item
+
+        # Добавляем вертикальный макет информации и легенды в горизонтальный макет информации PerformanceWidget
+        cpu_section.info_container_layout.addLayout(cpu_info_and_legend_layout)
+        cpu_section.info_container_layout.addStretch(1) # Растяжка после этого блока
+
+
+        # Создаем единый график для всех ядер ЦП
+        self.cpu_chart = QChart()
+        self.cpu_chart.setBackgroundVisible(False)
+        # Увеличиваем левый отступ для оси Y
+        self.cpu_chart.setMargins(QMargins(30, 0, 0, 0)) # Увеличено левый отступ
+        self.cpu_chart.layout().setContentsMargins(0, 0, 0, 0)
+        self.cpu_chart.legend().hide() # Скрываем стандартную легенду, т.к. создаем свою
+
+        # Оси для графика ЦП
+        axis_x = QValueAxis()
+        axis_x.setRange(0, 60)
+        axis_x.setTickCount(7)
+        axis_x.setLabelFormat("%.0f")
+        axis_x.setTitleText("Seconds ago")
+        axis_x.setReverse(True) # Текущий момент (0) справа
+        self.history_axes.append(axis_x)
+        self.cpu_chart.addAxis(axis_x, Qt.AlignBottom)
+
+        axis_y = QValueAxis()
+        axis_y.setRange(0, 100)
+        axis_y.setTitleText("Usage (%)")
+        self.cpu_chart.addAxis(axis_y, Qt.AlignLeft)
+
+        # Создаем серии для каждого ядра с толстыми линиями
+        self.cpu_core_series.clear() # Очищаем список на случай повторного вызова
+        for i in range(num_logical_cores):
+            series = QLineSeries()
+            series.setName(f"ЦП {i + 1}") # Имя серии (хоть и скрыто, может быть полезно)
+            pen = QPen(self.core_colors[i % len(self.core_colors)])
+            pen.setWidth(2) # Устанавливаем толщину линии
+            series.setPen(pen)
+            self.cpu_chart.addSeries(series)
+            series.attachAxis(axis_x)
+            series.attachAxis(axis_y)
+            self.cpu_core_series.append(series)
+
+
+        cpu_chart_view = QChartView(self.cpu_chart)
+        cpu_chart_view.setFixedHeight(200) # Увеличиваем высоту графика ЦП
+        cpu_section.add_chart_view(cpu_chart_view) # Добавляем график в charts_layout
+
+        layout.addWidget(cpu_section)
+
+
+        # Memory Section (остается без изменений)
+        memory_section = PerformanceWidget("Память")
+
+        self.memory_meter = ResourceMeter()
+        self.memory_meter.setFixedSize(80, 80)
+        self.memory_info_label = QLabel()
+        memory_section.info_container_layout.addWidget(self.memory_meter)
+        memory_section.info_container_layout.addWidget(self.memory_info_label)
+        memory_section.info_container_layout.addStretch(1)
+
+        memory_chart = QChart()
+        memory_chart.setBackgroundVisible(False)
+        memory_chart.legend().hide()
+        # Увеличиваем нижний и левый отступ для осей X и Y на графике памяти
+        memory_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
+        memory_chart.layout().setContentsMargins(0, 0, 0, 0)
+
+        axis_x = QValueAxis()
+        axis_x.setRange(0, 60)
+        axis_x.setTickCount(7)
+        axis_x.setLabelFormat("%.0f")
+        axis_x.setTitleText("Seconds ago")
+        axis_x.setReverse(True) # Текущий момент (0) справа
+        self.history_axes.append(axis_x)
+        memory_chart.addAxis(axis_x, Qt.AlignBottom)
+
+        axis_y = QValueAxis()
+        axis_y.setRange(0, 100)
+        axis_y.setTitleText("Usage (%)")
+        memory_chart.addAxis(axis_y, Qt.AlignLeft)
+
+        self.memory_series = QLineSeries()
+        # Устанавливаем толщину линии для графика памяти
+        pen_mem = QPen(QColor(0, 0, 255)) # Цвет синий, например
+        pen_mem.setWidth(2)
+        self.memory_series.setPen(pen_mem)
+        memory_chart.addSeries(self.memory_series)
+        self.memory_series.attachAxis(axis_x)
+        self.memory_series.attachAxis(axis_y)
+
+        memory_chart_view = QChartView(memory_chart)
+        memory_chart_view.setFixedHeight(150)
+        memory_section.add_chart_view(memory_chart_view)
+
+        layout.addWidget(memory_section)
+
+        # Disk Section
+        disk_section = PerformanceWidget("Диск")
+
+        self.disk_meter = ResourceMeter()
+        self.disk_meter.setFixedSize(80, 80)
+        self.disk_info_label = QLabel()
+        disk_section.info_container_layout.addWidget(self.disk_meter)
+        disk_section.info_container_layout.addWidget(self.disk_info_label)
+        disk_section.info_container_layout.addStretch(1)
+
+
+        disk_chart = QChart()
+        disk_chart.setBackgroundVisible(False)
+        #disk_chart.legend().hide() # Легенда для диска остается видимой
+        # Увеличиваем нижний и левый отступ для осей X и Y на графике диска
+        disk_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
+        disk_chart.layout().setContentsMargins(0, 0, 0, 0)
+
+        axis_x = QValueAxis()
+        axis_x.setRange(0, 60)
+        axis_x.setTickCount(7)
+        axis_x.setLabelFormat("%.0f")
+        axis_x.setTitleText("Seconds ago")
+        axis_x.setReverse(True) # Текущий момент (0) справа
+        self.history_axes.append(axis_x)
+        disk_chart.addAxis(axis_x, Qt.AlignBottom)
+
+        axis_y = QValueAxis()
+        # Увеличиваем диапазон оси Y для диска
+        axis_y.setRange(0, 200) # Увеличено с 50 до 200
+        # Изменяем текст заголовка оси Y
+        axis_y.setTitleText("MB/s") # Изменено с "Speed (MB/s)"
+        disk_chart.addAxis(axis_y, Qt.AlignLeft)
+
+        self.disk_read_series = QLineSeries()
+        self.disk_write_series = QLineSeries()
+        self.disk_read_series.setName("Чтение")
+        self.disk_write_series.setName("Запись")
+
+        # Устанавливаем толщину линий для графика диска
+        pen_read = QPen(QColor(0, 150, 0)) # Зеленый для чтения
+        pen_read.setWidth(2)
+        self.disk_read_series.setPen(pen_read)
+
+        pen_write = QPen(QColor(255, 0, 0)) # Красный для записи
+        pen_write.setWidth(2)
+        self.disk_write_series.setPen(pen_write)
+
+
+        disk_chart.addSeries(self.disk_read_series)
+        disk_chart.addSeries(self.disk_write_series)
+        self.disk_read_series.attachAxis(axis_x)
+        self.disk_read_series.attachAxis(axis_y)
+        self.disk_write_series.attachAxis(axis_x)
+        self.disk_write_series.attachAxis(axis_y)
+        disk_chart.legend().setVisible(True)
+
+        disk_chart_view = QChartView(disk_chart)
+        disk_chart_view.setFixedHeight(200) # Увеличено с 150 до 200
+        disk_section.add_chart_view(disk_chart_view)
+
+        layout.addWidget(disk_section)
+
+        # Network Section
+        network_section = PerformanceWidget("Сеть")
+
+        # Метр для сети (можно убрать или изменить)
+        # self.network_meter = ResourceMeter()
+        # self.network_meter.setFixedSize(80, 80)
+        # network_section.info_container_layout.addWidget(self.network_meter)
+
+        self.network_info_label = QLabel()
+        network_section.info_container_layout.addWidget(self.network_info_label)
+        network_section.info_container_layout.addStretch(1)
+
+
+        network_chart = QChart()
+        network_chart.setBackgroundVisible(False)
+        #network_chart.legend().hide() # Легенда для сети остается видимой
+        # Увеличиваем нижний и левый отступ для осей X и Y на графике сети
+        network_chart.setMargins(QMargins(30, 0, 0, 10)) # Увеличено левый и нижний отступ
+        network_chart.layout().setContentsMargins(0, 0, 0, 0)
+
+
+        axis_x = QValueAxis()
+        axis_x.setRange(0, 60)
+        axis_x.setTickCount(7)
+        axis_x.setLabelFormat("%.0f")
+        axis_x.setTitleText("Seconds ago")
+        axis_x.setReverse(True) # Текущий момент (0) справа
+        self.history_axes.append(axis_x)
+        network_chart.addAxis(axis_x, Qt.AlignBottom)
+
+        axis_y = QValueAxis()
+        axis_y.setRange(0, 5) # Начальный диапазон для скорости сети в Mbps
+        # Изменяем текст заголовка оси Y
+        axis_y.setTitleText("Mbps") # Изменено с "Speed (Mbps)"
+        network_chart.addAxis(axis_y, Qt.AlignLeft)
+
+        self.network_sent_series = QLineSeries()
+        self.network_received_series = QLineSeries()
+        self.network_sent_series.setName("Отправка")
+        self.network_received_series.setName("Получение")
+
+        # Устанавливаем толщину линий для графика сети
+        pen_sent = QPen(QColor(0, 0, 255)) # Синий для отправки
+        pen_sent.setWidth(2)
+        self.network_sent_series.setPen(pen_sent)
+
+        pen_recv = QPen(QColor(255, 165, 0)) # Оранжевый для получения
+        pen_recv.setWidth(2)
+        self.network_received_series.setPen(pen_recv)
+
+
+        network_chart.addSeries(self.network_sent_series)
+        network_chart.addSeries(self.network_received_series)
+        self.network_sent_series.attachAxis(axis_x)
+        self.network_sent_series.attachAxis(axis_y)
+        self.network_received_series.attachAxis(axis_x)
+        self.network_received_series.attachAxis(axis_y)
+        network_chart.legend().setVisible(True)
+
+        network_chart_view = QChartView(network_chart)
+        network_chart_view.setFixedHeight(200) # Увеличено с 150 до 200
+        network_section.add_chart_view(network_chart_view)
+
+        layout.addWidget(network_section)
+
+        layout.addStretch(1)
+
+    def update_snapshot(self, snapshot: SystemSnapshot):
+        # Обновление единого графика ядер ЦП и меток процентов
+        cpu_per_core = snapshot.cpu_per_core
+        # Убедимся, что количество данных по ядрам соответствует количеству серий и меток
+        if len(cpu_per_core) == len(self.cpu_core_series) and len(cpu_per_core) == len(self.cpu_core_labels):
+            for i, core_usage in enumerate(cpu_per_core):
+                # Обновляем метку с процентом загрузки
+                self.cpu_core_labels[i].setText(f"ЦП {i + 1}: {core_usage:.1f}%")
+        # else:
+            # print("Warning: Mismatch in number of CPU cores, series, or labels.")
+
+
+        # Обновление информации о памяти
+        memory_info = snapshot.memory_info
+        memory_usage = snapshot.mem_percent
+        self.memory_meter.set_value(memory_usage)
+        self.memory_info_label.setText(
+            f"Использовано: {memory_info['used']:.1f} GB из {memory_info['total']:.1f} GB\n"
+            f"({memory_usage:.1f}%)\n"
+            f"Доступно: {memory_info['available']:.1f} GB\n"
+            f"Кэшировано: {memory_info['cached']:.1f} GB"
+
+        )
+
+        # Обновление информации о диске
+        disk_info = snapshot.disk_info
+        disk_usage_percent = disk_info['usage_percent']
+        self.disk_meter.set_value(disk_usage_percent)
+        self.disk_info_label.setText(
+            f"Свободно: {(100 - disk_usage_percent):.1f}%\n"
+            f"Скорость чтения: {disk_info['read_speed']:.1f} MB/s\n"
+            f"Скорость записи: {disk_info['write_speed']:.1f} MB/s"
+        )
+
+
+        # Обновление информации о сети
+        network_info = snapshot.network_info
+        # network_usage_percent = network_info['usage_percent'] # Использование метра для сети можно убрать
+        # self.network_meter.set_value(network_usage_percent) # Закомментировано
+        self.network_info_label.setText(
+            f"Всего отправлено: {network_info['sent']:.1f} MB\n"
+            f"Всего получено: {network_info['received']:.1f} MB\n"
+            f"Скорость отправки: {network_info['send_speed']:.1f} Mbps\n"
+            f"Скорость приема: {network_info['receive_speed']:.1f} Mbps"
+        )
+
+        # Графики строятся по истории SystemMonitor
+        self.update_charts()
+
+
+    def set_history_view(self, index):
+        """Переключает период истории; данные уже агрегированы, перерисовка мгновенная"""
+        self.history_view = HISTORY_VIEWS[index]
+        _, span, unit, title = self.history_view
+        for axis_x in self.history_axes:
+            axis_x.setRange(0, span / unit)
+            axis_x.setTitleText(title)
+        self.update_charts()
+
+    def update_charts(self):
+        """Перерисовывает все графики по истории за выбранный период"""
+        for i, series in enumerate(self.cpu_core_series):
+            self.update_chart_series(series, f'cpu_core_{i}')
+
+        self.update_chart_series(self.memory_series, 'memory')
+
+        # Диск и сеть работают всплесками: на длинных периодах рисуем максимумы интервалов
+        disk_max = max(self.update_chart_series(self.disk_read_series, 'disk_read', peaks=True),
+                       self.update_chart_series(self.disk_write_series, 'disk_write', peaks=True))
+        # Динамическое масштабирование для диска
+        self.disk_read_series.chart().axes(Qt.Vertical)[0].setRange(0, max(50.0, disk_max * 1.2))
+
+        network_max = max(self.update_chart_series(self.network_sent_series, 'net_sent', peaks=True),
+                          self.update_chart_series(self.network_received_series, 'net_received', peaks=True))
+        # Динамическое масштабирование для сети
+        self.network_sent_series.chart().axes(Qt.Vertical)[0].setRange(0, max(5.0, network_max * 1.2))
+
+    def update_chart_series(self, series: QLineSeries, metric: str, peaks: bool = False) -> float:
+        """
+        Заменяет точки серии окном истории метрики одним вызовом replace().
+        peaks - рисовать максимумы агрегированных интервалов вместо средних.
+
+        Returns:
+            float: Максимум метрики за окно (для масштабирования оси Y)
+        """
+        _, span, unit, _ = self.history_view
+        window = self.history.window(metric, span)
+        xs, ys = window.seconds_ago / unit, window.peaks if peaks else window.values
+
+        # Больше точек, чем пикселей по ширине графика, рисовать бессмысленно
+        max_points = max(int(series.chart().plotArea().width()), MIN_CHART_POINTS)
+        if len(ys) > max_points:
+            xs, ys = lttb(xs, ys, max_points)
+
+        set_series_values(series, ys, xs)
+        return window.maximum
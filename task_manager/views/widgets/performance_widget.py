@@ -8,9 +8,26 @@ from PyQt5.QtGui import QColor, QPainter, QPen
 # Импортируем классы для графиков
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis # Убедитесь, что QValueAxis импортирован здесь, т.к. он используется в CoreUsageWidget
 
+from models.ring_buffer import RingBuffer
+
 # Импортируем наш логгер
 from utils.loggerService.logger import logger
 
+# Количество точек истории, отображаемых на графиках
+HISTORY_POINTS = 60
+
+
+def set_series_values(series: QLineSeries, values, xs=None):
+    """
+    Заменяет все точки серии одним вызовом replace().
+    Без xs последнее значение ставится у правого края окна из HISTORY_POINTS точек.
+    """
+    if xs is None:
+        xs = range(HISTORY_POINTS - len(values), HISTORY_POINTS)
+    else:
+        xs = xs.tolist()
+    series.replace([QPointF(x, y) for x, y in zip(xs, values.tolist())])
+
 
 class ResourceMeter(QWidget):
     """
@@ -112,6 +129,8 @@ class CoreUsageWidget(QWidget):
         self.chart.addSeries(self.series) # Добавляем серию на график
         self.series.attachAxis(axis_x) # Привязываем серию к оси X
         self.series.attachAxis(axis_y) # Привязываем серию к оси Y
+        # История значений ядра
+        self.history = RingBuffer(HISTORY_POINTS)
 
         # Виджет для отображения графика
         self.chart_view = QChartView(self.chart)
@@ -135,21 +154,9 @@ class CoreUsageWidget(QWidget):
         self.update_chart(new_value=usage_percent)
 
     def update_chart(self, new_value):
-        """Добавляет новое значение на график и сдвигает старые точки."""
-        current_time = self.series.count()
-        self.series.append(current_time, new_value)
-
-        # Если точек на графике больше 60, удаляем самую старую
-        if self.series.count() > 60:
-            self.series.remove(0)
-            # Сдвигаем оставшиеся точки по оси X, чтобы график выглядел непрерывным
-            for i in range(self.series.count()):
-                point = self.series.pointsVector()[i]
-                self.series.replace(i, QPointF(i, point.y()))
-
-        # Обновляем диапазон оси X, чтобы он всегда показывал последние 60 секунд
-        axis_x = self.chart.axes(Qt.Horizontal)[0]
-        axis_x.setRange(max(0, self.series.count() - 60), max(60, self.series.count()))
+        """Добавляет новое значение в историю и перерисовывает график одним вызовом"""
+        self.history.push(new_value)
+        set_series_values(self.series, self.history.values())
 
 
 class PerformanceWidget(QFrame):
@@ -0,0 +1,139 @@
+import time
+
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QFormLayout, QLabel, QTabWidget, QListWidget
+
+from controllers.process_details import (ProcessDetailsService, SECTION_BASIC, SECTION_OPEN_FILES,
+                                         SECTION_CONNECTIONS, SECTION_MEMORY_MAPS, EXPENSIVE_SECTIONS)
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+# Заголовки вкладок дорогих разделов
+SECTION_TITLES = {
+    SECTION_OPEN_FILES: "Файлы",
+    SECTION_CONNECTIONS: "Соединения",
+    SECTION_MEMORY_MAPS: "Карты памяти",
+}
+
+# Поля сведений: ключ раздела SECTION_BASIC -> подпись
+BASIC_FIELDS = (
+    ('name', "Имя:"),
+    ('pid', "PID:"),
+    ('username', "Пользователь:"),
+    ('status', "Статус:"),
+    ('threads', "Потоки:"),
+    ('rss', "RSS:"),
+    ('create_time', "Запущен:"),
+    ('exe', "Путь:"),
+    ('cmdline', "Командная строка:"),
+)
+
+
+class ProcessDetailsPanel(QWidget):
+    """
+    Панель сведений о выбранном процессе.
+
+    Дешёвые поля показываются сразу, дорогие разделы заполняются
+    по мере прихода из ProcessDetailsService. Ответы по процессу,
+    который уже не выбран, отбрасываются.
+    """
+
+    def __init__(self, service: ProcessDetailsService, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация ProcessDetailsPanel.")
+        self.service = service
+        self.service.section_ready.connect(self.on_section_ready)
+        self._pid = None
+        self._key = None
+        self.field_labels = {}
+        self.section_lists = {}
+        self.setup_ui()
+        logger.info("ProcessDetailsPanel инициализирована.")
+
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        form = QFormLayout()
+        for field, title in BASIC_FIELDS:
+            label = QLabel("-")
+            label.setWordWrap(True)
+            self.field_labels[field] = label
+            form.addRow(title, label)
+        layout.addLayout(form, 1)
+
+        self.sections_tabs = QTabWidget()
+        for section in EXPENSIVE_SECTIONS:
+            section_list = QListWidget()
+            section_list.setUniformItemSizes(True)
+            self.section_lists[section] = section_list
+            self.sections_tabs.addTab(section_list, SECTION_TITLES[section])
+        layout.addWidget(self.sections_tabs, 1)
+
+    def show_process(self, pid: int):
+        """Показывает сведения о процессе; pid <= 0 очищает панель"""
+        if pid == self._pid:
+            return
+        self._pid = pid
+        if pid <= 0:
+            self.service.cancel()
+            self._key = None
+            self._fill_basic({})
+            for section in EXPENSIVE_SECTIONS:
+                self._fill_section(section, {'items': [], 'total': 0})
+            return
+
+        self._key, sections = self.service.request(pid)
+        self._fill_basic(sections[SECTION_BASIC])
+        for section in EXPENSIVE_SECTIONS:
+            if section in sections:
+                self._fill_section(section, sections[section])
+            elif self._key is not None:
+                self._set_loading(section)
+            else:
+                self._fill_section(section, sections[SECTION_BASIC])
+
+    def on_section_ready(self, key, section, value):
+        if key != self._key:
+            return
+        self._fill_section(section, value)
+
+    def _fill_basic(self, info):
+        if 'error' in info:
+            info = {'name': info['error']}
+        values = dict(info)
+        memory_info = info.get('memory_info')
+        values['rss'] = f"{memory_info['rss'] / (1024 * 1024):.1f} MB" if memory_info else None
+        if info.get('create_time'):
+            values['create_time'] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(info['create_time']))
+        for field, label in self.field_labels.items():
+            value = values.get(field)
+            label.setText(str(value) if value not in (None, '') else "-")
+
+    def _set_loading(self, section):
+        section_list = self.section_lists[section]
+        section_list.clear()
+        section_list.addItem("Загрузка...")
+        self._set_title(section, "…")
+
+    def _fill_section(self, section, value):
+        section_list = self.section_lists[section]
+        section_list.clear()
+        if 'error' in value:
+            section_list.addItem(value['error'])
+            self._set_title(section, "-")
+            return
+        if section == SECTION_CONNECTIONS:
+            lines = [f"{local} → {remote or '*'} {status}" for local, remote, status in value['items']]
+        elif section == SECTION_MEMORY_MAPS:
+            lines = [f"{rss / 1024:.0f} KB  {path or '[anon]'}" for path, rss in value['items']]
+        else:
+            lines = value['items']
+        section_list.addItems(lines)
+        if value['total'] > len(lines):
+            section_list.addItem(f"... и ещё {value['total'] - len(lines)}")
+        self._set_title(section, str(value['total']))
+
+    def _set_title(self, section, count):
+        index = self.sections_tabs.indexOf(self.section_lists[section])
+        self.sections_tabs.setTabText(index, f"{SECTION_TITLES[section]} ({count})")
@@ -1,73 +1,94 @@
-from PyQt5.QtWidgets import QTableView, QHeaderView, QMenu, QMessageBox
-from PyQt5.QtCore import Qt
+from contextlib import contextmanager
 
-# Импортируем наш логгер
-from utils.loggerService.logger import logger
-
-
-class ProcessTableView(QTableView):
-    """Кастомное представление таблицы процессов с контекстным меню"""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        logger.info("Инициализация ProcessTableView.")
-        self._process_controller = None
-        self.setup_ui()
-        logger.info("ProcessTableView инициализирована.")
+from PyQt5.QtWidgets import QTableView, QHeaderView, QMenu, QMessageBox, QAbstractItemView
+from PyQt5.QtCore import Qt, pyqtSignal
 
+from controllers.process_controller import (STOP_TERMINATED, STOP_KILLED, STOP_GONE, STOP_DENIED,
+                                            STOP_SURVIVED, STOP_ERROR, TERMINATE_TIMEOUT)
+from controllers.process_stopper import ProcessStopService
+from models.process_model import COL_PID, SORT_ROLE, CREATE_TIME_ROLE
 
-    def setup_ui(self):
-        logger.debug("Настройка UI ProcessTableView.")
-        self.setup_basic_ui()
-        self.setup_context_menu()
-        logger.debug("UI ProcessTableView настроена.")
-
-
-    def setup_basic_ui(self):
-        """Базовая настройка таблицы"""
-        logger.debug("Настройка базового UI ProcessTableView.")
-        self.verticalHeader().setVisible(False)
-        self.setSortingEnabled(True)
-        self.setContextMenuPolicy(Qt.CustomContextMenu)
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Interactive)
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        # Настройка ширины колонок
-
-        self.setColumnWidth(0, 30)
-        self.setColumnWidth(2, 80)
-        self.setColumnWidth(3, 80)
-        self.setColumnWidth(4, 80)
-        self.setColumnWidth(5, 100)
-        self.setColumnWidth(6, 150)
-        logger.debug("Базовый UI ProcessTableView настроен.")
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
 
+# Подписи исходов завершения процессов
+STOP_RESULT_TITLES = {
+    STOP_TERMINATED: "завершён",
+    STOP_KILLED: "завершён по SIGKILL",
+    STOP_GONE: "уже не существовал",
+    STOP_DENIED: "нет доступа",
+    STOP_SURVIVED: "не завершился",
+    STOP_ERROR: "ошибка",
+}
+
+
+def summarize_outcomes(outcomes) -> str:
+    """Краткая сводка: число процессов по каждому исходу"""
+    if not outcomes:
+        return "Нет процессов для завершения"
+    counts = {}
+    for outcome in outcomes:
+        counts[outcome.result] = counts.get(outcome.result, 0) + 1
+    return "\n".join(f"{STOP_RESULT_TITLES.get(result, result).capitalize()}: {count}"
+                     for result, count in counts.items())
+
+
+class ProcessActionsMixin:
+    """
+    Контекстное меню завершения процессов и сигнал выбора процесса,
+    общие для таблицы и дерева процессов. Класс-наследник задаёт
+    pid_column и сигнал process_selected.
+    """
+    pid_column = COL_PID
 
     def setup_context_menu(self):
         """Настройка контекстного меню"""
-        logger.debug("Настройка контекстного меню ProcessTableView.")
+        logger.debug(f"Настройка контекстного меню {type(self).__name__}.")
         self._context_menu = QMenu(self)
 
         end_action = self._context_menu.addAction("Завершить процесс")
         end_action.triggered.connect(self._terminate_selected_process)
 
+        tree_action = self._context_menu.addAction("Завершить дерево процессов")
+        tree_action.triggered.connect(self._terminate_selected_tree)
+
         kill_action = self._context_menu.addAction("Принудительно завершить")
         kill_action.triggered.connect(self._kill_selected_process)
 
         self.customContextMenuRequested.connect(self._show_context_menu)
-        logger.debug("Контекстное меню ProcessTableView настроено.")
+        logger.debug(f"Контекстное меню {type(self).__name__} настроено.")
 
 
     def set_process_controller(self, controller):
         """Устанавливает контроллер процессов"""
-        logger.debug("Установка контроллера процессов в ProcessTableView.")
+        logger.debug(f"Установка контроллера процессов в {type(self).__name__}.")
         if controller is None:
             logger.error("Попытка установить None в качестве контроллера процессов.")
             raise ValueError("Process controller cannot be None")
         self._process_controller = controller
+        self._stop_service = ProcessStopService(controller)
+        self._stop_service.finished.connect(self._show_stop_summary)
         logger.debug("Контроллер процессов установлен.")
 
 
+    @contextmanager
+    def preserved_scroll_position(self):
+        """Сохраняет положение прокрутки на время пакетного обновления модели"""
+        vertical = self.verticalScrollBar().value()
+        horizontal = self.horizontalScrollBar().value()
+        try:
+            yield
+        finally:
+            self.verticalScrollBar().setValue(vertical)
+            self.horizontalScrollBar().setValue(horizontal)
+
+
+    def currentChanged(self, current, previous):
+        super().currentChanged(current, previous)
+        pid = current.siblingAtColumn(self.pid_column).data(SORT_ROLE) if current.isValid() else None
+        self.process_selected.emit(pid if pid is not None else -1)
+
+
     def _show_context_menu(self, pos):
         """Показывает контекстное меню"""
         logger.debug(f"Запрос контекстного меню в позиции {pos.x()}, {pos.y()}.")
@@ -76,67 +97,142 @@ class ProcessTableView(QTableView):
             logger.debug("Контекстное меню показано.")
 
 
-    def _get_selected_pid(self):
-        """Возвращает PID выбранного процесса"""
-        selected = self.selectedIndexes()
-        if not selected:
-            logger.warning("Попытка получить PID выбранного процесса, но ни один процесс не выбран.")
-            return -1
-
-        # Получаем PID из колонки 2 выбранной строки
-        pid_index = selected[0].siblingAtColumn(2)
-        if not pid_index.isValid():
-            logger.warning("Недействительный индекс PID выбранного процесса.")
-            return -1
-
-        try:
-            pid = int(pid_index.data())
-            logger.debug(f"Получен PID выбранного процесса: {pid}")
-            return pid
-        except (ValueError, TypeError) as e:
-            logger.error(f"Ошибка при преобразовании PID выбранного процесса в число: {e}")
-            return -1
-
-    def _terminate_selected_process(self):
-        """Завершает выбранный процесс"""
-        pid = self._get_selected_pid()
-        if pid <= 0:
-            # Логгирование ошибки уже происходит в _get_selected_pid
+    def _get_selected_targets(self):
+        """Возвращает (pid, create_time) всех выделенных процессов"""
+        targets = []
+        for index in self.selectionModel().selectedRows(self.pid_column):
+            try:
+                pid = int(index.data(SORT_ROLE))
+            except (ValueError, TypeError) as e:
+                logger.error(f"Ошибка при преобразовании PID выбранного процесса в число: {e}")
+                continue
+            if pid > 0:
+                targets.append((pid, index.data(CREATE_TIME_ROLE)))
+        return targets
+
+    def _checked_targets(self):
+        """Выделенные процессы или None (с сообщением), если завершать нечего или нечем"""
+        targets = self._get_selected_targets()
+        if not targets:
+            logger.warning("Попытка завершить процессы, но ни один процесс не выбран.")
             QMessageBox.warning(self, "Ошибка", "Не удалось получить PID процесса")
-            return
+            return None
 
-        if not self._process_controller:
+        if not self._process_controller or not self._stop_service:
             logger.critical("Контроллер процессов не инициализирован при попытке завершить процесс.")
             QMessageBox.critical(self, "Ошибка", "Контроллер процессов не инициализирован")
+            return None
+        return targets
+
+    def _signal_process(self, target, force=False):
+        """Один процесс: только SIGTERM (или SIGKILL), без ожидания и эскалации"""
+        pid, create_time = target
+        if force:
+            logger.warning(f"Попытка принудительно завершить процесс с PID: {pid} из контекстного меню.")
+            success, message = self._process_controller.kill_process(pid, create_time)
+        else:
+            logger.info(f"Попытка завершить процесс с PID: {pid} из контекстного меню.")
+            success, message = self._process_controller.terminate_process(pid, create_time)
+        if success:
+            QMessageBox.information(self, "Результат", message)
+        else:
+            logger.error(f"Не удалось завершить процесс PID {pid}: {message}")
+            QMessageBox.warning(self, "Ошибка", message)
+
+    def _stop_selected(self, description, targets, include_children=False, force=False):
+        """Завершает процессы в фоне после подтверждения; итог придёт в _show_stop_summary"""
+        target = f"{len(targets)} процессов" + (" и всех их потомков" if include_children else "")
+        question = f"{description}: {target}?"
+        if not force:
+            question += (f"\nПроцессы, не завершившиеся за {TERMINATE_TIMEOUT:g} с после SIGTERM, "
+                         f"будут завершены принудительно (SIGKILL).")
+        if QMessageBox.question(self, "Подтверждение", question) != QMessageBox.Yes:
             return
+        self._stop_service.stop(description, targets, include_children=include_children, force=force)
 
-        logger.info(f"Попытка завершить процесс с PID: {pid} из контекстного меню.")
-        try:
-            success, message = self._process_controller.terminate_process(pid)
-            # Логгирование успеха/ошибки происходит внутри terminate_process
-            QMessageBox.information(self, "Результат", message)
-        except Exception as e:
-            logger.error(f"Неожиданная ошибка при вызове terminate_process для PID {pid}: {str(e)}")
-            QMessageBox.critical(self, "Ошибка", f"Ошибка завершения процесса: {str(e)}")
+    def _terminate_selected_process(self):
+        """Завершает выбранный процесс (SIGTERM); несколько выбранных - с эскалацией до SIGKILL"""
+        targets = self._checked_targets()
+        if targets is None:
+            return
+        if len(targets) == 1:
+            self._signal_process(targets[0])
+        else:
+            self._stop_selected("Завершение процессов", targets)
+
+    def _terminate_selected_tree(self):
+        """Завершает выбранные процессы вместе со всеми потомками"""
+        targets = self._checked_targets()
+        if targets is not None:
+            self._stop_selected("Завершение дерева процессов", targets, include_children=True)
 
     def _kill_selected_process(self):
-        """Принудительно завершает процесс"""
-        pid = self._get_selected_pid()
-        if pid <= 0:
-            # Логгирование ошибки уже происходит в _get_selected_pid
-            QMessageBox.warning(self, "Ошибка", "Не удалось получить PID процесса")
+        """Принудительно завершает выбранные процессы (сразу SIGKILL)"""
+        targets = self._checked_targets()
+        if targets is None:
             return
+        if len(targets) == 1:
+            self._signal_process(targets[0], force=True)
+        else:
+            self._stop_selected("Принудительное завершение", targets, force=True)
+
+    def shutdown(self):
+        """Снимает с очереди ещё не начатые завершения при закрытии окна"""
+        if self._stop_service:
+            self._stop_service.shutdown()
+
+    def _show_stop_summary(self, description, outcomes):
+        """Показывает итог массового завершения по каждому PID"""
+        box = QMessageBox(QMessageBox.Information, "Результат", f"{description}\n{summarize_outcomes(outcomes)}",
+                          QMessageBox.Ok, self)
+        box.setDetailedText("\n".join(
+            f"{o.pid} {o.name}: {STOP_RESULT_TITLES.get(o.result, o.result)}" + (f" ({o.message})" if o.message else "")
+            for o in sorted(outcomes)))
+        box.setModal(False)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.show()
+
+
+class ProcessTableView(ProcessActionsMixin, QTableView):
+    """Кастомное представление таблицы процессов с контекстным меню"""
+    # PID текущего процесса при смене выбора (-1, если ничего не выбрано)
+    process_selected = pyqtSignal(int)
 
-        if not self._process_controller:
-            logger.critical("Контроллер процессов не инициализирован при попытке принудительно завершить процесс.")
-            QMessageBox.critical(self, "Ошибка", "Контроллер процессов не инициализирован")
-            return
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация ProcessTableView.")
+        self._process_controller = None
+        self._stop_service = None
+        self._context_menu = None
+        self.setup_ui()
+        logger.info("ProcessTableView инициализирована.")
 
-        logger.warning(f"Попытка принудительно завершить процесс с PID: {pid} из контекстного меню.")
-        try:
-            success, message = self._process_controller.kill_process(pid)
-            # Логгирование успеха/ошибки происходит внутри kill_process
-            QMessageBox.information(self, "Результат", message)
-        except Exception as e:
-            logger.error(f"Неожиданная ошибка при вызове kill_process для PID {pid}: {str(e)}")
-            QMessageBox.critical(self, "Ошибка", f"Ошибка принудительного завершения: {str(e)}")
\ No newline at end of file
+
+    def setup_ui(self):
+        logger.debug("Настройка UI ProcessTableView.")
+        self.setup_basic_ui()
+        self.setup_context_menu()
+        logger.debug("UI ProcessTableView настроена.")
+
+
+    def setup_basic_ui(self):
+        """Базовая настройка таблицы"""
+        logger.debug("Настройка базового UI ProcessTableView.")
+        self.verticalHeader().setVisible(False)
+        self.setSortingEnabled(True)
+        # Выделяются строки целиком, можно выбрать несколько процессов
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        # Настройка ширины колонок
+
+        self.setColumnWidth(0, 30)
+        self.setColumnWidth(2, 80)
+        self.setColumnWidth(3, 80)
+        self.setColumnWidth(4, 80)
+        self.setColumnWidth(5, 100)
+        self.setColumnWidth(6, 150)
+        logger.debug("Базовый UI ProcessTableView настроен.")
@@ -0,0 +1,38 @@
+from PyQt5.QtWidgets import QTreeView, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from models.process_tree_model import TREE_COL_NAME, TREE_COL_PID, TREE_COL_TREE_CPU
+from views.widgets.process_table import ProcessActionsMixin
+
+# Импортируем наш логгер
+from utils.loggerService.logger import logger
+
+
+class ProcessTreeView(ProcessActionsMixin, QTreeView):
+    """Дерево процессов (по связям ppid) с тем же контекстным меню, что у таблицы"""
+    # PID текущего процесса при смене выбора (-1, если ничего не выбрано)
+    process_selected = pyqtSignal(int)
+    pid_column = TREE_COL_PID
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация ProcessTreeView.")
+        self._process_controller = None
+        self._stop_service = None
+        self._context_menu = None
+        self.setup_ui()
+        logger.info("ProcessTreeView инициализировано.")
+
+    def setup_ui(self):
+        # Все строки одной высоты: дерево не измеряет каждую строку при раскрытии
+        self.setUniformRowHeights(True)
+        self.setSortingEnabled(True)
+        self.sortByColumn(TREE_COL_TREE_CPU, Qt.DescendingOrder)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        header = self.header()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        self.setColumnWidth(TREE_COL_NAME, 250)
+        self.setup_context_menu()